@@ -2,29 +2,157 @@
 API class exposed to frontend via pywebview
 """
 import base64
+import csv
+import functools
+import io
 import json
 import math
+import mimetypes
+import mmap
+import operator
+import os
+import queue
 import random
+import re
+import shutil
 import string
+import subprocess
 import sys
+import time
 import uuid
+import wave
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from threading import Semaphore
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, List, Dict
+from typing import Any, Callable, Optional, List, Dict
 
 import webview
 from loguru import logger
 
 from services.project_manager import ProjectManager
-from tasks import TaskManager
+from tasks import TaskManager, TaskStatus
 from tasks.executor import ImageExecutor, VideoExecutor, AudioExecutor
 
 import numpy as np
 from audiotsm import wsola
 from audiotsm.io.array import ArrayReader, ArrayWriter
+from pydub import AudioSegment
+
+# pycapcut 仅剪映草稿导出使用，缺失时导出接口返回错误
+try:
+    import pycapcut as cc
+    from pycapcut import trange
+except ImportError:
+    cc = None
+    trange = None
+
+# Platform-specific file manager commands, resolved once at import
+if sys.platform == "darwin":
+    _OPEN_CMD = ("open",)
+    _REVEAL_CMD = ("open", "-R")  # -R reveals and selects the file in Finder
+elif sys.platform == "win32":
+    _OPEN_CMD = ("explorer",)
+    _REVEAL_CMD = ("explorer", "/select,")  # /select selects the file in Explorer
+else:
+    _OPEN_CMD = ("xdg-open",)
+    _REVEAL_CMD = None  # Linux: just open the parent directory
+
+# 成片导出可用的硬件 H.264 编码器（按优先级），均不可用时回退到 libx264
+if sys.platform == "darwin":
+    _HW_VIDEO_ENCODERS = (
+        ("h264_videotoolbox", ("-c:v", "h264_videotoolbox", "-q:v", "55")),
+    )
+else:
+    _HW_VIDEO_ENCODERS = (
+        ("h264_nvenc", ("-c:v", "h264_nvenc", "-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "19", "-b:v", "0")),
+        ("h264_qsv", ("-c:v", "h264_qsv", "-preset", "medium", "-global_quality", "19")),
+        ("h264_amf", ("-c:v", "h264_amf", "-quality", "quality", "-rc", "cqp", "-qp_i", "19", "-qp_p", "19")),
+    )
+
+# 内置预设参考音频根目录（preset:relative_path 相对于此目录）
+# 开发模式使用本地 assets 目录，PyInstaller 打包后使用解包目录
+_PRESET_AUDIO_ROOT = (
+    Path(sys._MEIPASS) if getattr(sys, "frozen", False) else Path(__file__).parent
+) / "assets" / "audios"
+_PRESET_AUDIO_CSV = _PRESET_AUDIO_ROOT / "audios.csv"
+
+# 风格预设（assets/styles/styles.json 及其预览图）
+_STYLES_DIR = Path(__file__).parent / "assets" / "styles"
+_STYLES_FILE = _STYLES_DIR / "styles.json"
+
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a", ".flac", ".aac", ".ogg", ".wma")
+_AUDIO_MIME = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".flac": "audio/flac",
+    ".aac": "audio/aac",
+    ".ogg": "audio/ogg",
+    ".wma": "audio/x-ms-wma",
+}
+SCAN_PUSH_BATCH = 1000  # 参考音频扫描时每累计多少条推送一次给前端
+
+# 根据角色名推断性别的关键词（女性关键词优先匹配）
+_FEMALE_NAME_KEYWORDS = ("女", "娘", "姐", "妈", "母", "婆", "妹", "姑", "婶", "嫂", "她", "公主", "王后", "女王", "夫人", "小姐")
+_MALE_NAME_KEYWORDS = ("男", "哥", "弟", "爸", "父", "爷", "叔", "伯", "他", "王子", "国王", "先生", "大叔", "少爷")
+_FEMALE_NAME_RE = re.compile("|".join(map(re.escape, _FEMALE_NAME_KEYWORDS)))
+_MALE_NAME_RE = re.compile("|".join(map(re.escape, _MALE_NAME_KEYWORDS)))
+URL_PATH_CACHE_LIMIT = 8192  # _url_to_path 缓存条目上限，超出后整体清空
+AUDIO_DATA_CACHE_LIMIT = 64 * 1024 * 1024  # 音频 base64 内存缓存上限（按编码后字符数计）
+WORK_INFO_CHAT_HISTORY_LIMIT = 12  # 作品信息对话只回放最近的消息条数（约 6 轮）
+EXPORT_PROGRESS_INTERVAL = 0.2  # ffmpeg 编码进度推送给前端的最小间隔（秒）
+FFMPEG_LOG_TAIL_BYTES = 4096  # ffmpeg 失败时从日志末尾读取的错误信息长度
+EXPORT_TMPFS_MIN_FREE = 4 * 1024 * 1024 * 1024  # 成片导出使用 /dev/shm 作为临时目录所需的最小剩余空间
+MEDIA_PROBE_BATCH_SIZE = 64  # 单个 ffmpeg 进程一次读取时长的最多文件数（受命令行长度限制）
+DEFAULT_COVER_PROMPT = "Generate a cinematic movie poster with dramatic lighting"  # 作品信息与风格均为空时的封面提示词
+
+
+# 作品信息对话的系统提示词（固定不变，当前作品信息在消息中单独给出）
+_WORK_INFO_CHAT_SYSTEM_PROMPT = """你是一个视频创作助手，帮助用户优化作品名和作品介绍。
+
+每轮对话中，用户的要求之前会附上当前作品信息（作品名、作品介绍）。
+
+用户可能会要求你:
+1. 优化作品名（更有吸引力、更诗意、更简洁等）
+2. 修改作品介绍（更详细、更简洁、换个角度等）
+3. 同时修改两者
+
+请根据用户的要求进行修改，并以 JSON 格式返回更新后的信息:
+{"title": "新作品名", "description": "新作品介绍", "reply": "你的回复说明"}
+
+如果用户只是在聊天没有要求修改，reply字段回复即可，title和description保持原值。
+只返回 JSON，不要其他内容。"""
+
+
+def _scan_audio_dir(directory: str, prefix_len: int) -> tuple[list, list]:
+    """
+    扫描单个目录（不递归），返回 (音频文件列表, 子目录列表)
+    Args:
+        directory: 目录路径
+        prefix_len: 根目录前缀长度，用于截取相对路径
+    """
+    audios = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir():
+                    # Same as os.walk: don't descend into symlinked dirs
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+                if entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                    audios.append({
+                        "path": entry.path,
+                        "name": entry.name,
+                        "relativePath": entry.path[prefix_len:],
+                    })
+    except OSError as e:
+        logger.warning(f"Failed to scan directory {directory}: {e}")
+    return audios, subdirs
 
 
 def change_audio_speed(audio, speed: float):
@@ -39,26 +167,310 @@ def change_audio_speed(audio, speed: float):
     if speed == 1.0:
         return audio
 
-    # 转换为 numpy 数组
-    samples = np.array(audio.get_array_of_samples())
-    if audio.channels == 2:
-        samples = samples.reshape((-1, 2)).T
-    else:
-        samples = samples.reshape((1, -1))
+    # 统一为 16bit PCM，直接零拷贝映射原始字节为 numpy 数组
+    if audio.sample_width != 2:
+        audio = audio.set_sample_width(2)
+    channels = audio.channels
+    samples = np.frombuffer(audio.raw_data, dtype=np.int16).reshape((-1, channels)).T
+
+    # WSOLA 时域拉伸（向量化归一化，避免逐样本 Python 转换）
+    reader = ArrayReader(samples.astype(np.float32) * (1.0 / 32768.0))
+    writer = ArrayWriter(channels=channels)
+    wsola(channels=channels, speed=speed).run(reader, writer)
+
+    # 转回 AudioSegment（裁剪防止溢出回绕，按帧交错输出）
+    output = np.clip(writer.data * 32768.0, -32768, 32767).astype(np.int16)
+    return audio._spawn(output.T.tobytes())
+
+
+def sync_audio_segments(segments: list) -> list:
+    """
+    将多个音频片段对齐为同一格式（与 pydub 拼接规则一致：取最大采样率/声道数/位宽）
+    Args:
+        segments: pydub AudioSegment 列表（至少一个）
+    Returns:
+        对齐后的 AudioSegment 列表（格式已一致的片段原样返回）
+    """
+    frame_rate = max(seg.frame_rate for seg in segments)
+    channels = max(seg.channels for seg in segments)
+    sample_width = max(seg.sample_width for seg in segments)
+    return [
+        seg.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(sample_width)
+        for seg in segments
+    ]
+
+
+def write_wav(segments: list, path) -> None:
+    """
+    按顺序把多个音频片段写成一个 PCM WAV，不经过 pydub 拼接/export
+    各片段的 PCM 直接写入文件，不在内存中构造拼接后的完整缓冲区
+    Args:
+        segments: pydub AudioSegment 列表（至少一个）
+        path: 输出文件路径
+    """
+    synced = sync_audio_segments(segments)
+    first = synced[0]
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(first.channels)
+        w.setsampwidth(first.sample_width)
+        w.setframerate(first.frame_rate)
+        for seg in synced:
+            w.writeframes(seg.raw_data)
+
+
+def _read_wav_params(path: str) -> Optional[tuple]:
+    """读取 PCM WAV 文件头 (channels, sample_width, frame_rate)，非 PCM WAV 或其他格式返回 None"""
+    try:
+        with wave.open(path, "rb") as r:
+            return r.getnchannels(), r.getsampwidth(), r.getframerate()
+    except (wave.Error, EOFError, OSError):
+        return None
 
-    # WSOLA 时域拉伸
-    reader = ArrayReader(samples.astype(np.float32) / 32768.0)
-    writer = ArrayWriter(channels=audio.channels)
-    wsola(channels=audio.channels, speed=speed).run(reader, writer)
 
-    # 转回 AudioSegment
-    output = (writer.data * 32768).astype(np.int16)
-    if audio.channels == 2:
-        output = output.T.flatten()
+def write_wav_files(paths: list, path) -> None:
+    """
+    按顺序把多个音频文件拼接写成一个 PCM WAV，逐个文件流式写入，峰值内存只有单个文件
+    格式一致的 PCM WAV 直接按块拷贝帧数据；其余情况逐个解码后按最大采样率/声道数/位宽对齐
+    先写临时文件再 os.replace，失败时不会留下半截的目标文件
+    Args:
+        paths: 音频文件路径列表（至少一个）
+        path: 输出文件路径
+    """
+    params = [_read_wav_params(p) for p in paths]
+    if all(params):
+        channels = max(p[0] for p in params)
+        sample_width = max(p[1] for p in params)
+        frame_rate = max(p[2] for p in params)
     else:
-        output = output.flatten()
+        # 非 WAV 输入需解码后才能得知格式
+        channels = sample_width = frame_rate = 0
+        for p in paths:
+            seg = AudioSegment.from_file(p)
+            channels = max(channels, seg.channels)
+            sample_width = max(sample_width, seg.sample_width)
+            frame_rate = max(frame_rate, seg.frame_rate)
+    target = (channels, sample_width, frame_rate)
+
+    tmp_path = Path(str(path) + ".part")
+    try:
+        with wave.open(str(tmp_path), "wb") as w:
+            w.setnchannels(channels)
+            w.setsampwidth(sample_width)
+            w.setframerate(frame_rate)
+            for p, header in zip(paths, params):
+                if header == target:
+                    with wave.open(p, "rb") as r:
+                        while frames := r.readframes(65536):
+                            w.writeframes(frames)
+                else:
+                    seg = AudioSegment.from_file(p)
+                    seg = seg.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(sample_width)
+                    w.writeframes(seg.raw_data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class _JsonObjectScanner:
+    """
+    增量定位流式文本中第一个完整的顶层 JSON 对象（跳过字符串字面量内的括号）
+    feed() 返回 True 后 start/end 即为该对象在累计文本中的切片区间
+    """
+
+    def __init__(self):
+        self.start = -1
+        self.end = -1
+        self._offset = 0  # 已喂入文本的总长度
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text: str) -> bool:
+        if self.end >= 0:
+            return True
+
+        i = 0
+        if self.start < 0:
+            i = text.find("{")
+            if i < 0:
+                self._offset += len(text)
+                return False
+            self.start = self._offset + i
+
+        depth, in_string, escape = self._depth, self._in_string, self._escape
+        for j in range(i, len(text)):
+            ch = text[j]
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    self.end = self._offset + j + 1
+                    break
+
+        self._depth, self._in_string, self._escape = depth, in_string, escape
+        self._offset += len(text)
+        return self.end >= 0
+
+
+# 可能为空白的行：只含 ASCII 空白和非 ASCII 字节（后者可能是全角空格 U+3000 等 Unicode 空白）
+_MAYBE_BLANK_LINE_RE = re.compile(rb"^[ \t\r\f\v\x80-\xff]*\n", re.M)
+
+
+def _is_blank_line(line: bytes) -> bool:
+    """与逐行 str.strip() 判断一致：纯 ASCII 行按字节判断，含非 ASCII 字节时解码后再判断"""
+    if line.isascii():
+        return not line.strip()
+    return not line.decode("utf-8", "ignore").strip()
+
+
+def _count_nonblank_lines(data: bytes, end: int) -> int:
+    """
+    统计 data[:end] 中以换行结尾的非空白行数，空白判定与逐行 str.strip() 一致
+    按字节计数换行，只有正则筛出的候选行才解码（JSONL 记录行以 { 开头，不会成为候选）
+    """
+    blank = sum(1 for m in _MAYBE_BLANK_LINE_RE.finditer(data, 0, end) if _is_blank_line(m.group()))
+    return data.count(b"\n", 0, end) - blank
+
+
+# ffmpeg 打开输入时打印的 "Input #N, ..." 及其下的 "  Duration: HH:MM:SS.xx"
+_FFMPEG_INPUT_RE = re.compile(r"^Input #(\d+),")
+_FFMPEG_DURATION_RE = re.compile(r"^\s+Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+
+
+def _parse_ffmpeg_input_durations(stderr: str) -> Dict[int, float]:
+    """从 ffmpeg 的输入信息中解析每个输入的时长（秒，精度 10ms），Duration 为 N/A 的输入不返回"""
+    durations = {}
+    index = None
+    for line in stderr.splitlines():
+        m = _FFMPEG_INPUT_RE.match(line)
+        if m:
+            index = int(m.group(1))
+            continue
+        m = _FFMPEG_DURATION_RE.match(line)
+        if m and index is not None and index not in durations:
+            hours, minutes, seconds = m.groups()
+            durations[index] = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    return durations
+
+
+def _coerce_float(value, default: Optional[float]) -> Optional[float]:
+    """把前端传来的数值（可能是字符串）转为 float，缺失或无法解析时返回默认值"""
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _norm_path(path: str) -> str:
+    """路径规范化（绝对路径 + 平台大小写规则），用于路径集合比较"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _existing_paths(paths) -> set:
+    """
+    批量检查文件是否存在：每个父目录只 scandir 一次，代替逐个 stat
+    Returns:
+        存在的目录项集合（_norm_path 规范化形式）
+    """
+    existing = set()
+    for directory in {os.path.dirname(_norm_path(p)) for p in paths}:
+        try:
+            with os.scandir(directory) as it:
+                existing.update(_norm_path(entry.path) for entry in it)
+        except OSError:
+            continue
+    return existing
+
+
+def _copy_file_fast(src, dst) -> None:
+    """
+    复制文件并保留元数据（同 shutil.copy2）
+    Linux 上优先 os.copy_file_range：在 Btrfs/XFS 等文件系统上可直接共享数据块（reflink），
+    其他情况由 shutil.copyfile 处理（内部已使用 sendfile / macOS fcopyfile）
+    """
+    try:
+        if os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    except FileNotFoundError:
+        pass  # dst does not exist yet
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+                copied = remaining <= 0
+        except OSError:
+            copied = False  # e.g. unsupported filesystem or cross-device on older kernels
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _format_ass_time(seconds: float) -> str:
+    """Format time as H:MM:SS.CC (centiseconds)"""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    centisecs = int((seconds % 1) * 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
+
+
+def _escape_ass_text(text: str) -> str:
+    """Escape ASS override characters and convert newlines to \\N"""
+    return text.replace("\\", "\\\\").replace("{", "\\{").replace("}", "\\}").replace("\n", "\\N")
+
+
+def _requires_task_manager(action: str):
+    """Guard a task API method: require a loaded project and turn exceptions into error responses"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not self._task_manager:
+                return {"success": False, "error": "No project loaded"}
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                logger.error(f"Failed to {action}: {e}")
+                return {"success": False, "error": str(e)}
+        return wrapper
+    return decorator
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """返回文本中第一个完整的顶层 JSON 对象子串（线性扫描，无回溯），找不到返回 None"""
+    scanner = _JsonObjectScanner()
+    if not scanner.feed(text):
+        return None
+    return text[scanner.start:scanner.end]
 
-    return audio._spawn(output.tobytes())
+
+def _parse_json_object(text: str):
+    """解析大模型返回的 JSON 对象：整段即为 JSON 时直接解析，否则再扫描提取第一个对象"""
+    try:
+        result = json.loads(text)
+        if isinstance(result, dict):
+            return result
+    except ValueError:
+        pass
+    json_text = _extract_json_object(text)
+    return json.loads(json_text if json_text is not None else text)
 
 
 class Api:
@@ -76,6 +488,8 @@ class Api:
 
         # Settings file is always in ~/.hetangai/settings.json
         self._settings_file = Path.home() / ".hetangai" / "settings.json"
+        self._settings_cache: Optional[tuple] = None  # ((mtime_ns, size), settings)
+        self._shot_builder_llm_cache: Optional[tuple] = None  # (settings dict, (api_url, api_key, model))
         self._ensure_settings_file()
 
         # Initialize project manager with work directory from settings
@@ -106,8 +520,41 @@ class Api:
         
         logger.info(f"Thread pool initialized: total_workers={total_max_workers}, TTS={tts_concurrency}, TTI={tti_concurrency}, TTV={ttv_concurrency}")
 
+        # Coalesced shot status/progress, export progress, task events and LLM output (flushed every ~50ms)
+        self._notify_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._notify_thread = threading.Thread(
+            target=self._notify_flush_loop,
+            daemon=True,
+            name="NotifyFlusher"
+        )
+        self._notify_thread.start()
+
+        # Background file copies (cover upload/export) so bridge calls return without waiting on disk I/O
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="file-io")
+
+        # LRU cache of base64-encoded audio files: key -> (base64_data, mime_type)
+        self._audio_data_cache: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        self._audio_data_cache_bytes = 0
+        self._audio_data_cache_lock = threading.Lock()
+        self._preset_audios_cache: Optional[tuple[int, list]] = None  # (csv mtime_ns, audios)
+        self._preset_library_prompt_cache: Optional[tuple[list, str, str]] = None  # (audios, narration_json, voiceover_json)
+
         # Shot builder task state
         self._shot_builder_task: Optional[dict] = None  # {"step": str, "running": bool, "error": str|None}
+        self._shot_builder_prompts_cache: Optional[tuple] = None  # (file stamps, prompts)
+        self._jsonl_count_cache: Dict[str, tuple] = {}  # path -> see _count_jsonl_records
+        self._media_duration_cache: Dict[tuple, float] = {}  # (path, mtime_ns, size) -> seconds
+        self._video_stream_info_cache: Dict[tuple, Optional[tuple]] = {}  # (path, mtime_ns, size) -> see _get_video_stream_info
+        self._ensured_dirs: set = set()  # directories already created by _ensure_dir
+        self._project_output_dir_cache: Optional[tuple] = None  # ((work_dir, project_name), output_dir, shots_dir_str)
+        self._url_to_path_cache: Dict[str, str] = {}  # file server URL (query stripped) -> local path
+        self._validated_ffmpeg: set = set()  # (path, mtime_ns, size) of ffmpeg binaries that passed -version
+        self._ffprobe_path_cache: Optional[tuple] = None  # ((ffmpeg_path, dir mtime_ns), ffprobe_path)
+        self._export_cancel_event = threading.Event()  # 成片导出取消信号，ffmpeg 等待循环中轮询
+        self._styles_cache: Optional[tuple] = None  # (styles.json mtime_ns, styles)
+        self._style_by_id: Dict[Any, dict] = {}
+        self._style_cover_prompt_by_id: Dict[Any, str] = {}
+        self._video_encoder_cache: Dict[str, Optional[tuple]] = {}  # ffmpeg path -> hardware encoder args (None = libx264)
 
         # Task system (initialized when project is opened)
         self._task_manager: Optional[TaskManager] = None
@@ -117,6 +564,10 @@ class Api:
         # Task monitor thread
         self._task_monitor_running = False
         self._task_monitor_thread: Optional[threading.Thread] = None
+        self._task_monitor_wake = threading.Event()  # 任务成功/失败时唤醒监控线程，无需等满轮询间隔
+
+        # Task state change subscribers (called from executor threads with the event dict)
+        self._task_event_subscribers: List[Callable[[dict], None]] = [self._wake_task_monitor]
 
         logger.info("API initialized")
 
@@ -131,6 +582,17 @@ class Api:
             return self.project_data.get('id', '')
         return ''
 
+    def _get_project_output_dirs(self) -> tuple:
+        """Get (output dir, shots output dir as str) of the current project, cached per work dir and project name"""
+        work_dir = self._project_manager.work_dir
+        key = (work_dir, self.project_name)
+        cached = self._project_output_dir_cache
+        if cached is None or cached[0] != key:
+            output_dir = work_dir / self.project_name / "output"
+            cached = (key, output_dir, str(output_dir / "shots"))
+            self._project_output_dir_cache = cached
+        return cached[1], cached[2]
+
     # ========== Task System Methods ==========
 
     def _start_task_executors(self):
@@ -168,7 +630,8 @@ class Api:
                     worker_id=f"image-{i}",
                     settings_file=settings_file,
                     config_key='tti',
-                    current_project_id_getter=self._get_project_id
+                    current_project_id_getter=self._get_project_id,
+                    task_event_callback=self._emit_task_event
                 )
                 thread = threading.Thread(
                     target=executor.run_loop,
@@ -188,7 +651,8 @@ class Api:
                     worker_id=f"video-{i}",
                     settings_file=settings_file,
                     config_key='ttv',
-                    current_project_id_getter=self._get_project_id
+                    current_project_id_getter=self._get_project_id,
+                    task_event_callback=self._emit_task_event
                 )
                 thread = threading.Thread(
                     target=executor.run_loop,
@@ -208,7 +672,8 @@ class Api:
                     worker_id=f"audio-{i}",
                     settings_file=settings_file,
                     config_key='tts',
-                    current_project_id_getter=self._get_project_id
+                    current_project_id_getter=self._get_project_id,
+                    task_event_callback=self._emit_task_event
                 )
                 thread = threading.Thread(
                     target=executor.run_loop,
@@ -362,7 +827,26 @@ class Api:
             except Exception as e:
                 logger.error(f"Task monitor error: {e}")
             
-            time.sleep(2)
+            # 任务结束事件会提前唤醒，否则每 2 秒兜底检查一次
+            self._task_monitor_wake.wait(2)
+            self._task_monitor_wake.clear()
+
+    def _emit_task_event(self, event: dict):
+        """Push a task state change to the frontend and notify Python-side subscribers"""
+        try:
+            self._notify_queue.put(("task", json.dumps(event, ensure_ascii=False, default=str)))
+        except Exception as e:
+            logger.warning(f"Failed to queue task event: {e}")
+        for subscriber in self._task_event_subscribers:
+            try:
+                subscriber(event)
+            except Exception as e:
+                logger.warning(f"Task event subscriber failed: {e}")
+
+    def _wake_task_monitor(self, event: dict):
+        """Wake the monitor loop as soon as a task reaches a terminal state"""
+        if event.get("status") in (TaskStatus.SUCCESS.value, TaskStatus.FAILED.value):
+            self._task_monitor_wake.set()
     
     def _check_executor_adjustment(self):
         """检查并调整执行器数量（在 monitor loop 中每2秒调用）"""
@@ -439,7 +923,8 @@ class Api:
             worker_id=f"{task_type}-{next_id}",
             settings_file=str(self._settings_file),
             config_key=config_key_map.get(task_type, task_type),
-            current_project_id_getter=self._get_project_id
+            current_project_id_getter=self._get_project_id,
+            task_event_callback=self._emit_task_event
         )
         
         # 启动线程
@@ -541,11 +1026,10 @@ class Api:
             shutil.copy2(result_local_path, target_path)
         
         # 重新扫描所有视频槽位
-        all_videos = []
-        for slot in range(1, 5):
-            slot_path = self._project_manager.get_shot_video_path(self.project_name, shot_id, slot)
-            if slot_path.exists():
-                all_videos.append(self._path_to_url(str(slot_path)))
+        all_videos = [
+            self._path_to_url(str(slot_path))
+            for slot_path in self._project_manager.list_shot_video_paths(self.project_name, shot_id)
+        ]
         
         shot["videos"] = all_videos
         shot["videoUrl"] = all_videos[0] if all_videos else ""
@@ -598,8 +1082,6 @@ class Api:
         
         # 所有对话都完成，合并音频
         try:
-            from pydub import AudioSegment
-            
             audio_segments = []
             for idx in range(total_dialogues):
                 path = dialogue_results.get(idx)
@@ -616,15 +1098,10 @@ class Api:
                 logger.warning(f"No audio segments to combine for shot {shot_id}")
                 return
             
-            # 合并
-            combined = audio_segments[0]
-            for segment in audio_segments[1:]:
-                combined += segment
-            
-            # 保存
+            # 合并保存（各片段 PCM 直接顺序写入 WAV，不构造拼接缓冲区）
             final_path = self._project_manager.get_shot_audio_path(self.project_name, shot_id)
             final_path.parent.mkdir(parents=True, exist_ok=True)
-            combined.export(str(final_path), format="wav")
+            write_wav(audio_segments, final_path)
             
             # 更新 shot
             shot["audioUrl"] = self._path_to_url(str(final_path))
@@ -749,6 +1226,26 @@ class Api:
             except Exception as e:
                 logger.debug(f"Failed to notify project update: {e}")
 
+    def _copy_file_in_background(self, src, dst, update_type: str, on_success: Callable[[], dict]) -> str:
+        """
+        Copy a file on the IO executor and report the result via projectUpdate
+        Success dispatches `update_type` with on_success() data, failure dispatches `{update_type}_error`
+        Returns:
+            operation id included in both events
+        """
+        op_id = uuid.uuid4().hex[:8]
+
+        def _done(future):
+            error = future.exception()
+            if error is None:
+                self._notify_project_update(update_type, {"operationId": op_id, **on_success()})
+            else:
+                logger.error(f"Failed to copy {src} -> {dst}: {error}")
+                self._notify_project_update(f"{update_type}_error", {"operationId": op_id, "error": str(error)})
+
+        self._io_executor.submit(_copy_file_fast, src, dst).add_done_callback(_done)
+        return op_id
+
     def _notify_character_update(self, character_id: str, character: dict):
         """通知前端角色数据更新"""
         if hasattr(self, '_window') and self._window:
@@ -804,12 +1301,18 @@ class Api:
             # Remove the HTTP URL prefix
             prefix = f"http://127.0.0.1:{self._file_server_port}/"
             if url.startswith(prefix):
+                cached = self._url_to_path_cache.get(url)
+                if cached is not None:
+                    return cached
                 path_str = url[len(prefix):]
                 # If it's a relative path, resolve it relative to cwd
                 path = Path(path_str)
                 if not path.is_absolute():
                     path = Path.cwd() / path
-                return str(path)
+                if len(self._url_to_path_cache) >= URL_PATH_CACHE_LIMIT:
+                    self._url_to_path_cache.clear()
+                self._url_to_path_cache[url] = result = str(path)
+                return result
             else:
                 # If URL doesn't match expected format, assume it's already a path
                 return url
@@ -831,8 +1334,12 @@ class Api:
         """Set window reference (called from main.py, not stored in __init__)"""
         self._window = window
 
-    def _ensure_settings_file(self):
-        """Ensure settings file exists with default values"""
+    def _ensure_settings_file(self) -> Optional[dict]:
+        """Ensure settings file exists with default values
+
+        Returns:
+            The default settings if the file was just created, otherwise None
+        """
         if not self._settings_file.exists():
             desktop = Path.home() / "Desktop"
             default_work_dir = str(desktop / "荷塘AI")
@@ -883,24 +1390,55 @@ class Api:
             self._settings_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self._settings_file, "w", encoding="utf-8") as f:
                 json.dump(default_settings, f, indent=2, ensure_ascii=False)
+            stat = self._settings_file.stat()
+            self._settings_cache = ((stat.st_mtime_ns, stat.st_size), default_settings)
             logger.info(f"Created default settings file: {self._settings_file}")
+            return default_settings
+        return None
 
     def _load_settings(self) -> dict:
-        """Load settings from file, migrating old format if needed"""
-        if self._settings_file.exists():
-            try:
-                with open(self._settings_file, "r", encoding="utf-8") as f:
-                    settings = json.load(f)
-                
-                # Migrate old config format to new format
-                if "apiMode" not in settings and "tts" in settings:
-                    settings = self._migrate_settings(settings)
-                
-                return settings
-            except Exception as e:
-                logger.error(f"Failed to load settings: {e}")
+        """Load settings from file, migrating old format if needed
+
+        The parsed dict is cached and only re-read when the file's
+        mtime/size changes. Callers must treat the result as read-only.
+        """
+        try:
+            stat = self._settings_file.stat()
+        except OSError:
+            return {}
+
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._settings_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        try:
+            with open(self._settings_file, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+            
+            # Migrate old config format to new format (rewrites the file, so re-stat)
+            if "apiMode" not in settings and "tts" in settings:
+                settings = self._migrate_settings(settings)
+                stat = self._settings_file.stat()
+                cache_key = (stat.st_mtime_ns, stat.st_size)
+            
+            self._settings_cache = (cache_key, settings)
+            return settings
+        except Exception as e:
+            logger.error(f"Failed to load settings: {e}")
         return {}
     
+    def _get_shot_builder_llm_config(self) -> tuple:
+        """Get (api_url, api_key, model) from the shotBuilder settings, memoized per loaded settings dict"""
+        settings = self._load_settings()
+        cached = self._shot_builder_llm_cache
+        if cached is not None and cached[0] is settings:
+            return cached[1]
+        cfg = settings.get("shotBuilder", {})
+        config = (cfg.get("apiUrl", ""), cfg.get("apiKey", ""), cfg.get("model", ""))
+        self._shot_builder_llm_cache = (settings, config)
+        return config
+
     def _migrate_settings(self, old_settings: dict) -> dict:
         """Migrate old settings format to new format with apiMode/hostedService/customApi"""
         logger.info("Migrating old settings format to new format")
@@ -1081,12 +1619,19 @@ class Api:
                 else:
                     target_path.write_text("", encoding="utf-8")
 
+    def _ensure_dir(self, path: Path) -> None:
+        """mkdir -p, skipped for directories already created/verified in this session"""
+        if path in self._ensured_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(path)
+
     def _get_shot_builder_output_dir(self) -> Path:
         if not self.project_name:
             raise ValueError("Please save the project first before using shot builder")
         project_dir = self._project_manager.get_project_dir(self.project_name)
         output_dir = project_dir / "shot_builder"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
         return output_dir
 
     # ========== Project Management ==========
@@ -1188,6 +1733,9 @@ class Api:
                 if "scenes" not in self.project_data or not isinstance(self.project_data.get("scenes"), list):
                     self.project_data["scenes"] = []
 
+                # Snapshot the shot directory once instead of stat-ing every video slot
+                shot_dir_names = self._project_manager.list_shot_dir_names(project_name)
+
                 # Load all alternative images for each shot (slots 1-4)
                 for shot in self.project_data.get("shots", []):
                     shot_id = shot.get("id")
@@ -1206,11 +1754,12 @@ class Api:
                         shot["selectedImageIndex"] = 0
 
                     # Load all alternative videos for each shot (slots 1-4)
-                    all_video_paths = []
-                    for slot in range(1, 5):
-                        slot_path = self._project_manager.get_shot_video_path(project_name, shot_id, slot)
-                        if slot_path.exists():
-                            all_video_paths.append(self._path_to_url(str(slot_path)))
+                    all_video_paths = [
+                        self._path_to_url(str(slot_path))
+                        for slot_path in self._project_manager.list_shot_video_paths(
+                            project_name, shot_id, shot_dir_names
+                        )
+                    ]
 
                     shot["videos"] = all_video_paths
                     if all_video_paths and "selectedVideoIndex" not in shot:
@@ -1267,6 +1816,7 @@ class Api:
 
             import shutil
             shutil.rmtree(project_dir)
+            self._ensured_dirs.clear()
             logger.info(f"Deleted project: {project_name}")
             return {"success": True}
         except Exception as e:
@@ -1295,6 +1845,7 @@ class Api:
 
             # Rename directory
             old_dir.rename(new_dir)
+            self._ensured_dirs.clear()
 
             # Update project.json with new name
             self._project_manager.save_project(new_name, project_data)
@@ -3255,26 +3806,92 @@ class Api:
         return {"success": False, "error": "Shot not found"}
 
     def _notify_shot_status(self, shot_id: str, status: str, shot_data: dict = None):
-        """Notify frontend about shot status change, optionally with full shot data"""
+        """Queue a shot status change for the frontend, optionally with full shot data"""
         try:
-            if self._window:
-                if shot_data:
-                    # Send full shot data as JSON
-                    import json
-                    shot_json = json.dumps(shot_data)
-                    self._window.evaluate_js(f'window.onShotStatusChange && window.onShotStatusChange("{shot_id}", "{status}", {shot_json})')
-                else:
-                    self._window.evaluate_js(f'window.onShotStatusChange && window.onShotStatusChange("{shot_id}", "{status}", null)')
+            # Serialize now so later mutations of the shot don't race the flush
+            entry_json = json.dumps({"shotId": shot_id, "status": status, "shot": shot_data or None})
+            self._notify_queue.put(("status", entry_json))
         except Exception as e:
             logger.warning(f"Failed to notify frontend: {e}")
 
     def _notify_progress(self):
-        """Notify frontend to increment progress"""
-        try:
-            if self._window:
-                self._window.evaluate_js('window.onProgressIncrement && window.onProgressIncrement()')
-        except Exception as e:
-            logger.warning(f"Failed to notify progress: {e}")
+        """Queue a progress increment for the frontend"""
+        self._notify_queue.put(("progress", None))
+
+    def _notify_flush_loop(self):
+        """Drain queued notifications and push them to the frontend in one bridge call per ~50ms"""
+        while True:
+            items = [self._notify_queue.get()]
+            # Give concurrent workers a moment to add to this batch
+            time.sleep(0.05)
+            while True:
+                try:
+                    items.append(self._notify_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            entries = []
+            progress = 0
+            task_events = []
+            llm_lines = []
+            export_progress = None  # 导出进度只需推送本批中最新的一条
+            shot_builder_status = None  # 分镜生成状态同样只推送最新的一条
+            for kind, payload in items:
+                if kind == "status":
+                    entries.append(payload)
+                elif kind == "progress":
+                    progress += 1
+                elif kind == "task":
+                    task_events.append(payload)
+                elif kind == "llm":
+                    llm_lines.append(payload)
+                elif kind == "shot_builder":
+                    shot_builder_status = payload
+                else:
+                    export_progress = payload
+
+            if entries or progress:
+                try:
+                    if self._window:
+                        self._window.evaluate_js(
+                            f'window.onShotsStatusBatch && window.onShotsStatusBatch([{",".join(entries)}], {progress})'
+                        )
+                except Exception as e:
+                    logger.warning(f"Failed to flush shot notifications: {e}")
+
+            if export_progress is not None:
+                try:
+                    if self._window:
+                        self._window.evaluate_js(f'window.onExportProgress && window.onExportProgress({export_progress})')
+                except Exception as e:
+                    logger.warning(f"Failed to notify export progress: {e}")
+
+            if task_events:
+                try:
+                    if self._window:
+                        self._window.evaluate_js(
+                            f'window.onTaskEvent && [{",".join(task_events)}].forEach(e => window.onTaskEvent(e))'
+                        )
+                except Exception as e:
+                    logger.warning(f"Failed to push task events: {e}")
+
+            if llm_lines:
+                try:
+                    if self._window:
+                        self._window.evaluate_js(
+                            f'window.onLLMToken && [{",".join(llm_lines)}].forEach(a => window.onLLMToken(a[0], a[1]))'
+                        )
+                except Exception as e:
+                    logger.warning(f"Failed to push LLM output: {e}")
+
+            if shot_builder_status is not None:
+                try:
+                    if self._window:
+                        self._window.evaluate_js(
+                            f'window.onShotBuilderStatus && window.onShotBuilderStatus({shot_builder_status})'
+                        )
+                except Exception as e:
+                    logger.warning(f"Failed to push shot builder status: {e}")
 
     def _generate_images_with_semaphore(self, shot_id: str) -> dict:
         """Generate images for a shot with semaphore control"""
@@ -3422,7 +4039,7 @@ class Api:
         subtype = "image2image" if reference_paths else "text2image"
         
         # 输出目录
-        output_dir = str(self._project_manager.get_project_dir(self.project_name) / "output" / "shots")
+        output_dir = self._get_project_output_dirs()[1]
         
         # 确定模型
         has_references = len(reference_paths) > 0
@@ -3465,13 +4082,14 @@ class Api:
         task_ids = []
         errors = []
         
+        shot_by_id = {s["id"]: s for s in self.project_data["shots"]}
+        
+        # 先准备所有镜头的任务参数，再在单个事务中批量写入
+        specs = []
+        spec_shots = []
         for shot_id in shot_ids:
             # 找到镜头
-            shot = None
-            for s in self.project_data["shots"]:
-                if s["id"] == shot_id:
-                    shot = s
-                    break
+            shot = shot_by_id.get(shot_id)
             
             if not shot:
                 errors.append(f"Shot not found: {shot_id}")
@@ -3480,35 +4098,37 @@ class Api:
             try:
                 # 准备任务参数
                 params = self._prepare_image_task_params(shot)
-                
-                # 创建任务
-                task_id = self._task_manager.create_image_task(
-                    subtype=params["subtype"],
-                    prompt=params["prompt"],
-                    aspect_ratio=params["aspect_ratio"],
-                    provider=params["provider"],
-                    project_id=self._get_project_id(),
-                    reference_images=params["reference_images"],
-                    output_dir=params["output_dir"],
-                    shot_id=shot_id,
-                    shot_sequence=shot.get("sequence"),
-                    slot=params["slot"],
-                    max_retries=2,
-                    timeout=300,
-                    ttl=3600,
-                )
-                
-                task_ids.append(task_id)
-                
-                # 更新镜头状态
-                shot["status"] = "generating_images"
-                
-                logger.info(f"Created image task {task_id} for shot {shot_id}, slot={params['slot']}")
-                
+                specs.append({
+                    "subtype": params["subtype"],
+                    "prompt": params["prompt"],
+                    "aspect_ratio": params["aspect_ratio"],
+                    "provider": params["provider"],
+                    "reference_images": params["reference_images"],
+                    "output_dir": params["output_dir"],
+                    "shot_id": shot_id,
+                    "shot_sequence": shot.get("sequence"),
+                    "slot": params["slot"],
+                    "max_retries": 2,
+                    "timeout": 300,
+                    "ttl": 3600,
+                })
+                spec_shots.append(shot)
             except Exception as e:
-                logger.error(f"Failed to create image task for shot {shot_id}: {e}")
+                logger.error(f"Failed to prepare image task for shot {shot_id}: {e}")
                 errors.append(f"{shot_id}: {str(e)}")
         
+        if specs:
+            try:
+                task_ids = self._task_manager.create_image_tasks_batch(specs, project_id=self._get_project_id())
+            except Exception as e:
+                logger.error(f"Failed to create image tasks: {e}")
+                errors.extend(f"{shot['id']}: {str(e)}" for shot in spec_shots)
+            else:
+                for shot, spec, task_id in zip(spec_shots, specs, task_ids):
+                    # 更新镜头状态
+                    shot["status"] = "generating_images"
+                    logger.info(f"Created image task {task_id} for shot {shot['id']}, slot={spec['slot']}")
+        
         return {
             "success": True,
             "task_ids": task_ids,
@@ -3579,7 +4199,7 @@ class Api:
 
                     if provider == "whisk":
                         # Whisk mode
-                        from services.whisk import Whisk, VideoProgress, WhiskVideo
+                        from services.whisk import Whisk, WhiskVideo
 
                         if not ttv_config.get("whiskToken") or not ttv_config.get("whiskWorkflowId"):
                             raise ValueError("Whisk Token and Workflow ID not configured in settings")
@@ -3598,11 +4218,14 @@ class Api:
                         # Generate video (iterate through generator)
                         whisk_video = None
                         for result in whisk.generate_video(prompt_with_prefix, image_bytes):
-                            if isinstance(result, VideoProgress):
-                                logger.info(f"Video generation progress: {result.status.value}, elapsed: {result.elapsed_seconds:.1f}s")
-                            elif isinstance(result, WhiskVideo):
+                            if isinstance(result, WhiskVideo):
                                 whisk_video = result
                                 break
+                            # Anything else is a VideoProgress event; loguru formats lazily
+                            logger.info(
+                                "Video generation progress: {}, elapsed: {:.1f}s",
+                                result.status.value, result.elapsed_seconds,
+                            )
 
                         if not whisk_video:
                             raise ValueError("No video generated from Whisk")
@@ -3644,11 +4267,10 @@ class Api:
                         asyncio.run(download_file(video_url, video_path))
 
                     # Load all 4 slots for frontend display (in order 1-4)
-                    all_video_paths = []
-                    for slot in range(1, 5):
-                        slot_path = self._project_manager.get_shot_video_path(self.project_name, shot_id_str, slot)
-                        if slot_path.exists():
-                            all_video_paths.append(self._path_to_url(str(slot_path)))
+                    all_video_paths = [
+                        self._path_to_url(str(slot_path))
+                        for slot_path in self._project_manager.list_shot_video_paths(self.project_name, shot_id_str)
+                    ]
 
                     # Always select the newly generated video
                     if target_slot is not None:
@@ -3691,18 +4313,20 @@ class Api:
             self._notify_progress()
             return result
 
-    def _prepare_video_task_params(self, shot: dict) -> dict:
+    def _prepare_video_task_params(self, shot: dict, settings: Optional[dict] = None) -> dict:
         """
         准备视频生成任务的参数
         
         Args:
             shot: 镜头数据
+            settings: 已加载的应用设置（批量调用时传入，None 则现场加载）
         
         Returns:
             任务参数字典
         """
         # 获取设置
-        settings = self._load_settings()
+        if settings is None:
+            settings = self._load_settings()
         ttv_config = settings.get("ttv", {})
         provider = ttv_config.get("provider", "openai")
         
@@ -3712,11 +4336,11 @@ class Api:
         aspect_ratio = creation_params.get("aspectRatio", "16:9")
         
         # 获取选中的图片路径
-        selected_idx = shot.get("selectedImageIndex", 0)
-        local_images = shot.get("_localImagePaths", [])
+        local_images = shot["_localImagePaths"] if "_localImagePaths" in shot else ()
         
         image_local_path = None
         if local_images:
+            selected_idx = shot.get("selectedImageIndex", 0)
             image_local_path = local_images[selected_idx] if selected_idx < len(local_images) else local_images[0]
         
         # 获取提示词
@@ -3726,7 +4350,7 @@ class Api:
         prompt_with_prefix = f"{shot_video_prefix} {prompt}".strip() if shot_video_prefix else prompt
         
         # 输出目录
-        output_dir = str(self._project_manager.get_project_dir(self.project_name) / "output" / "shots")
+        output_dir = self._get_project_output_dirs()[1]
         
         # 确定子类型
         model = ttv_config.get("model", "")
@@ -3770,13 +4394,11 @@ class Api:
         task_ids = []
         errors = []
         
+        shot_by_id = {s["id"]: s for s in self.project_data["shots"]}
+        
         for shot_id in shot_ids:
             # 找到镜头
-            shot = None
-            for s in self.project_data["shots"]:
-                if s["id"] == shot_id:
-                    shot = s
-                    break
+            shot = shot_by_id.get(shot_id)
             
             if not shot:
                 errors.append(f"Shot not found: {shot_id}")
@@ -3784,7 +4406,7 @@ class Api:
             
             try:
                 # 准备任务参数
-                params = self._prepare_video_task_params(shot)
+                params = self._prepare_video_task_params(shot, settings)
                 
                 # 检查是否有图片可用
                 if params["subtype"] != "text2video" and not params["reference_images"]:
@@ -3838,7 +4460,6 @@ class Api:
                 try:
                     import asyncio
                     from services.generator import GenerationClient
-                    from pydub import AudioSegment
 
                     shot["status"] = "generating_audio"
 
@@ -3875,10 +4496,9 @@ class Api:
                     if not dialogues:
                         raise ValueError("No dialogues found for this shot")
 
-                    # Generate audio for each dialogue
-                    audio_segments = []
-                    temp_files = []
-
+                    # Resolve per-dialogue parameters first
+                    voice_map = self._build_character_voice_map()
+                    jobs = []
                     for idx, dialogue in enumerate(dialogues):
                         role = dialogue.get("role", "")
                         text = dialogue.get("text", "")
@@ -3887,57 +4507,74 @@ class Api:
                             logger.warning(f"Skipping empty dialogue at index {idx}")
                             continue
 
-                        # Find character with matching name
-                        reference_audio = None
-                        character_speed = 1.0
-                        for char in self.project_data["characters"]:
-                            if char["name"] == role:
-                                reference_audio = char.get("referenceAudioPath")
-                                character_speed = char.get("speed", 1.0)
-                                break
+                        # Find character with matching name (preset paths already resolved)
+                        reference_audio, character_speed = voice_map.get(role, (None, 1.0))
 
                         if not reference_audio:
                             raise ValueError(f"No reference audio found for character: {role}")
 
-                        # Handle preset audio path (format: preset:relative_path)
-                        if reference_audio.startswith("preset:"):
-                            relative_path = reference_audio[7:]  # Remove "preset:" prefix
-                            reference_audio = str(Path(__file__).parent / "assets" / "audios" / relative_path)
-                            logger.info(f"Resolved preset audio path: {reference_audio}")
-
                         # Get emotion and intensity from dialogue level, fallback to shot level
                         emotion = dialogue.get("emotion", shot.get("emotion", ""))
                         intensity = dialogue.get("intensity", shot.get("intensity", ""))
 
-                        # Generate audio for this dialogue
-                        logger.info(f"Generating audio for dialogue {idx + 1}/{len(dialogues)}: {role}")
-                        audio_bytes = asyncio.run(
-                            client.generate_audio(
-                                text=text,
-                                reference_audio=reference_audio,
-                                speed=character_speed,
-                                emotion=emotion,
-                                intensity=intensity,
-                            )
-                        )
-
-                        if not audio_bytes:
-                            raise ValueError(f"No audio generated for dialogue {idx}")
-
-                        # Save temporary audio file
                         temp_path = self._project_manager.get_shot_audio_path(
                             self.project_name, f"{shot_id}_dialogue_{idx}"
                         )
-                        temp_path.parent.mkdir(parents=True, exist_ok=True)
-                        with open(temp_path, "wb") as f:
-                            f.write(audio_bytes)
 
-                        temp_files.append(temp_path)
+                        jobs.append({
+                            "idx": idx,
+                            "temp_path": temp_path,
+                            "role": role,
+                            "text": text,
+                            "reference_audio": reference_audio,
+                            "speed": character_speed,
+                            "emotion": emotion,
+                            "intensity": intensity,
+                        })
+
+                    # Generate all dialogues concurrently, bounded by TTS concurrency
+                    async def _generate_all() -> list:
+                        sem = asyncio.Semaphore(max(1, self._tts_concurrency))
+
+                        async def _bound(job: dict):
+                            async with sem:
+                                logger.info(f"Generating audio for dialogue {job['idx'] + 1}/{len(dialogues)}: {job['role']}")
+                                return await client.generate_audio_to_file(
+                                    text=job["text"],
+                                    output_path=job["temp_path"],
+                                    reference_audio=job["reference_audio"],
+                                    speed=job["speed"],
+                                    emotion=job["emotion"],
+                                    intensity=job["intensity"],
+                                )
+
+                        return await asyncio.gather(*(_bound(job) for job in jobs), return_exceptions=True)
+
+                    results = asyncio.run(_generate_all()) if jobs else []
+
+                    # Temp files were streamed to disk by the client
+                    temp_files = [job["temp_path"] for job, written in zip(jobs, results)
+                                  if not isinstance(written, BaseException)]
+
+                    # Raise on first failure, in dialogue order
+                    for job, written in zip(jobs, results):
+                        if isinstance(written, BaseException):
+                            raise written
+                        if not written:
+                            raise ValueError(f"No audio generated for dialogue {job['idx']}")
+
+                    # Decode results in dialogue order
+                    audio_segments = []
+
+                    for job in jobs:
+                        idx = job["idx"]
+                        character_speed = job["speed"]
+                        temp_path = job["temp_path"]
 
                         # Load audio segment and apply speed adjustment
                         segment = AudioSegment.from_file(str(temp_path))
                         if character_speed != 1.0:
-                            logger.info(f"Applying speed adjustment: {character_speed}x for {role}")
+                            logger.info(f"Applying speed adjustment: {character_speed}x for {job['role']}")
                             segment = change_audio_speed(segment, character_speed)
                         audio_segments.append(segment)
 
@@ -3950,21 +4587,17 @@ class Api:
                     if not audio_segments:
                         raise ValueError("No audio segments generated")
 
-                    combined = audio_segments[0]
-                    for segment in audio_segments[1:]:
-                        combined += segment
-
-                    # Save combined audio
+                    # Save combined audio (segments streamed straight into the WAV)
                     final_audio_path = self._project_manager.get_shot_audio_path(
                         self.project_name, shot_id
                     )
                     final_audio_path.parent.mkdir(parents=True, exist_ok=True)
-                    combined.export(str(final_audio_path), format="wav")
+                    write_wav(audio_segments, final_audio_path)
 
                     # Clean up temporary files
                     for temp_file in temp_files:
                         try:
-                            temp_file.unlink()
+                            temp_file.unlink(missing_ok=True)
                         except Exception as e:
                             logger.warning(f"Failed to delete temp file {temp_file}: {e}")
 
@@ -3997,19 +4630,43 @@ class Api:
             self._notify_progress()
             return result
 
-    def _prepare_audio_task_params(self, shot: dict, dialogue_index: int) -> dict:
+    def _build_character_voice_map(self) -> dict:
+        """
+        构建角色名 -> (参考音频路径, 语速) 映射
+        
+        预设音频（preset:relative_path）在此一次性解析为绝对路径，
+        同名角色以第一个为准
+        """
+        voice_map = {}
+        for char in (self.project_data or {}).get("characters", []):
+            reference_audio = char.get("referenceAudioPath")
+            if reference_audio and reference_audio.startswith("preset:"):
+                reference_audio = str(_PRESET_AUDIO_ROOT / reference_audio[7:])
+            voice_map.setdefault(char["name"], (reference_audio, char.get("speed", 1.0)))
+        return voice_map
+
+    def _prepare_audio_task_params(
+        self,
+        shot: dict,
+        dialogue_index: int,
+        voice_map: Optional[dict] = None,
+        settings: Optional[dict] = None,
+    ) -> dict:
         """
         准备音频生成任务的参数
         
         Args:
             shot: 镜头数据
             dialogue_index: 对话索引
+            voice_map: 角色音色映射（批量调用时预先构建，None 则现场构建）
+            settings: 已加载的应用设置（批量调用时传入，None 则现场加载）
         
         Returns:
             任务参数字典
         """
         # 获取设置
-        settings = self._load_settings()
+        if settings is None:
+            settings = self._load_settings()
         tts_config = self._get_api_config(settings, "tts")
         
         # 获取对话
@@ -4031,29 +4688,20 @@ class Api:
         if not role or not text:
             raise ValueError(f"Empty dialogue at index {dialogue_index}")
         
-        # 找到角色的参考音频
-        reference_audio = None
-        character_speed = 1.0
-        for char in self.project_data.get("characters", []):
-            if char["name"] == role:
-                reference_audio = char.get("referenceAudioPath")
-                character_speed = char.get("speed", 1.0)
-                break
+        # 找到角色的参考音频（预设音频路径已解析）
+        if voice_map is None:
+            voice_map = self._build_character_voice_map()
+        reference_audio, character_speed = voice_map.get(role, (None, 1.0))
         
         if not reference_audio:
             raise ValueError(f"No reference audio found for character: {role}")
         
-        # 处理预设音频路径
-        if reference_audio.startswith("preset:"):
-            relative_path = reference_audio[7:]
-            reference_audio = str(Path(__file__).parent / "assets" / "audios" / relative_path)
-        
         # 获取情感参数
         emotion = dialogue.get("emotion", shot.get("emotion", ""))
         intensity = dialogue.get("intensity", shot.get("intensity", ""))
         
         # 输出目录
-        output_dir = str(self._project_manager.get_project_dir(self.project_name) / "output" / "shots")
+        output_dir = self._get_project_output_dirs()[1]
         
         return {
             "text": text,
@@ -4068,12 +4716,12 @@ class Api:
             "model": tts_config.get("model", "tts-1"),
         }
 
-    def generate_audios_batch(self, shot_ids: list) -> dict:
+    def generate_audios_batch(self, shot_ids: list, regenerate: bool = False) -> dict:
         """
         批量创建音频生成任务
         
         使用任务系统，立即返回，后台异步执行
-        为每段对话创建独立任务
+        为每段对话创建独立任务；regenerate=True 时不复用 TTS 缓存，重新生成新的配音
         """
         if not self.project_data:
             return {"success": False, "error": "No project data"}
@@ -4090,14 +4738,13 @@ class Api:
         
         task_ids = []
         errors = []
+        voice_map = self._build_character_voice_map()
+        
+        shot_by_id = {s["id"]: s for s in self.project_data["shots"]}
         
         for shot_id in shot_ids:
             # 找到镜头
-            shot = None
-            for s in self.project_data["shots"]:
-                if s["id"] == shot_id:
-                    shot = s
-                    break
+            shot = shot_by_id.get(shot_id)
             
             if not shot:
                 errors.append(f"Shot not found: {shot_id}")
@@ -4120,7 +4767,7 @@ class Api:
             shot_task_ids = []
             for idx, dialogue in enumerate(dialogues):
                 try:
-                    params = self._prepare_audio_task_params(shot, idx)
+                    params = self._prepare_audio_task_params(shot, idx, voice_map, settings)
                     
                     task_id = self._task_manager.create_audio_task(
                         text=params["text"],
@@ -4134,6 +4781,7 @@ class Api:
                         shot_id=shot_id,
                         shot_sequence=shot.get("sequence"),
                         dialogue_index=idx,
+                        skip_cache=regenerate,
                         max_retries=2,
                         timeout=120,
                         ttl=3600,
@@ -4163,16 +4811,9 @@ class Api:
 
     def open_output_dir(self) -> dict:
         """Open output directory in file explorer"""
-        import subprocess
-        import sys
-
         try:
-            if sys.platform == "darwin":
-                subprocess.run(["open", str(self.output_dir)])
-            elif sys.platform == "win32":
-                subprocess.run(["explorer", str(self.output_dir)])
-            else:
-                subprocess.run(["xdg-open", str(self.output_dir)])
+            # Fire-and-forget: don't wait for the file manager process
+            subprocess.Popen(_OPEN_CMD + (str(self.output_dir),), close_fds=True)
             return {"success": True}
         except Exception as e:
             logger.error(f"Failed to open output dir: {e}")
@@ -4180,19 +4821,11 @@ class Api:
 
     def open_logs_dir(self) -> dict:
         """Open logs directory in file explorer"""
-        import subprocess
-        import sys
-
         logs_dir = Path.home() / ".hetangai" / "logs"
         try:
             if not logs_dir.exists():
                 logs_dir.mkdir(parents=True, exist_ok=True)
-            if sys.platform == "darwin":
-                subprocess.run(["open", str(logs_dir)])
-            elif sys.platform == "win32":
-                subprocess.run(["explorer", str(logs_dir)])
-            else:
-                subprocess.run(["xdg-open", str(logs_dir)])
+            subprocess.Popen(_OPEN_CMD + (str(logs_dir),), close_fds=True)
             return {"success": True}
         except Exception as e:
             logger.error(f"Failed to open logs dir: {e}")
@@ -4235,26 +4868,16 @@ class Api:
         Returns:
             Success status
         """
-        import subprocess
-        import platform
-        from pathlib import Path
-        
         try:
             path = Path(filepath)
             if not path.exists():
                 return {"success": False, "error": f"File not found: {filepath}"}
             
-            system = platform.system()
-            
-            if system == "Darwin":  # macOS
-                # -R flag reveals and selects the file in Finder
-                subprocess.run(["open", "-R", str(path)], check=True)
-            elif system == "Windows":
-                # /select flag selects the file in Explorer
-                subprocess.run(["explorer", "/select,", str(path)], check=True)
-            else:  # Linux
-                # Just open the parent directory
-                subprocess.run(["xdg-open", str(path.parent)], check=True)
+            # Fire-and-forget: return without waiting for the file manager
+            if _REVEAL_CMD:
+                subprocess.Popen(_REVEAL_CMD + (str(path),), close_fds=True)
+            else:
+                subprocess.Popen(_OPEN_CMD + (str(path.parent),), close_fds=True)
             
             return {"success": True}
         except Exception as e:
@@ -4264,10 +4887,13 @@ class Api:
     # ========== Reference Audio Management ==========
 
     def scan_reference_audios(self, directory: str) -> dict:
-        """Scan directory recursively for audio files"""
-        import os
+        """Scan directory recursively for audio files
 
-        audio_extensions = {".mp3", ".wav", ".m4a", ".flac", ".aac", ".ogg", ".wma"}
+        Subdirectories are scanned in parallel (I/O bound, overlaps metadata
+        latency on slow/network disks). Partial results are pushed to
+        window.onReferenceAudiosPartial every SCAN_PUSH_BATCH hits so the UI
+        can render before the whole tree is walked.
+        """
         audios = []
 
         try:
@@ -4278,16 +4904,26 @@ class Api:
 
             logger.info(f"Scanning audio files in: {directory}")
 
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    file_path = Path(root) / file
-                    if file_path.suffix.lower() in audio_extensions:
-                        relative_path = file_path.relative_to(dir_path)
-                        audios.append({
-                            "path": str(file_path),
-                            "name": file_path.name,
-                            "relativePath": str(relative_path),
-                        })
+            root = str(dir_path)
+            prefix_len = len(root) if root.endswith(os.sep) else len(root) + 1
+            pushed = 0
+
+            with ThreadPoolExecutor(max_workers=8, thread_name_prefix="scan") as pool:
+                pending = {pool.submit(_scan_audio_dir, root, prefix_len)}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        found, subdirs = future.result()
+                        audios.extend(found)
+                        for subdir in subdirs:
+                            pending.add(pool.submit(_scan_audio_dir, subdir, prefix_len))
+
+                    if len(audios) - pushed >= SCAN_PUSH_BATCH:
+                        self._push_reference_audios_partial(directory, audios[pushed:])
+                        pushed = len(audios)
+
+            # Parallel traversal has no stable order; keep output deterministic
+            audios.sort(key=lambda a: a["relativePath"])
 
             logger.info(f"Found {len(audios)} audio files")
             return {"success": True, "audios": audios}
@@ -4296,6 +4932,17 @@ class Api:
             logger.error(f"Failed to scan audio files: {e}")
             return {"success": False, "error": str(e), "audios": []}
 
+    def _push_reference_audios_partial(self, directory: str, audios: list) -> None:
+        """Push a batch of scanned audios to the frontend while scanning continues"""
+        try:
+            if self._window:
+                self._window.evaluate_js(
+                    f'window.onReferenceAudiosPartial && '
+                    f'window.onReferenceAudiosPartial({json.dumps(directory)}, {json.dumps(audios)})'
+                )
+        except Exception as e:
+            logger.warning(f"Failed to push partial scan results: {e}")
+
     def select_reference_audio_dir(self) -> dict:
         """Select reference audio directory"""
         if not self._window:
@@ -4314,14 +4961,53 @@ class Api:
 
         return {"success": True, "path": str(dir_path)}
 
+    def _read_audio_base64(self, cache_name: str, audio_path: Path) -> tuple[str, str, int]:
+        """Read audio file as (base64_data, mime_type, size), cached by (name, mtime, size)
+
+        Repeat previews of the same file skip the disk read and base64 encode.
+        Cache is LRU-bounded by AUDIO_DATA_CACHE_LIMIT.
+        """
+        st = audio_path.stat()
+        key = f"{cache_name}:{st.st_mtime_ns}:{st.st_size}"
+        with self._audio_data_cache_lock:
+            cached = self._audio_data_cache.get(key)
+            if cached is not None:
+                self._audio_data_cache.move_to_end(key)
+                return cached[0], cached[1], st.st_size
+
+        # Encode straight from a read-only mmap, avoiding an intermediate bytes copy
+        with open(audio_path, "rb") as f:
+            if st.st_size == 0:
+                base64_data = ""
+            else:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    base64_data = base64.b64encode(mm).decode("ascii")
+                finally:
+                    mm.close()
+
+        # Determine MIME type (known audio extensions first, system mime db on miss)
+        mime_type = (
+            _AUDIO_MIME.get(audio_path.suffix.lower())
+            or mimetypes.guess_type(str(audio_path))[0]
+            or "audio/mpeg"
+        )
+
+        with self._audio_data_cache_lock:
+            if key not in self._audio_data_cache:
+                self._audio_data_cache[key] = (base64_data, mime_type)
+                self._audio_data_cache_bytes += len(base64_data)
+            while self._audio_data_cache_bytes > AUDIO_DATA_CACHE_LIMIT and self._audio_data_cache:
+                _, (evicted, _) = self._audio_data_cache.popitem(last=False)
+                self._audio_data_cache_bytes -= len(evicted)
+
+        return base64_data, mime_type, st.st_size
+
     def get_reference_audio_data(self, file_path: str) -> dict:
         """Read audio file and return as base64 data
         
         Supports both preset: prefixed paths and absolute paths
         """
-        import base64
-        import mimetypes
-
         try:
             # Handle preset audio paths
             if file_path.startswith("preset:"):
@@ -4329,33 +5015,11 @@ class Api:
                 return self.get_preset_audio_data(relative_path)
 
             audio_path = Path(file_path)
-            if not audio_path.exists() or not audio_path.is_file():
+            if not audio_path.is_file():
                 return {"success": False, "error": "File not found"}
 
-            # Read file as binary
-            with open(audio_path, "rb") as f:
-                audio_data = f.read()
-
-            # Encode to base64
-            base64_data = base64.b64encode(audio_data).decode("utf-8")
-
-            # Determine MIME type
-            mime_type, _ = mimetypes.guess_type(str(audio_path))
-            if not mime_type:
-                # Default MIME types based on extension
-                ext = audio_path.suffix.lower()
-                mime_map = {
-                    ".mp3": "audio/mpeg",
-                    ".wav": "audio/wav",
-                    ".m4a": "audio/mp4",
-                    ".flac": "audio/flac",
-                    ".aac": "audio/aac",
-                    ".ogg": "audio/ogg",
-                    ".wma": "audio/x-ms-wma",
-                }
-                mime_type = mime_map.get(ext, "audio/mpeg")
-
-            logger.info(f"Read audio file: {file_path} ({len(audio_data)} bytes)")
+            base64_data, mime_type, size = self._read_audio_base64(str(audio_path.resolve()), audio_path)
+            logger.info(f"Read audio file: {file_path} ({size} bytes)")
             return {"success": True, "data": base64_data, "mimeType": mime_type}
 
         except Exception as e:
@@ -4366,61 +5030,72 @@ class Api:
 
     def _get_preset_audios_csv_path(self) -> Path:
         """Get the path to the preset audios CSV file"""
-        # In development mode, use the local assets directory
-        # In production mode, use the bundled assets
-        if getattr(sys, 'frozen', False):
-            # Running in PyInstaller bundle
-            base_path = Path(sys._MEIPASS)
-        else:
-            # Running in development
-            base_path = Path(__file__).parent
-        return base_path / "assets" / "audios" / "audios.csv"
+        return _PRESET_AUDIO_CSV
 
     def _get_preset_audios_dir(self) -> Path:
         """Get the directory containing preset audio files"""
-        if getattr(sys, 'frozen', False):
-            base_path = Path(sys._MEIPASS)
-        else:
-            base_path = Path(__file__).parent
-        return base_path / "assets" / "audios"
+        return _PRESET_AUDIO_ROOT
+
+    # CSV header (Chinese) -> preset audio field
+    _PRESET_CSV_FIELDS = {
+        "名称": "name",
+        "相对路径": "path",
+        "性别": "gender",
+        "年龄段": "ageGroup",
+        "预测年龄": "age",
+        "语速": "speed",
+        "用途": "usage",
+        "标签": "tags",
+        "典型角色": "typicalRoles",
+        "描述": "description",
+    }
 
     def get_preset_audios(self) -> dict:
-        """Get list of preset reference audios from CSV"""
-        import csv
+        """Get list of preset reference audios from CSV
 
+        The parsed list is cached by CSV mtime; callers must treat it as read-only.
+        """
         try:
             csv_path = self._get_preset_audios_csv_path()
-            if not csv_path.exists():
+            try:
+                mtime_ns = csv_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 logger.warning(f"Preset audios CSV not found: {csv_path}")
                 return {"success": True, "audios": []}
 
+            cached = self._preset_audios_cache
+            if cached is not None and cached[0] == mtime_ns:
+                return {"success": True, "audios": cached[1]}
+
             audios = []
-            with open(csv_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
+            with open(csv_path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                header = [title.strip() for title in next(reader, [])]
+                # Resolve column offsets once; missing columns point past the header
+                # and read from row padding
+                fields = tuple(self._PRESET_CSV_FIELDS.values())
+                offsets = [
+                    header.index(title) if title in header else len(header)
+                    for title in self._PRESET_CSV_FIELDS
+                ]
+                width = max(offsets) + 1
+                project = operator.itemgetter(*offsets)
+                tags_pos = fields.index("tags")
+
                 for row in reader:
-                    # Skip empty rows (CSV headers are in Chinese)
-                    name = row.get("名称", "")
-                    if not name:
+                    if len(row) < width:
+                        row.extend([""] * (width - len(row)))
+                    values = project(row)
+                    # Skip empty rows
+                    if not values[0]:
                         continue
-                    
+
+                    audio = dict(zip(fields, values))
                     # Parse tags from pipe-separated string
-                    tags_str = row.get("标签", "")
-                    tags = [t.strip() for t in tags_str.split("|") if t.strip()]
-                    
-                    audio = {
-                        "name": name,
-                        "path": row.get("相对路径", ""),
-                        "gender": row.get("性别", ""),
-                        "ageGroup": row.get("年龄段", ""),
-                        "age": row.get("预测年龄", ""),
-                        "speed": row.get("语速", ""),
-                        "usage": row.get("用途", ""),
-                        "tags": tags,
-                        "typicalRoles": row.get("典型角色", ""),
-                        "description": row.get("描述", ""),
-                    }
+                    audio["tags"] = [t for t in map(str.strip, values[tags_pos].split("|")) if t]
                     audios.append(audio)
 
+            self._preset_audios_cache = (mtime_ns, audios)
             logger.info(f"Loaded {len(audios)} preset audios from CSV")
             return {"success": True, "audios": audios}
 
@@ -4430,40 +5105,16 @@ class Api:
 
     def get_preset_audio_data(self, relative_path: str) -> dict:
         """Read preset audio file and return as base64 data"""
-        import base64
-        import mimetypes
-
         try:
             audios_dir = self._get_preset_audios_dir()
             audio_path = audios_dir / relative_path
 
-            if not audio_path.exists() or not audio_path.is_file():
+            if not audio_path.is_file():
                 logger.warning(f"Preset audio file not found: {audio_path}")
                 return {"success": False, "error": "File not found"}
 
-            # Read file as binary
-            with open(audio_path, "rb") as f:
-                audio_data = f.read()
-
-            # Encode to base64
-            base64_data = base64.b64encode(audio_data).decode("utf-8")
-
-            # Determine MIME type
-            mime_type, _ = mimetypes.guess_type(str(audio_path))
-            if not mime_type:
-                ext = audio_path.suffix.lower()
-                mime_map = {
-                    ".mp3": "audio/mpeg",
-                    ".wav": "audio/wav",
-                    ".m4a": "audio/mp4",
-                    ".flac": "audio/flac",
-                    ".aac": "audio/aac",
-                    ".ogg": "audio/ogg",
-                    ".wma": "audio/x-ms-wma",
-                }
-                mime_type = mime_map.get(ext, "audio/mpeg")
-
-            logger.info(f"Read preset audio file: {relative_path} ({len(audio_data)} bytes)")
+            base64_data, mime_type, size = self._read_audio_base64(f"preset:{relative_path}", audio_path)
+            logger.info(f"Read preset audio file: {relative_path} ({size} bytes)")
             return {"success": True, "data": base64_data, "mimeType": mime_type}
 
         except Exception as e:
@@ -4477,8 +5128,6 @@ class Api:
             mode: 'empty_only' - only assign to characters without audio
                   'all' - reassign all characters
         """
-        import random
-
         try:
             if not self.project_data:
                 return {"success": False, "error": "No project loaded"}
@@ -4492,61 +5141,67 @@ class Api:
             if not all_audios:
                 return {"success": False, "error": "No preset audios available"}
 
-            # Separate audios by usage type
-            narration_audios = [a for a in all_audios if "旁白" in a.get("usage", "")]
-            voiceover_audios = [a for a in all_audios if "配音" in a.get("usage", "")]
-            
-            # Further separate by gender
-            def get_audios_by_gender(audios: list, gender: str) -> list:
-                return [a for a in audios if a.get("gender") == gender]
-
-            narration_male = get_audios_by_gender(narration_audios, "男")
-            narration_female = get_audios_by_gender(narration_audios, "女")
-            voiceover_male = get_audios_by_gender(voiceover_audios, "男")
-            voiceover_female = get_audios_by_gender(voiceover_audios, "女")
-
-            # Keywords for gender inference
-            female_keywords = ["女", "娘", "姐", "妈", "母", "婆", "妹", "姑", "婶", "嫂", "她", "公主", "王后", "女王", "夫人", "小姐"]
-            male_keywords = ["男", "哥", "弟", "爸", "父", "爷", "叔", "伯", "他", "王子", "国王", "先生", "大叔", "少爷"]
+            # Bucket audios by usage type and gender in a single pass
+            narration_audios, narration_male, narration_female = [], [], []
+            voiceover_audios, voiceover_male, voiceover_female = [], [], []
+            for a in all_audios:
+                usage = a.get("usage", "")
+                gender = a.get("gender")
+                if "旁白" in usage:
+                    narration_audios.append(a)
+                    if gender == "男":
+                        narration_male.append(a)
+                    elif gender == "女":
+                        narration_female.append(a)
+                if "配音" in usage:
+                    voiceover_audios.append(a)
+                    if gender == "男":
+                        voiceover_male.append(a)
+                    elif gender == "女":
+                        voiceover_female.append(a)
 
             def infer_gender(name: str) -> str:
                 """Infer gender from character name"""
-                for kw in female_keywords:
-                    if kw in name:
-                        return "女"
-                for kw in male_keywords:
-                    if kw in name:
-                        return "男"
+                if _FEMALE_NAME_RE.search(name):
+                    return "女"
+                if _MALE_NAME_RE.search(name):
+                    return "男"
                 return "random"
 
+            # Candidate pool per (is_narrator, gender), falling back to all audios if empty
+            pools = {
+                (True, "女"): narration_female or narration_audios or all_audios,
+                (True, "男"): narration_male or narration_audios or all_audios,
+                (True, "random"): narration_audios or all_audios,
+                (False, "女"): voiceover_female or voiceover_audios or all_audios,
+                (False, "男"): voiceover_male or voiceover_audios or all_audios,
+                (False, "random"): voiceover_audios or all_audios,
+            }
+
             def select_audio(is_narrator: bool, gender: str, used_paths: set) -> dict:
                 """Select an audio based on character attributes"""
-                if is_narrator:
-                    if gender == "女":
-                        pool = narration_female or narration_audios
-                    elif gender == "男":
-                        pool = narration_male or narration_audios
-                    else:
-                        pool = narration_audios
-                else:
-                    if gender == "女":
-                        pool = voiceover_female or voiceover_audios
-                    elif gender == "男":
-                        pool = voiceover_male or voiceover_audios
-                    else:
-                        pool = voiceover_audios
-
-                # Fall back to all audios if pool is empty
-                if not pool:
-                    pool = all_audios
+                pool = pools[(bool(is_narrator), gender)]
+
+                # Draw from a per-pool shuffled queue; entries already taken via an
+                # overlapping pool (e.g. 配音+旁白) are skipped lazily
+                queue_ = pool_queues.get(id(pool))
+                if queue_ is None:
+                    shuffled = list(pool)
+                    shuffle(shuffled)
+                    queue_ = deque((a.get("path"), a) for a in shuffled)
+                    pool_queues[id(pool)] = queue_
+                while queue_:
+                    path, audio = queue_.popleft()
+                    if path not in used_paths:
+                        return audio
 
-                # Try to find an unused audio first
-                unused = [a for a in pool if a.get("path") not in used_paths]
-                if unused:
-                    return random.choice(unused)
-                
                 # If all are used, just pick randomly
-                return random.choice(pool)
+                return choice(pool)
+
+            # Local RNG with bound methods for the per-character loop
+            rng = random.Random()
+            shuffle, choice = rng.shuffle, rng.choice
+            pool_queues: dict[int, deque] = {}
 
             # Track used audio paths to avoid duplicates
             used_paths = set()
@@ -4598,6 +5253,40 @@ class Api:
             logger.error(f"Failed to smart assign audios: {e}")
             return {"success": False, "error": str(e), "assignedCount": 0, "skippedCount": 0}
 
+    def _get_preset_library_prompt(self, all_audios: list) -> tuple[str, str]:
+        """Serialized (narration, voiceover) audio library for the LLM prompt (without file paths)
+
+        Cached against the preset audio list object, which is itself cached by CSV mtime.
+        """
+        cached = self._preset_library_prompt_cache
+        if cached is not None and cached[0] is all_audios:
+            return cached[1], cached[2]
+
+        narration_audios = []
+        voiceover_audios = []
+        for audio in all_audios:
+            usage = audio.get("usage", "")
+            audio_info = {
+                "name": audio.get("name", ""),
+                "gender": audio.get("gender", ""),
+                "ageGroup": audio.get("ageGroup", ""),
+                "age": audio.get("age", ""),
+                "speed": audio.get("speed", ""),
+                "tags": audio.get("tags", [])[:5],  # Limit tags
+                "typicalRoles": audio.get("typicalRoles", ""),
+                "description": audio.get("description", "")[:100],  # Limit description
+            }
+            if "旁白" in usage:
+                narration_audios.append(audio_info)
+            if "配音" in usage:
+                voiceover_audios.append(audio_info)
+
+        narration_json = json.dumps(narration_audios, ensure_ascii=False, indent=2)
+        voiceover_json = json.dumps(voiceover_audios, ensure_ascii=False, indent=2)
+        # Holding the list reference keeps the identity check valid
+        self._preset_library_prompt_cache = (all_audios, narration_json, voiceover_json)
+        return narration_json, voiceover_json
+
     def smart_assign_audios_with_llm(self, mode: str = "empty_only") -> dict:
         """Smart assign reference audios using LLM for better matching
         
@@ -4608,8 +5297,6 @@ class Api:
         Returns:
             dict with recommendations for each character
         """
-        import json
-        import re
         from services.stream_llm import call_llm_stream
 
         try:
@@ -4617,11 +5304,7 @@ class Api:
                 return {"success": False, "error": "No project loaded", "assignedCount": 0, "skippedCount": 0}
 
             # Get settings for LLM config
-            settings = self._load_settings()
-            shot_builder_config = settings.get("shotBuilder", {})
-            api_url = shot_builder_config.get("apiUrl", "")
-            api_key = shot_builder_config.get("apiKey", "")
-            model = shot_builder_config.get("model", "")
+            api_url, api_key, model = self._get_shot_builder_llm_config()
 
             if not api_key:
                 return {"success": False, "error": "Please configure LLM API settings first", "assignedCount": 0, "skippedCount": 0}
@@ -4645,25 +5328,7 @@ class Api:
             if not chars_to_assign:
                 return {"success": True, "assignedCount": 0, "skippedCount": len(characters), "recommendations": {}}
 
-            # Build audio library description (without file paths)
-            narration_audios = []
-            voiceover_audios = []
-            for audio in all_audios:
-                usage = audio.get("usage", "")
-                audio_info = {
-                    "name": audio.get("name", ""),
-                    "gender": audio.get("gender", ""),
-                    "ageGroup": audio.get("ageGroup", ""),
-                    "age": audio.get("age", ""),
-                    "speed": audio.get("speed", ""),
-                    "tags": audio.get("tags", [])[:5],  # Limit tags
-                    "typicalRoles": audio.get("typicalRoles", ""),
-                    "description": audio.get("description", "")[:100],  # Limit description
-                }
-                if "旁白" in usage:
-                    narration_audios.append(audio_info)
-                if "配音" in usage:
-                    voiceover_audios.append(audio_info)
+            narration_json, voiceover_json = self._get_preset_library_prompt(all_audios)
 
             # Build character list description
             char_list = []
@@ -4679,10 +5344,10 @@ class Api:
             prompt = f"""你是一个专业的配音导演，需要为短剧角色分配合适的配音参考音。
 
 ## 旁白参考音库（适合旁白角色）
-{json.dumps(narration_audios, ensure_ascii=False, indent=2)}
+{narration_json}
 
 ## 角色配音参考音库（适合对话角色）
-{json.dumps(voiceover_audios, ensure_ascii=False, indent=2)}
+{voiceover_json}
 
 ## 待分配角色
 {json.dumps(char_list, ensure_ascii=False, indent=2)}
@@ -4716,20 +5381,24 @@ class Api:
 
             # Call LLM
             logger.info("Calling LLM for smart audio assignment...")
-            response_lines = []
+            # Stop consuming the stream once the top-level JSON object is closed
+            buf = io.StringIO()
+            scanner = _JsonObjectScanner()
             for line in call_llm_stream(prompt, model=model, api_key=api_key, base_url=api_url, use_env=False):
-                response_lines.append(line)
-            response = "\n".join(response_lines)
+                chunk = line + "\n"
+                buf.write(chunk)
+                if scanner.feed(chunk):
+                    break
+            response = buf.getvalue()
 
             # Parse JSON response
-            # Try to extract JSON from response (may be wrapped in markdown code block)
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if not json_match:
+            # The scanner already located the JSON object (may be wrapped in markdown code block)
+            if scanner.end < 0:
                 logger.error(f"Failed to parse LLM response: {response}")
                 return {"success": False, "error": "Failed to parse LLM response", "assignedCount": 0, "skippedCount": 0}
 
             try:
-                result = json.loads(json_match.group())
+                result = json.loads(response[scanner.start:scanner.end])
             except json.JSONDecodeError as e:
                 logger.error(f"JSON decode error: {e}, response: {response}")
                 return {"success": False, "error": f"Invalid JSON response: {str(e)}", "assignedCount": 0, "skippedCount": 0}
@@ -4737,6 +5406,11 @@ class Api:
             # Build audio name to path mapping
             audio_name_to_path = {a.get("name"): a.get("path") for a in all_audios}
 
+            # Index characters by id (first occurrence wins, same as a linear scan)
+            char_by_id = {}
+            for char in characters:
+                char_by_id.setdefault(char.get("id"), char)
+
             # Process recommendations and update characters
             recommendations_by_id = {}
             assigned_count = 0
@@ -4761,15 +5435,14 @@ class Api:
                     recommendations_by_id[char_id] = full_recs
                     
                     # Update character with first recommendation
-                    for char in characters:
-                        if char.get("id") == char_id:
-                            first_rec = full_recs[0]
-                            char["referenceAudioPath"] = f"preset:{first_rec['audioPath']}"
-                            char["referenceAudioName"] = first_rec["audioName"]
-                            char["audioRecommendations"] = full_recs
-                            char["selectedRecommendationIndex"] = 0
-                            assigned_count += 1
-                            break
+                    char = char_by_id.get(char_id)
+                    if char is not None:
+                        first_rec = full_recs[0]
+                        char["referenceAudioPath"] = f"preset:{first_rec['audioPath']}"
+                        char["referenceAudioName"] = first_rec["audioName"]
+                        char["audioRecommendations"] = full_recs
+                        char["selectedRecommendationIndex"] = 0
+                        assigned_count += 1
 
             skipped_count = len(characters) - assigned_count
 
@@ -4828,15 +5501,22 @@ class Api:
 
     # ========== Shot Builder ==========
 
+    def _load_shot_builder_prompts(self) -> dict:
+        """Load role/scene/shot prompts, cached by each file's (mtime_ns, size)"""
+        self._ensure_shot_builder_prompts()
+        prompt_dir = self._get_shot_builder_prompt_dir()
+        paths = {key: prompt_dir / f"{key}.txt" for key in ("role", "scene", "shot")}
+        stamp = tuple((st.st_mtime_ns, st.st_size) for st in (p.stat() for p in paths.values()))
+
+        cached = self._shot_builder_prompts_cache
+        if cached is None or cached[0] != stamp:
+            prompts = {key: path.read_text(encoding="utf-8") for key, path in paths.items()}
+            self._shot_builder_prompts_cache = cached = (stamp, prompts)
+        return dict(cached[1])
+
     def get_shot_builder_prompts(self) -> dict:
         try:
-            self._ensure_shot_builder_prompts()
-            prompt_dir = self._get_shot_builder_prompt_dir()
-            prompts = {
-                "role": (prompt_dir / "role.txt").read_text(encoding="utf-8"),
-                "scene": (prompt_dir / "scene.txt").read_text(encoding="utf-8"),
-                "shot": (prompt_dir / "shot.txt").read_text(encoding="utf-8"),
-            }
+            prompts = self._load_shot_builder_prompts()
             return {"success": True, "prompts": prompts}
         except Exception as e:
             logger.error(f"Failed to load shot builder prompts: {e}")
@@ -4857,8 +5537,10 @@ class Api:
     def get_shot_builder_novel(self) -> dict:
         try:
             output_dir = self._get_shot_builder_output_dir()
-            novel_path = output_dir / "novel.txt"
-            text = novel_path.read_text(encoding="utf-8") if novel_path.exists() else ""
+            try:
+                text = (output_dir / "novel.txt").read_text(encoding="utf-8")
+            except FileNotFoundError:
+                text = ""
             return {"success": True, "text": text}
         except Exception as e:
             logger.error(f"Failed to load novel text: {e}")
@@ -4877,10 +5559,10 @@ class Api:
     def clear_shot_builder_output(self) -> dict:
         try:
             output_dir = self._get_shot_builder_output_dir()
-            if output_dir.exists():
-                import shutil
-                shutil.rmtree(output_dir)
-            output_dir.mkdir(parents=True, exist_ok=True)
+            # 只删除生成结果与会话状态，保留 novel.txt
+            for path in output_dir.glob("*.jsonl"):
+                path.unlink(missing_ok=True)
+            (output_dir / "session_state.json").unlink(missing_ok=True)
             return {"success": True, "outputDir": str(output_dir)}
         except Exception as e:
             logger.error(f"Failed to clear shot builder output: {e}")
@@ -4890,13 +5572,20 @@ class Api:
         try:
             output_dir = self._get_shot_builder_output_dir()
 
-            def read_text(path: Path) -> str:
-                return path.read_text(encoding="utf-8") if path.exists() else ""
+            def read_text(name: str) -> str:
+                try:
+                    return (output_dir / name).read_bytes().decode("utf-8")
+                except FileNotFoundError:
+                    return ""
+
+            # The three files are independent; read them concurrently
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="shot-builder-io") as pool:
+                roles, scenes, shots = pool.map(read_text, ("roles.jsonl", "scenes.jsonl", "shots.jsonl"))
 
             outputs = {
-                "roles": read_text(output_dir / "roles.jsonl"),
-                "scenes": read_text(output_dir / "scenes.jsonl"),
-                "shots": read_text(output_dir / "shots.jsonl"),
+                "roles": roles,
+                "scenes": scenes,
+                "shots": shots,
                 "outputDir": str(output_dir),
             }
             return {"success": True, "outputs": outputs}
@@ -4936,27 +5625,42 @@ class Api:
                 Scene,
             )
 
+            # Keep record counts in the task state as rows are written and push them to the
+            # frontend, so progress needs neither polling nor file I/O while the task runs
+            task = self._shot_builder_task
+            count_key = {"role": "roles", "scene": "scenes", "shot": "shots"}[step]
+
+            def on_record() -> None:
+                if task is not None:
+                    task["counts"][count_key] += 1
+                    self._notify_shot_builder_status()
+
             if step == "role":
-                generate_roles(prompt_role, novel_text, output_dir, llm_config=llm_config)
+                generate_roles(prompt_role, novel_text, output_dir, llm_config=llm_config, on_record=on_record)
             elif step == "scene":
-                generate_scenes(prompt_scene, novel_text, output_dir, llm_config=llm_config)
+                generate_scenes(prompt_scene, novel_text, output_dir, llm_config=llm_config, on_record=on_record)
             else:
                 roles_path = output_dir / "roles.jsonl"
                 scenes_path = output_dir / "scenes.jsonl"
                 roles = load_existing_data(roles_path, Role)
                 scenes = load_existing_data(scenes_path, Scene)
-                generate_shots(prompt_shot, novel_text, roles, scenes, output_dir, llm_config=llm_config)
+                generate_shots(
+                    prompt_shot, novel_text, roles, scenes, output_dir,
+                    llm_config=llm_config, on_record=on_record,
+                )
 
             # Mark task as completed
             if self._shot_builder_task and self._shot_builder_task.get("step") == step:
                 self._shot_builder_task["running"] = False
                 self._shot_builder_task["error"] = None
                 logger.info(f"Shot builder task completed: {step}")
+                self._notify_shot_builder_status()
         except Exception as e:
             logger.error(f"Shot builder task failed: {e}")
             if self._shot_builder_task and self._shot_builder_task.get("step") == step:
                 self._shot_builder_task["running"] = False
                 self._shot_builder_task["error"] = str(e)
+                self._notify_shot_builder_status()
 
     def run_shot_builder_step(self, step: str, force: bool) -> dict:
         """Start shot builder step in background thread"""
@@ -4969,10 +5673,10 @@ class Api:
                 return {"success": False, "error": "已有任务正在执行中"}
 
             output_dir = self._get_shot_builder_output_dir()
-            novel_path = output_dir / "novel.txt"
-            novel_text = ""
-            if novel_path.exists():
-                novel_text = novel_path.read_text(encoding="utf-8")
+            try:
+                novel_text = (output_dir / "novel.txt").read_text(encoding="utf-8")
+            except FileNotFoundError:
+                novel_text = ""
 
             # 只删除当前步骤对应的文件，不删除整个目录
             step_file_map = {
@@ -4980,29 +5684,20 @@ class Api:
                 "scene": "scenes.jsonl",
                 "shot": "shots.jsonl",
             }
-            target_file = output_dir / step_file_map[step]
-            if target_file.exists():
-                target_file.unlink()
+            (output_dir / step_file_map[step]).unlink(missing_ok=True)
             if step == "shot":
-                state_path = output_dir / "session_state.json"
-                if state_path.exists():
-                    state_path.unlink()
+                (output_dir / "session_state.json").unlink(missing_ok=True)
 
             novel_text = novel_text.strip()
             if not novel_text:
                 return {"success": False, "error": "Novel text is empty"}
 
-            self._ensure_shot_builder_prompts()
-            prompt_dir = self._get_shot_builder_prompt_dir()
-            prompt_role = (prompt_dir / "role.txt").read_text(encoding="utf-8")
-            prompt_scene = (prompt_dir / "scene.txt").read_text(encoding="utf-8")
-            prompt_shot = (prompt_dir / "shot.txt").read_text(encoding="utf-8")
+            prompts = self._load_shot_builder_prompts()
+            prompt_role = prompts["role"]
+            prompt_scene = prompts["scene"]
+            prompt_shot = prompts["shot"]
 
-            settings = self._load_settings()
-            shot_builder_cfg = settings.get("shotBuilder", {})
-            api_url = str(shot_builder_cfg.get("apiUrl", "")).strip()
-            api_key = str(shot_builder_cfg.get("apiKey", "")).strip()
-            model = str(shot_builder_cfg.get("model", "")).strip()
+            api_url, api_key, model = (str(v).strip() for v in self._get_shot_builder_llm_config())
             if not api_url or not api_key or not model:
                 return {"success": False, "error": "请在设置中配置分镜接口地址、密钥与模型"}
 
@@ -5022,12 +5717,13 @@ class Api:
                 if not roles_path.exists() or not scenes_path.exists():
                     return {"success": False, "error": "角色或场景数据不存在，请先生成"}
 
-            # Initialize task state
+            # Initialize task state (the current step's file was just removed, so it starts at 0)
             self._shot_builder_task = {
                 "step": step,
                 "running": True,
                 "error": None,
                 "outputDir": str(output_dir),
+                "counts": self._count_shot_builder_outputs(output_dir),
             }
 
             # Submit task to thread pool
@@ -5049,22 +5745,77 @@ class Api:
             logger.error(f"Failed to start shot builder step: {e}")
             return {"success": False, "error": str(e)}
 
+    def _count_jsonl_records(self, path: Path) -> int:
+        """Count non-blank lines of a JSONL file, incrementally for append-only growth
+
+        Cached per path as (size, mtime_ns, prefix_len, prefix_count, signature, total):
+        unchanged files cost one stat; grown files only read the bytes after the last
+        counted newline, once the signature bytes before it still match.
+        """
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except FileNotFoundError:
+            self._jsonl_count_cache.pop(key, None)
+            return 0
+
+        entry = self._jsonl_count_cache.get(key)
+        if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[5]
+
+        start, base, signature = 0, 0, b""
+        with open(key, "rb") as f:
+            if entry is not None and 0 < entry[2] <= st.st_size:
+                f.seek(entry[2] - len(entry[4]))
+                if f.read(len(entry[4])) == entry[4]:
+                    start, base, signature = entry[2], entry[3], entry[4]
+            f.seek(start)
+            data = f.read()
+
+        # Only complete lines go into the cached prefix; the trailing partial line is re-read next time
+        end = data.rfind(b"\n") + 1
+        prefix_count = base + _count_nonblank_lines(data, end)
+        total = prefix_count + (0 if _is_blank_line(data[end:]) else 1)
+        if end:
+            signature = data[max(0, end - 64):end]
+        self._jsonl_count_cache[key] = (st.st_size, st.st_mtime_ns, start + end, prefix_count, signature, total)
+        return total
+
+    def _count_shot_builder_outputs(self, output_dir: Path) -> dict:
+        return {
+            "roles": self._count_jsonl_records(output_dir / "roles.jsonl"),
+            "scenes": self._count_jsonl_records(output_dir / "scenes.jsonl"),
+            "shots": self._count_jsonl_records(output_dir / "shots.jsonl"),
+        }
+
+    def _notify_shot_builder_status(self):
+        """Queue the shot builder task status for the frontend (window.onShotBuilderStatus), counts taken from memory"""
+        task = self._shot_builder_task
+        if not task:
+            return
+        try:
+            status_json = json.dumps({
+                "success": True,
+                "step": task.get("step"),
+                "running": task.get("running", False),
+                "error": task.get("error"),
+                "outputDir": task.get("outputDir"),
+                "counts": dict(task["counts"]),
+            }, ensure_ascii=False)
+            self._notify_queue.put(("shot_builder", status_json))
+        except Exception as e:
+            logger.warning(f"Failed to queue shot builder status: {e}")
+
     def get_shot_builder_status(self) -> dict:
-        """Get current shot builder task status"""
+        """Get current shot builder task status (updates while running are pushed via window.onShotBuilderStatus)"""
         try:
             output_dir = self._get_shot_builder_output_dir()
 
-            def count_lines(path: Path) -> int:
-                if not path.exists():
-                    return 0
-                with open(path, "r", encoding="utf-8") as f:
-                    return sum(1 for line in f if line.strip())
-
-            counts = {
-                "roles": count_lines(output_dir / "roles.jsonl"),
-                "scenes": count_lines(output_dir / "scenes.jsonl"),
-                "shots": count_lines(output_dir / "shots.jsonl"),
-            }
+            task = self._shot_builder_task
+            if task and task.get("running") and "counts" in task:
+                counts = dict(task["counts"])
+            else:
+                counts = self._count_shot_builder_outputs(output_dir)
 
             if self._shot_builder_task:
                 return {
@@ -5093,14 +5844,14 @@ class Api:
     def get_settings(self) -> dict:
         """Get application settings"""
         try:
-            if self._settings_file.exists():
-                with open(self._settings_file, "r", encoding="utf-8") as f:
-                    settings = json.load(f)
-                logger.info("Loaded settings")
-                return {"success": True, "settings": settings}
-            else:
-                self._ensure_settings_file()
-                return self.get_settings()
+            default_settings = self._ensure_settings_file()
+            if default_settings is not None:
+                return {"success": True, "settings": default_settings}
+
+            with open(self._settings_file, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+            logger.info("Loaded settings")
+            return {"success": True, "settings": settings}
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
             return {"success": False, "error": str(e)}
@@ -5113,9 +5864,23 @@ class Api:
             with open(self._settings_file, "w", encoding="utf-8") as f:
                 json.dump(settings, f, indent=2, ensure_ascii=False)
 
+            # Prime the settings cache so the next _load_settings skips the re-read
+            # (old-format settings still go through migration on load)
+            if "apiMode" in settings or "tts" not in settings:
+                stat = self._settings_file.stat()
+                self._settings_cache = ((stat.st_mtime_ns, stat.st_size), settings)
+            else:
+                self._settings_cache = None
+
             # Update project manager work directory if changed
             if "workDir" in settings and settings["workDir"]:
                 self._project_manager.set_work_dir(Path(settings["workDir"]))
+                self._url_to_path_cache.clear()
+                self._ensured_dirs.clear()
+
+            # ffmpeg 路径变化时丢弃已解析的 ffprobe 路径
+            if self._ffprobe_path_cache and self._ffprobe_path_cache[0][0] != settings.get("ffmpegPath", ""):
+                self._ffprobe_path_cache = None
 
             # Update thread pool sizes if concurrency changed
             self._update_thread_pools(settings)
@@ -5213,12 +5978,19 @@ class Api:
 
         file_path = Path(result[0] if isinstance(result, tuple) else result)
         
-        # Verify it's an executable
-        import subprocess
+        # Verify it's an executable (skip the spawn for a binary already validated unchanged)
         try:
-            subprocess.run([str(file_path), "-version"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError, PermissionError):
-            return {"success": False, "error": "Selected file is not a valid ffmpeg executable"}
+            st = file_path.stat()
+            validated_key = (str(file_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            validated_key = None
+        if validated_key is None or validated_key not in self._validated_ffmpeg:
+            try:
+                subprocess.run([str(file_path), "-version"], capture_output=True, check=True)
+            except (subprocess.CalledProcessError, FileNotFoundError, PermissionError):
+                return {"success": False, "error": "Selected file is not a valid ffmpeg executable"}
+            if validated_key is not None:
+                self._validated_ffmpeg.add(validated_key)
 
         logger.info(f"Selected ffmpeg path: {file_path}")
         return {"success": True, "path": str(file_path)}
@@ -5227,7 +5999,7 @@ class Api:
         """Get ffmpeg executable path from settings or use system default"""
         settings = self._load_settings()
         ffmpeg_path = settings.get("ffmpegPath", "")
-        if ffmpeg_path and Path(ffmpeg_path).exists():
+        if ffmpeg_path and os.path.exists(ffmpeg_path):
             return ffmpeg_path
         return "ffmpeg"
 
@@ -5235,17 +6007,31 @@ class Api:
         """Get ffprobe executable path (derive from ffmpeg path)"""
         settings = self._load_settings()
         ffmpeg_path = settings.get("ffmpegPath", "")
-        if ffmpeg_path:
-            ffmpeg_dir = Path(ffmpeg_path).parent
-            # Try ffprobe in the same directory
-            ffprobe_path = ffmpeg_dir / "ffprobe"
-            if ffprobe_path.exists():
-                return str(ffprobe_path)
-            # Try with .exe extension on Windows
-            ffprobe_path = ffmpeg_dir / "ffprobe.exe"
-            if ffprobe_path.exists():
-                return str(ffprobe_path)
-        return "ffprobe"
+        if not ffmpeg_path:
+            return "ffprobe"
+
+        ffmpeg_dir = os.path.dirname(ffmpeg_path) or "."
+        try:
+            key = (ffmpeg_path, os.stat(ffmpeg_dir).st_mtime_ns)
+        except OSError:
+            return "ffprobe"
+        cached = self._ffprobe_path_cache
+        if cached and cached[0] == key:
+            return cached[1]
+
+        # 单次 scandir 枚举目录，优先 ffprobe，其次 Windows 下的 ffprobe.exe
+        found = {}
+        try:
+            with os.scandir(ffmpeg_dir) as it:
+                for entry in it:
+                    name = entry.name.lower()  # Windows 文件名不区分大小写
+                    if name in ("ffprobe", "ffprobe.exe") and entry.is_file():
+                        found[name] = entry.path
+        except OSError:
+            pass
+        ffprobe_path = found.get("ffprobe") or found.get("ffprobe.exe") or "ffprobe"
+        self._ffprobe_path_cache = (key, ffprobe_path)
+        return ffprobe_path
 
     def export_jianying_draft(self) -> dict:
         """Export current project to JianYing draft"""
@@ -5263,11 +6049,7 @@ class Api:
             if not jianying_path.exists():
                 return {"success": False, "error": f"JianYing draft directory does not exist: {jianying_dir}"}
 
-            # Import pycapcut
-            try:
-                import pycapcut as cc
-                from pycapcut import trange
-            except ImportError:
+            if cc is None:
                 return {"success": False, "error": "pycapcut not installed"}
 
             # Create draft folder
@@ -5286,83 +6068,82 @@ class Api:
             text_current_time = 0.0
             shots = self.project_data.get("shots", [])
 
+            # Resolve media paths up front, then check existence with one scandir per directory
+            shot_paths = []
             for shot in shots:
+                selected_video_index = shot.get("selectedVideoIndex", 0)
+                videos = shot.get("videos", [])
+                video_path = None
+                if videos and selected_video_index < len(videos):
+                    video_path = self._url_to_path(videos[selected_video_index])
+                audio_url = shot.get("audioUrl", "")
+                audio_path = self._url_to_path(audio_url) if audio_url else None
+                shot_paths.append((video_path, audio_path))
+            existing = _existing_paths(p for pair in shot_paths for p in pair if p)
+
+            jobs = []  # (shot, shot_id, video_path, audio_path) for shots with usable media
+            for shot, (video_path, audio_path) in zip(shots, shot_paths):
                 shot_id = shot.get("id")
                 if not shot_id:
                     continue
 
                 # Get selected video path
-                selected_video_index = shot.get("selectedVideoIndex", 0)
                 videos = shot.get("videos", [])
-                if not videos or selected_video_index >= len(videos):
+                if not videos or shot.get("selectedVideoIndex", 0) >= len(videos):
                     logger.warning(f"Shot {shot_id} has no video, skipping")
                     continue
 
-                video_url = videos[selected_video_index]
-                video_path = self._url_to_path(video_url)
-                if not video_path or not Path(video_path).exists():
+                if not video_path or _norm_path(video_path) not in existing:
                     logger.warning(f"Video file not found for shot {shot_id}: {video_path}")
                     continue
 
                 # Get audio path
-                audio_url = shot.get("audioUrl", "")
-                audio_path = None
-                if audio_url:
-                    audio_path = self._url_to_path(audio_url)
-                    if not audio_path or not Path(audio_path).exists():
+                if shot.get("audioUrl", ""):
+                    if not audio_path or _norm_path(audio_path) not in existing:
                         logger.warning(f"Audio file not found for shot {shot_id}: {audio_path}")
                         audio_path = None
 
+                jobs.append((shot, shot_id, video_path, audio_path))
+
+            # Probe media materials in parallel (I/O bound); draft mutation below stays sequential
+            def probe_materials(video_path: str, audio_path: Optional[str]) -> tuple:
+                video_material = cc.VideoMaterial(video_path)
+                audio_material, audio_error = None, None
+                if audio_path:
+                    try:
+                        audio_material = cc.AudioMaterial(audio_path)
+                    except Exception as e:
+                        audio_error = e
+                return video_material, audio_material, audio_error
+
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(jobs))), thread_name_prefix="jianying-probe") as pool:
+                futures = [pool.submit(probe_materials, job[2], job[3]) for job in jobs]
+
+            for (shot, shot_id, video_path, audio_path), future in zip(jobs, futures):
+                # 每个镜头的日志汇总成一条输出，避免热循环里逐行调用 logger
+                log_lines: list[str] = []
                 # Get video duration using pycapcut
                 try:
-                    video_material = cc.VideoMaterial(video_path)
+                    video_material, audio_material, audio_error = future.result()
                     # Duration is in microseconds, convert to seconds
                     video_duration = video_material.duration / 1_000_000
 
                     # Get audio duration if available
                     audio_duration = None
                     if audio_path:
-                        try:
-                            audio_material = cc.AudioMaterial(audio_path)
+                        if audio_error is None:
                             # Duration is in microseconds, convert to seconds
                             audio_duration = audio_material.duration / 1_000_000
-                        except Exception as e:
-                            logger.warning(f"Failed to load audio for shot {shot_id}: {e}")
+                        else:
+                            logger.warning(f"Failed to load audio for shot {shot_id}: {audio_error}")
                             audio_path = None
 
-                    # Get custom video settings if saved
-                    custom_speed = shot.get("videoSpeed")
-                    custom_audio_offset = shot.get("audioOffset", 0.0)
-                    custom_audio_speed = shot.get("audioSpeed", 1.0)
-                    custom_audio_trim_start = shot.get("audioTrimStart", 0.0)
-                    custom_audio_trim_end = shot.get("audioTrimEnd")  # None means use full audio
-                    
-                    # Convert from string if necessary (frontend may send as string)
-                    if isinstance(custom_speed, str):
-                        try:
-                            custom_speed = float(custom_speed)
-                        except (ValueError, TypeError):
-                            custom_speed = None
-                    if isinstance(custom_audio_offset, str):
-                        try:
-                            custom_audio_offset = float(custom_audio_offset)
-                        except (ValueError, TypeError):
-                            custom_audio_offset = 0.0
-                    if isinstance(custom_audio_speed, str):
-                        try:
-                            custom_audio_speed = float(custom_audio_speed)
-                        except (ValueError, TypeError):
-                            custom_audio_speed = 1.0
-                    if isinstance(custom_audio_trim_start, str):
-                        try:
-                            custom_audio_trim_start = float(custom_audio_trim_start)
-                        except (ValueError, TypeError):
-                            custom_audio_trim_start = 0.0
-                    if isinstance(custom_audio_trim_end, str):
-                        try:
-                            custom_audio_trim_end = float(custom_audio_trim_end)
-                        except (ValueError, TypeError):
-                            custom_audio_trim_end = None
+                    # Get custom video settings if saved (frontend may send numbers as strings)
+                    custom_speed = _coerce_float(shot.get("videoSpeed"), None)
+                    custom_audio_offset = _coerce_float(shot.get("audioOffset"), 0.0)
+                    custom_audio_speed = _coerce_float(shot.get("audioSpeed"), 1.0)
+                    custom_audio_trim_start = _coerce_float(shot.get("audioTrimStart"), 0.0)
+                    custom_audio_trim_end = _coerce_float(shot.get("audioTrimEnd"), None)  # None means use full audio
                     
                     # Clamp audio speed to valid range
                     custom_audio_speed = max(0.5, min(2.0, custom_audio_speed))
@@ -5371,20 +6152,20 @@ class Api:
                     is_edited = shot.get('videoSpeed') is not None or shot.get('audioSpeed') is not None or shot.get('audioOffset') is not None or shot.get('audioTrimStart') is not None or shot.get('audioTrimEnd') is not None
                     
                     if is_edited:
-                        logger.info(f"===== 镜头 {shot_id} [已编辑] =====")
-                        logger.info(f"  原始参数:")
-                        logger.info(f"    视频倍速: {shot.get('videoSpeed')}")
-                        logger.info(f"    音频倍速: {shot.get('audioSpeed')}")
-                        logger.info(f"    音频偏移: {shot.get('audioOffset')}")
-                        logger.info(f"    音频裁剪起点: {shot.get('audioTrimStart')}")
-                        logger.info(f"    音频裁剪终点: {shot.get('audioTrimEnd')}")
-                        logger.info(f"  解析后参数:")
-                        logger.info(f"    视频倍速: {custom_speed}")
-                        logger.info(f"    音频倍速: {custom_audio_speed}")
-                        logger.info(f"    音频偏移: {custom_audio_offset}")
-                        logger.info(f"    音频裁剪: {custom_audio_trim_start} - {custom_audio_trim_end}")
+                        log_lines.append(f"===== 镜头 {shot_id} [已编辑] =====")
+                        log_lines.append(f"  原始参数:")
+                        log_lines.append(f"    视频倍速: {shot.get('videoSpeed')}")
+                        log_lines.append(f"    音频倍速: {shot.get('audioSpeed')}")
+                        log_lines.append(f"    音频偏移: {shot.get('audioOffset')}")
+                        log_lines.append(f"    音频裁剪起点: {shot.get('audioTrimStart')}")
+                        log_lines.append(f"    音频裁剪终点: {shot.get('audioTrimEnd')}")
+                        log_lines.append(f"  解析后参数:")
+                        log_lines.append(f"    视频倍速: {custom_speed}")
+                        log_lines.append(f"    音频倍速: {custom_audio_speed}")
+                        log_lines.append(f"    音频偏移: {custom_audio_offset}")
+                        log_lines.append(f"    音频裁剪: {custom_audio_trim_start} - {custom_audio_trim_end}")
                     else:
-                        logger.info(f"===== 镜头 {shot_id} [未编辑] =====")
+                        log_lines.append(f"===== 镜头 {shot_id} [未编辑] =====")
 
                     # Determine segment duration and video settings
                     if audio_duration is not None:
@@ -5400,13 +6181,13 @@ class Api:
                         effective_audio_duration = trimmed_audio_duration / custom_audio_speed
                         
                         if is_edited:
-                            logger.info(f"  素材时长:")
-                            logger.info(f"    视频原始时长: {video_duration:.2f}s")
-                            logger.info(f"    音频原始时长: {audio_duration:.2f}s")
-                            logger.info(f"  计算结果:")
-                            logger.info(f"    音频裁剪范围: {trim_start:.2f}s - {trim_end:.2f}s")
-                            logger.info(f"    裁剪后音频时长: {trimmed_audio_duration:.2f}s")
-                            logger.info(f"    倍速后音频时长: {trimmed_audio_duration:.2f}s / {custom_audio_speed:.2f}x = {effective_audio_duration:.2f}s")
+                            log_lines.append(f"  素材时长:")
+                            log_lines.append(f"    视频原始时长: {video_duration:.2f}s")
+                            log_lines.append(f"    音频原始时长: {audio_duration:.2f}s")
+                            log_lines.append(f"  计算结果:")
+                            log_lines.append(f"    音频裁剪范围: {trim_start:.2f}s - {trim_end:.2f}s")
+                            log_lines.append(f"    裁剪后音频时长: {trimmed_audio_duration:.2f}s")
+                            log_lines.append(f"    倍速后音频时长: {trimmed_audio_duration:.2f}s / {custom_audio_speed:.2f}x = {effective_audio_duration:.2f}s")
                         
                         # 时间精度处理函数（对齐到 0.01s）
                         # target 用 round，source 用 floor 确保不超出素材时长
@@ -5421,11 +6202,11 @@ class Api:
                         # 计算视频倍速（统一逻辑，无论是否编辑过）
                         if custom_speed is not None and 0.5 <= custom_speed <= 3.0:
                             video_speed = custom_speed
-                            logger.info(f"    使用自定义视频倍速: {video_speed:.2f}x")
+                            log_lines.append(f"    使用自定义视频倍速: {video_speed:.2f}x")
                         else:
                             video_speed = video_duration / segment_duration
                             video_speed = max(0.5, min(3.0, video_speed))
-                            logger.info(f"    自动计算视频倍速: {video_duration:.2f}s / {segment_duration:.2f}s = {video_speed:.2f}x")
+                            log_lines.append(f"    自动计算视频倍速: {video_duration:.2f}s / {segment_duration:.2f}s = {video_speed:.2f}x")
                         
                         # 视频 source 计算（统一逻辑），使用 floor 确保不超出素材时长
                         video_source_start = floor_time(custom_audio_offset * video_speed)
@@ -5446,8 +6227,8 @@ class Api:
                         video_target_start = align_time(video_current_time)
                         audio_target_start = align_time(audio_current_time)
                         
-                        logger.info(f"  视频: target=[{video_target_start:.2f}s, {segment_duration:.2f}s], source=[{video_source_start:.2f}s, {video_source_duration:.2f}s], speed={video_speed:.3f}x")
-                        logger.info(f"  音频: target=[{audio_target_start:.2f}s, {segment_duration:.2f}s], source=[{audio_source_start:.2f}s, {audio_source_duration:.2f}s], speed={custom_audio_speed:.3f}x")
+                        log_lines.append(f"  视频: target=[{video_target_start:.2f}s, {segment_duration:.2f}s], source=[{video_source_start:.2f}s, {video_source_duration:.2f}s], speed={video_speed:.3f}x")
+                        log_lines.append(f"  音频: target=[{audio_target_start:.2f}s, {segment_duration:.2f}s], source=[{audio_source_start:.2f}s, {audio_source_duration:.2f}s], speed={custom_audio_speed:.3f}x")
                         
                         # 创建并添加视频片段
                         video_segment = cc.VideoSegment(
@@ -5471,7 +6252,7 @@ class Api:
                             script.add_segment(audio_segment)
                             audio_current_time = align_time(audio_target_start + segment_duration)
                         
-                        logger.info(f"  下一起点: video={video_current_time:.2f}s, audio={audio_current_time:.2f}s")
+                        log_lines.append(f"  下一起点: video={video_current_time:.2f}s, audio={audio_current_time:.2f}s")
                         
                     else:
                         # No audio: use video duration
@@ -5483,7 +6264,7 @@ class Api:
                         video_source_duration = align_time(video_duration - 0.01)
                         video_target_start = align_time(video_current_time)
                         
-                        logger.info(f"  无音频, 视频: target=[{video_target_start:.2f}s, {segment_duration:.2f}s]")
+                        log_lines.append(f"  无音频, 视频: target=[{video_target_start:.2f}s, {segment_duration:.2f}s]")
                         
                         video_segment = cc.VideoSegment(
                             video_material,
@@ -5508,7 +6289,11 @@ class Api:
                         script.add_segment(text_segment)
                         text_current_time = align_time(text_target_start + segment_duration)
 
+                    logger.info("\n".join(log_lines))
+
                 except Exception as e:
+                    if log_lines:
+                        logger.info("\n".join(log_lines))
                     logger.error(f"Failed to process shot {shot_id}: {e}")
                     raise  # 不允许异常后继续，必须正确
 
@@ -5536,19 +6321,17 @@ class Api:
 
             # Collect audio files and build SRT content
             srt_entries = []
-            audio_segments = []
+            audio_paths = []
             current_time = 0.0
             entry_index = 1
 
-            from pydub import AudioSegment
-
             for shot in shots:
                 audio_url = shot.get("audioUrl", "")
                 if not audio_url:
                     continue
 
                 audio_path = self._url_to_path(audio_url)
-                if not audio_path or not Path(audio_path).exists():
+                if not audio_path or not os.path.exists(audio_path):
                     logger.warning(f"Audio file not found: {audio_path}")
                     continue
 
@@ -5567,15 +6350,13 @@ class Api:
                 if not text_lines:
                     continue
 
-                # Load audio to get duration
-                try:
-                    audio_segment = AudioSegment.from_file(audio_path)
-                    duration = len(audio_segment) / 1000.0  # ms to seconds
-                except Exception as e:
-                    logger.warning(f"Failed to load audio {audio_path}: {e}")
+                # Read duration from the file header only; audio is decoded once after the save dialog
+                duration = self._get_media_duration(audio_path)
+                if duration is None:
+                    logger.warning(f"Failed to load audio {audio_path}")
                     continue
 
-                audio_segments.append(audio_segment)
+                audio_paths.append(audio_path)
 
                 # Build SRT entry
                 start_time = current_time
@@ -5596,22 +6377,18 @@ class Api:
 
             # Generate SRT content
             def format_srt_time(seconds: float) -> str:
-                hours = int(seconds // 3600)
-                minutes = int((seconds % 3600) // 60)
-                secs = int(seconds % 60)
-                millis = int((seconds % 1) * 1000)
+                # Integer divmod on milliseconds instead of repeated float modulo
+                secs, millis = divmod(int(seconds * 1000), 1000)
+                minutes, secs = divmod(secs, 60)
+                hours, minutes = divmod(minutes, 60)
                 return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
-            srt_content = ""
-            for entry in srt_entries:
-                srt_content += f"{entry['index']}\n"
-                srt_content += f"{format_srt_time(entry['start'])} --> {format_srt_time(entry['end'])}\n"
-                srt_content += f"{entry['text']}\n\n"
-
-            # Concatenate audio segments
-            combined_audio = audio_segments[0]
-            for segment in audio_segments[1:]:
-                combined_audio += segment
+            srt_content = "".join(
+                f"{entry['index']}\n"
+                f"{format_srt_time(entry['start'])} --> {format_srt_time(entry['end'])}\n"
+                f"{entry['text']}\n\n"
+                for entry in srt_entries
+            )
 
             # Show save dialog for SRT file
             srt_result = self._window.create_file_dialog(
@@ -5632,8 +6409,8 @@ class Api:
             with open(srt_path, "w", encoding="utf-8") as f:
                 f.write(srt_content)
 
-            # Export combined audio as WAV
-            combined_audio.export(str(wav_path), format="wav")
+            # Export combined audio as WAV, streamed file by file
+            write_wav_files(audio_paths, wav_path)
 
             logger.info(f"Exported SRT to: {srt_path}")
             logger.info(f"Exported WAV to: {wav_path}")
@@ -5699,7 +6476,6 @@ class Api:
             return {"success": False, "error": str(e)}
 
     # Export state
-    _export_cancel_flag: bool = False
     _export_thread: Optional[Any] = None
 
     def export_final_video(self, with_subtitles: bool = True) -> dict:
@@ -5708,8 +6484,6 @@ class Api:
         Args:
             with_subtitles: Whether to burn subtitles into the video
         """
-        import subprocess
-        
         try:
             if not self.project_data or not self.project_name:
                 return {"success": False, "error": "No project loaded"}
@@ -5743,11 +6517,10 @@ class Api:
             if not output_path.suffix:
                 output_path = output_path.with_suffix(".mp4")
 
-            # Reset cancel flag and start export thread
-            self._export_cancel_flag = False
+            # Reset cancel event and start export thread
+            self._export_cancel_event.clear()
             ffprobe_path = self._get_ffprobe_path()
             
-            import threading
             self._export_thread = threading.Thread(
                 target=self._export_final_video_worker,
                 args=(shots, str(output_path), with_subtitles, ffmpeg_path, ffprobe_path),
@@ -5763,23 +6536,19 @@ class Api:
 
     def cancel_export_final_video(self) -> dict:
         """Cancel the ongoing export"""
-        self._export_cancel_flag = True
+        self._export_cancel_event.set()
         logger.info("Export cancellation requested")
         return {"success": True}
 
     def _notify_export_progress(self, stage: str, current: int, total: int, message: str) -> None:
-        """Notify frontend about export progress"""
-        try:
-            if self._window:
-                progress_json = json.dumps({
-                    "stage": stage,
-                    "current": current,
-                    "total": total,
-                    "message": message
-                })
-                self._window.evaluate_js(f'window.onExportProgress && window.onExportProgress({progress_json})')
-        except Exception as e:
-            logger.warning(f"Failed to notify export progress: {e}")
+        """Queue an export progress update; the notify flusher pushes only the latest one per ~50ms"""
+        progress_json = json.dumps({
+            "stage": stage,
+            "current": current,
+            "total": total,
+            "message": message
+        })
+        self._notify_queue.put(("export", progress_json))
 
     def _export_final_video_worker(self, shots: list, output_path: str, with_subtitles: bool = True, ffmpeg_path: str = "ffmpeg", ffprobe_path: str = "ffprobe") -> None:
         """Worker thread for exporting final video
@@ -5793,14 +6562,13 @@ class Api:
         """
         import tempfile
         import shutil
-        import subprocess
         
         temp_dir = None
         try:
-            # Count valid shots first
+            # Collect valid shots in one pass, resolving each media path and checking it only once
             valid_shots = []
             for shot in shots:
-                if self._export_cancel_flag:
+                if self._export_cancel_event.is_set():
                     self._notify_export_progress("cancelled", 0, 0, "Export cancelled by user")
                     return
                     
@@ -5811,10 +6579,14 @@ class Api:
                 videos = shot.get("videos", [])
                 if not videos or selected_video_index >= len(videos):
                     continue
-                video_url = videos[selected_video_index]
-                video_path = self._url_to_path(video_url)
-                if video_path and Path(video_path).exists():
-                    valid_shots.append(shot)
+                video_path = self._url_to_path(videos[selected_video_index])
+                if not video_path or not os.path.exists(video_path):
+                    continue
+                audio_url = shot.get("audioUrl", "")
+                audio_path = self._url_to_path(audio_url) if audio_url else None
+                if audio_path and not os.path.exists(audio_path):
+                    audio_path = None
+                valid_shots.append({"shot": shot, "video_path": video_path, "audio_path": audio_path})
 
             total_shots = len(valid_shots)
             if total_shots == 0:
@@ -5824,39 +6596,42 @@ class Api:
             self._notify_export_progress("preparing", 0, total_shots, "Preparing export...")
 
             # Create temp directory for intermediate files
-            temp_dir = Path(tempfile.mkdtemp(prefix="hetangai_export_"))
+            # Linux 上优先放到 tmpfs（/dev/shm），中间片段读写不落盘；剩余空间不足时回退到默认临时目录
+            temp_root = None
+            if os.path.isdir("/dev/shm"):
+                try:
+                    if shutil.disk_usage("/dev/shm").free >= EXPORT_TMPFS_MIN_FREE:
+                        temp_root = "/dev/shm"
+                except OSError:
+                    pass
+            # 临时目录及其中的文件路径都直接用 str，传给 ffmpeg 时无需反复 Path -> str 转换
+            temp_dir = tempfile.mkdtemp(prefix="hetangai_export_", dir=temp_root)
             logger.info(f"Created temp directory: {temp_dir}")
 
-            # Process each shot and collect segments
-            segment_files = []
-            srt_entries = []
-            current_time = 0.0
-            entry_index = 1
+            # 预先批量探测所有素材时长（单个 ffmpeg 进程读取多个文件，按 mtime 缓存，重复导出不再启动子进程）
+            media_paths = []
+            for rec in valid_shots:
+                media_paths.append(rec["video_path"])
+                if rec["audio_path"]:
+                    media_paths.append(rec["audio_path"])
+            durations = self._get_media_durations_batch(media_paths, ffprobe_path, ffmpeg_path)
+
+            # 阶段一（串行，开销小）：计算每个镜头的片段参数
+            segment_jobs = []
 
-            for shot_idx, shot in enumerate(valid_shots):
-                if self._export_cancel_flag:
+            for shot_idx, rec in enumerate(valid_shots):
+                if self._export_cancel_event.is_set():
                     self._notify_export_progress("cancelled", shot_idx, total_shots, "Export cancelled by user")
                     return
 
+                shot = rec["shot"]
                 shot_id = shot.get("id")
-                self._notify_export_progress("processing", shot_idx, total_shots, f"Processing shot {shot_idx + 1}/{total_shots}")
-
-                # Get selected video path
-                selected_video_index = shot.get("selectedVideoIndex", 0)
-                videos = shot.get("videos", [])
-                video_url = videos[selected_video_index]
-                video_path = self._url_to_path(video_url)
-
-                # Get audio path
-                audio_url = shot.get("audioUrl", "")
-                audio_path = None
-                if audio_url:
-                    audio_path = self._url_to_path(audio_url)
-                    if not audio_path or not Path(audio_path).exists():
-                        audio_path = None
+                video_path = rec["video_path"]
+                audio_path = rec["audio_path"]
+                self._notify_export_progress("preparing", shot_idx, total_shots, f"Preparing shot {shot_idx + 1}/{total_shots}")
 
-                # Get video duration using ffprobe
-                video_duration = self._get_media_duration(video_path, ffprobe_path)
+                # Get video duration (probed above)
+                video_duration = durations.get(video_path)
                 if video_duration is None:
                     logger.warning(f"Failed to get video duration for shot {shot_id}")
                     continue
@@ -5864,43 +6639,16 @@ class Api:
                 # Get audio duration if available
                 audio_duration = None
                 if audio_path:
-                    audio_duration = self._get_media_duration(audio_path, ffprobe_path)
+                    audio_duration = durations.get(audio_path)
                     if audio_duration is None:
                         audio_path = None
 
-                # Get custom video settings
-                custom_speed = shot.get("videoSpeed")
-                custom_audio_offset = shot.get("audioOffset", 0.0)
-                custom_audio_speed = shot.get("audioSpeed", 1.0)
-                custom_audio_trim_start = shot.get("audioTrimStart", 0.0)
-                custom_audio_trim_end = shot.get("audioTrimEnd")
-
-                # Convert from string if necessary
-                if isinstance(custom_speed, str):
-                    try:
-                        custom_speed = float(custom_speed)
-                    except (ValueError, TypeError):
-                        custom_speed = None
-                if isinstance(custom_audio_offset, str):
-                    try:
-                        custom_audio_offset = float(custom_audio_offset)
-                    except (ValueError, TypeError):
-                        custom_audio_offset = 0.0
-                if isinstance(custom_audio_speed, str):
-                    try:
-                        custom_audio_speed = float(custom_audio_speed)
-                    except (ValueError, TypeError):
-                        custom_audio_speed = 1.0
-                if isinstance(custom_audio_trim_start, str):
-                    try:
-                        custom_audio_trim_start = float(custom_audio_trim_start)
-                    except (ValueError, TypeError):
-                        custom_audio_trim_start = 0.0
-                if isinstance(custom_audio_trim_end, str):
-                    try:
-                        custom_audio_trim_end = float(custom_audio_trim_end)
-                    except (ValueError, TypeError):
-                        custom_audio_trim_end = None
+                # Get custom video settings (frontend may send numbers as strings)
+                custom_speed = _coerce_float(shot.get("videoSpeed"), None)
+                custom_audio_offset = _coerce_float(shot.get("audioOffset"), 0.0)
+                custom_audio_speed = _coerce_float(shot.get("audioSpeed"), 1.0)
+                custom_audio_trim_start = _coerce_float(shot.get("audioTrimStart"), 0.0)
+                custom_audio_trim_end = _coerce_float(shot.get("audioTrimEnd"), None)
 
                 # Clamp audio speed to valid range
                 custom_audio_speed = max(0.5, min(2.0, custom_audio_speed))
@@ -5931,41 +6679,9 @@ class Api:
                     trimmed_audio_duration = 0.0
                     custom_audio_speed = 1.0
 
-                logger.info(f"Processing shot {shot_id}: duration={segment_duration:.2f}s, video_speed={video_speed:.2f}x")
-
-                # Create segment file
-                segment_file = temp_dir / f"segment_{shot_idx:04d}.mp4"
-                
-                if audio_path and audio_duration is not None:
-                    success = self._create_segment_with_audio(
-                        video_path=video_path,
-                        audio_path=audio_path,
-                        output_path=str(segment_file),
-                        video_speed=video_speed,
-                        video_start=video_source_start,
-                        segment_duration=segment_duration,
-                        audio_speed=custom_audio_speed,
-                        audio_trim_start=trim_start,
-                        audio_trim_duration=trimmed_audio_duration,
-                        ffmpeg_path=ffmpeg_path
-                    )
-                else:
-                    success = self._create_segment_without_audio(
-                        video_path=video_path,
-                        output_path=str(segment_file),
-                        video_speed=video_speed,
-                        video_start=video_source_start,
-                        segment_duration=segment_duration,
-                        ffmpeg_path=ffmpeg_path
-                    )
-
-                if not success:
-                    logger.error(f"Failed to create segment for shot {shot_id}")
-                    continue
+                logger.info("Processing shot {}: duration={:.2f}s, video_speed={:.2f}x", shot_id, segment_duration, video_speed)
 
-                segment_files.append(str(segment_file))
-
-                # Build subtitle entry
+                # Build subtitle text
                 dialogues = shot.get("dialogues", [])
                 if not dialogues and shot.get("script"):
                     script_text = shot["script"]
@@ -5974,21 +6690,132 @@ class Api:
                     text_lines = [script_text.strip()] if script_text.strip() else []
                 else:
                     text_lines = [d.get("text", "").strip() for d in dialogues if d.get("text", "").strip()]
-                
-                script_text = " ".join(text_lines)
 
-                if script_text:
+                segment_jobs.append({
+                    "shot_id": shot_id,
+                    "segment_file": os.path.join(temp_dir, f"segment_{shot_idx:04d}.mp4"),
+                    "video_path": video_path,
+                    "video_duration": video_duration,
+                    "audio_path": audio_path if audio_duration is not None else None,
+                    "video_speed": video_speed,
+                    "video_start": video_source_start,
+                    "segment_duration": segment_duration,
+                    "audio_speed": custom_audio_speed,
+                    "audio_trim_start": trim_start,
+                    "audio_trim_duration": trimmed_audio_duration,
+                    "script_text": " ".join(text_lines),
+                })
+
+            # 有可用硬件编码器时替代 libx264
+            hw_encoder_args = self._get_hw_video_encoder_args(ffmpeg_path)
+            segment_codec_args = list(hw_encoder_args) if hw_encoder_args else ["-c:v", "libx264", "-preset", "fast", "-crf", "18"]
+            final_codec_args = list(hw_encoder_args) if hw_encoder_args else ["-c:v", "libx264", "-preset", "medium", "-crf", "18"]
+
+            # 未做变速/裁剪的镜头可直接复制视频流；仅在最终会整体重新编码（烧录字幕）时启用，
+            # 否则 concat -c copy 会把编码参数不一致的片段拼在一起。
+            # 复制的片段与编码器输出的 profile、SPS/PPS 无法保证一致，而 concat 分离器按第一个片段
+            # 初始化解码器，因此只有全部镜头都可复制、且源视频格式（H.264、分辨率、像素格式、帧率、
+            # profile）完全相同时才复制，不与重新编码的片段混用
+            for job in segment_jobs:
+                job["stream_copy"] = False
+            if with_subtitles and segment_jobs and any(job["script_text"] for job in segment_jobs):
+                def can_copy(job: dict) -> bool:
+                    if job["video_speed"] != 1.0 or job["video_start"] >= 0.05:
+                        return False
+                    # 源视频短于片段时复制会缩短片段（重新编码路径保持片段时长），字幕时间轴随之错位
+                    if job["video_duration"] < job["segment_duration"] - 0.05:
+                        return False
+                    if job["audio_path"]:
+                        return (job["audio_speed"] == 1.0 and job["audio_trim_start"] < 0.05
+                                and abs(job["audio_trim_duration"] - job["segment_duration"]) < 0.1)
+                    return True
+
+                if all(can_copy(job) for job in segment_jobs):
+                    probe_paths = list(dict.fromkeys(job["video_path"] for job in segment_jobs))
+                    with ThreadPoolExecutor(max_workers=min(8, len(probe_paths)), thread_name_prefix="ffprobe") as probe_pool:
+                        stream_infos = set(probe_pool.map(lambda p: self._get_video_stream_info(p, ffprobe_path), probe_paths))
+                    reference = stream_infos.pop() if len(stream_infos) == 1 else None
+                    if reference and reference[0] == "h264":
+                        for job in segment_jobs:
+                            job["stream_copy"] = True
+                    else:
+                        logger.info("Shots re-encoded: source videos differ in format")
+
+            # 阶段二（并行）：各片段编码互不依赖，ffmpeg 在子进程中运行不受 GIL 限制
+            total_jobs = len(segment_jobs)
+            cpu_count = os.cpu_count() or 2
+            max_workers = max(1, min(total_jobs, cpu_count // 2))
+            if hw_encoder_args:
+                max_workers = min(max_workers, 3)  # 消费级显卡限制同时编码会话数
+            ffmpeg_threads = max(1, cpu_count // max_workers)  # 避免多个编码器抢占同一批核心
+
+            def create_segment(job: dict) -> bool:
+                if job["audio_path"]:
+                    return self._create_segment_with_audio(
+                        video_path=job["video_path"],
+                        audio_path=job["audio_path"],
+                        output_path=job["segment_file"],
+                        video_speed=job["video_speed"],
+                        video_start=job["video_start"],
+                        segment_duration=job["segment_duration"],
+                        audio_speed=job["audio_speed"],
+                        audio_trim_start=job["audio_trim_start"],
+                        audio_trim_duration=job["audio_trim_duration"],
+                        ffmpeg_path=ffmpeg_path,
+                        threads=ffmpeg_threads,
+                        video_codec_args=segment_codec_args,
+                        allow_stream_copy=job["stream_copy"]
+                    )
+                return self._create_segment_without_audio(
+                    video_path=job["video_path"],
+                    output_path=job["segment_file"],
+                    video_speed=job["video_speed"],
+                    video_start=job["video_start"],
+                    segment_duration=job["segment_duration"],
+                    ffmpeg_path=ffmpeg_path,
+                    threads=ffmpeg_threads,
+                    video_codec_args=segment_codec_args,
+                    allow_stream_copy=job["stream_copy"]
+                )
+
+            self._notify_export_progress("processing", 0, total_jobs, f"Encoding {total_jobs} segments...")
+            pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export-segment")
+            try:
+                future_to_job = {pool.submit(create_segment, job): job for job in segment_jobs}
+                completed = 0
+                for future in as_completed(future_to_job):
+                    job = future_to_job[future]
+                    job["success"] = future.result()
+                    if not job["success"] and not self._export_cancel_event.is_set():
+                        logger.error(f"Failed to create segment for shot {job['shot_id']}")
+                    completed += 1
+                    self._notify_export_progress("processing", completed, total_jobs, f"Processed shot {completed}/{total_jobs}")
+                    if self._export_cancel_event.is_set():
+                        break
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+            # 阶段三：按镜头顺序收集成功的片段并生成字幕时间轴
+            segment_files = []
+            srt_entries = []
+            current_time = 0.0
+            entry_index = 1
+            for job in segment_jobs:
+                if not job.get("success"):
+                    continue
+                segment_files.append(job["segment_file"])
+                segment_duration = job["segment_duration"]
+                if job["script_text"]:
                     srt_entries.append({
                         "index": entry_index,
                         "start": current_time,
                         "end": current_time + segment_duration,
-                        "text": script_text
+                        "text": job["script_text"]
                     })
                     entry_index += 1
-
                 current_time += segment_duration
 
-            if self._export_cancel_flag:
+            if self._export_cancel_event.is_set():
                 self._notify_export_progress("cancelled", total_shots, total_shots, "Export cancelled by user")
                 return
 
@@ -5999,64 +6826,87 @@ class Api:
             # Merge segments
             self._notify_export_progress("merging", total_shots, total_shots, "Merging video segments...")
 
-            concat_list_file = temp_dir / "concat_list.txt"
+            # concat demuxer 打开时会一次性解析整个列表，无法边编码边追加片段，
+            # 因此合并只能在所有片段完成后开始（片段本身已并行编码）
+            concat_list_file = os.path.join(temp_dir, "concat_list.txt")
             with open(concat_list_file, "w", encoding="utf-8") as f:
-                for seg_file in segment_files:
-                    escaped_path = seg_file.replace("'", "'\\''")
-                    f.write(f"file '{escaped_path}'\n")
-
-            concat_output = temp_dir / "concat_output.mp4"
-            concat_cmd = [
-                ffmpeg_path, "-y",
-                "-f", "concat",
-                "-safe", "0",
-                "-i", str(concat_list_file),
-                "-c", "copy",
-                str(concat_output)
-            ]
-            logger.info(f"Concatenating segments: {' '.join(concat_cmd)}")
-            result = subprocess.run(concat_cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"Concat failed: {result.stderr}")
-                self._notify_export_progress("error", 0, 0, f"Failed to merge: {result.stderr[:100]}")
-                return
+                f.writelines(
+                    "file '{}'\n".format(seg_file.replace("'", "'\\''")) for seg_file in segment_files
+                )
 
-            if self._export_cancel_flag:
-                self._notify_export_progress("cancelled", total_shots, total_shots, "Export cancelled by user")
-                return
+            if with_subtitles and not srt_entries:
+                logger.warning("Subtitle burn skipped: no dialogue in any shot")
 
-            if with_subtitles:
-                # Burn subtitles
-                self._notify_export_progress("subtitles", total_shots, total_shots, "Burning subtitles...")
+            if with_subtitles and srt_entries:
+                # 合并与烧录字幕在同一次 ffmpeg 调用中完成，省去中间的 concat_output.mp4
+                self._notify_export_progress("subtitles", 0, total_shots, "Merging segments and burning subtitles...")
 
-                ass_file = temp_dir / "subtitles.ass"
-                self._generate_ass_file(srt_entries, str(ass_file))
+                ass_file = os.path.join(temp_dir, "subtitles.ass")
+                self._generate_ass_file(srt_entries, ass_file)
 
-                ass_path_escaped = str(ass_file).replace("\\", "/").replace(":", "\\:")
+                ass_path_escaped = ass_file.replace("\\", "/").replace(":", "\\:")
                 subtitle_cmd = [
                     ffmpeg_path, "-y",
-                    "-i", str(concat_output),
+                    "-f", "concat",
+                    "-safe", "0",
+                    "-i", concat_list_file,
                     "-vf", f"ass={ass_path_escaped}",
-                    "-c:v", "libx264",
-                    "-preset", "medium",
-                    "-crf", "18",
+                    *final_codec_args,
                     "-c:a", "aac",
                     "-b:a", "192k",
                     output_path
                 ]
                 logger.info(f"Burning subtitles: {' '.join(subtitle_cmd)}")
-                result = subprocess.run(subtitle_cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    logger.error(f"Subtitle burn failed: {result.stderr}")
-                    self._notify_export_progress("error", 0, 0, f"Failed to burn subtitles: {result.stderr[:100]}")
+                total_ms = max(1, int(current_time * 1000))
+
+                def on_burn_progress(encoded_seconds: float) -> None:
+                    self._notify_export_progress(
+                        "subtitles", min(total_ms, int(encoded_seconds * 1000)), total_ms,
+                        f"Burning subtitles... {encoded_seconds:.0f}s / {current_time:.0f}s"
+                    )
+
+                success, error = self._run_ffmpeg(subtitle_cmd, os.path.join(temp_dir, "subtitles.log"), on_burn_progress)
+                # 取消时 ffmpeg 已被终止，交给下方统一清理未完成的输出文件
+                if not success and not self._export_cancel_event.is_set():
+                    logger.error(f"Subtitle burn failed: {error}")
+                    self._notify_export_progress("error", 0, 0, f"Failed to burn subtitles: {error[-100:]}")
                     return
             else:
-                # No subtitles - just copy the concat output to final location
-                self._notify_export_progress("subtitles", total_shots, total_shots, "Finalizing video...")
-                import shutil as shutil_copy
-                shutil_copy.copy2(str(concat_output), output_path)
+                # No subtitles - stream copy the segments into a temp file next to the output,
+                # then rename it into place (same directory, so no multi-GB copy)
+                output_dir, output_name = os.path.split(output_path)
+                concat_output = os.path.join(output_dir, f".{output_name}.part.mp4")
+                concat_cmd = [
+                    ffmpeg_path, "-y",
+                    "-f", "concat",
+                    "-safe", "0",
+                    "-i", concat_list_file,
+                    "-c", "copy",
+                    concat_output
+                ]
+                try:
+                    logger.info(f"Concatenating segments: {' '.join(concat_cmd)}")
+                    success, error = self._run_ffmpeg(concat_cmd, os.path.join(temp_dir, "concat.log"))
+                    if self._export_cancel_event.is_set():
+                        self._notify_export_progress("cancelled", total_shots, total_shots, "Export cancelled by user")
+                        return
+                    if not success:
+                        logger.error(f"Concat failed: {error}")
+                        self._notify_export_progress("error", 0, 0, f"Failed to merge: {error[-100:]}")
+                        return
+
+                    self._notify_export_progress("subtitles", total_shots, total_shots, "Finalizing video...")
+                    try:
+                        os.replace(concat_output, output_path)
+                    except OSError:
+                        shutil.copy2(concat_output, output_path)  # e.g. output on a filesystem without rename support
+                finally:
+                    try:
+                        os.unlink(concat_output)
+                    except OSError:
+                        pass
 
-            if self._export_cancel_flag:
+            if self._export_cancel_event.is_set():
                 # If cancelled during final step, try to remove partial output
                 try:
                     Path(output_path).unlink(missing_ok=True)
@@ -6083,9 +6933,216 @@ class Api:
                 except Exception as e:
                     logger.warning(f"Failed to cleanup temp directory: {e}")
 
-    def _get_media_duration(self, file_path: str, ffprobe_path: str = "ffprobe") -> Optional[float]:
-        """Get media duration using ffprobe"""
-        import subprocess
+    def _run_ffmpeg(
+        self,
+        cmd: list,
+        log_path: str,
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> tuple[bool, str]:
+        """Run an ffmpeg command with stderr appended to a log file instead of captured in memory
+
+        If on_progress is given, ffmpeg's machine-readable `-progress pipe:1` output is parsed and
+        on_progress(encoded_seconds) is called at most EXPORT_PROGRESS_INTERVAL apart.
+        The process is terminated as soon as the export is cancelled.
+        Returns (success, tail of the log on failure).
+        """
+        cancel_event = self._export_cancel_event
+        with open(log_path, "ab") as log_file:
+            if on_progress is None:
+                proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=log_file, bufsize=1 << 20)
+                while proc.poll() is None:
+                    if cancel_event.wait(0.5):
+                        proc.terminate()
+                        break
+            else:
+                cmd = [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+                proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=log_file, bufsize=1 << 20)
+                last_notify = 0.0
+                for line in proc.stdout:
+                    # ffmpeg 每 0.5s 左右输出一组进度，借此检查取消
+                    if cancel_event.is_set():
+                        proc.terminate()
+                        break
+                    # out_time_us 在部分 ffmpeg 版本中也以 out_time_ms 输出（单位同样是微秒）
+                    if line.startswith((b"out_time_us=", b"out_time_ms=")):
+                        now = time.monotonic()
+                        if now - last_notify < EXPORT_PROGRESS_INTERVAL:
+                            continue
+                        try:
+                            encoded_us = int(line.split(b"=", 1)[1])
+                        except ValueError:
+                            continue  # "N/A" before the first frame
+                        last_notify = now
+                        on_progress(encoded_us / 1_000_000)
+                proc.stdout.close()
+            returncode = proc.wait()
+        if cancel_event.is_set():
+            return False, "Export cancelled by user"
+        if returncode == 0:
+            return True, ""
+        try:
+            with open(log_path, "rb") as f:
+                f.seek(max(0, os.path.getsize(log_path) - FFMPEG_LOG_TAIL_BYTES))
+                return False, f.read().decode("utf-8", errors="replace").strip()
+        except OSError:
+            return False, f"ffmpeg exited with code {returncode}"
+
+    def _get_hw_video_encoder_args(self, ffmpeg_path: str) -> Optional[tuple]:
+        """Probe once per ffmpeg binary for a working hardware H.264 encoder
+
+        `-encoders` only lists what ffmpeg was built with, so each candidate is verified with a
+        tiny test encode (e.g. nvenc is listed on machines without an NVIDIA GPU).
+        Returns encoder args, or None to use libx264.
+        """
+        if ffmpeg_path in self._video_encoder_cache:
+            return self._video_encoder_cache[ffmpeg_path]
+
+        encoder_args = None
+        try:
+            result = subprocess.run(
+                [ffmpeg_path, "-hide_banner", "-encoders"],
+                capture_output=True, text=True, timeout=10
+            )
+            available = result.stdout if result.returncode == 0 else ""
+            for name, args in _HW_VIDEO_ENCODERS:
+                if name not in available:
+                    continue
+                test_cmd = [
+                    ffmpeg_path, "-hide_banner", "-v", "error",
+                    "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                    *args, "-f", "null", "-"
+                ]
+                if subprocess.run(test_cmd, capture_output=True, timeout=20).returncode == 0:
+                    encoder_args = args
+                    break
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"Failed to probe hardware encoders: {e}")
+
+        logger.info(f"Video encoder for export: {encoder_args[1] if encoder_args else 'libx264'}")
+        self._video_encoder_cache[ffmpeg_path] = encoder_args
+        return encoder_args
+
+    def _get_media_duration(self, file_path: str, ffprobe_path: Optional[str] = None) -> Optional[float]:
+        """Get audio or video duration in seconds without decoding, cached by (path, mtime_ns, size)
+
+        WAV files are read from the RIFF header; other formats (including video) go through ffprobe.
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        duration = self._media_duration_cache.get(key)
+        if duration is not None:
+            return duration
+
+        if file_path.lower().endswith(".wav"):
+            try:
+                with wave.open(file_path, "rb") as wf:
+                    duration = wf.getnframes() / wf.getframerate()
+            except (wave.Error, EOFError, OSError, ZeroDivisionError):
+                duration = None  # e.g. non-PCM WAV, fall back to ffprobe
+        if duration is None:
+            duration = self._probe_media_duration(file_path, ffprobe_path or self._get_ffprobe_path())
+
+        if duration is not None:
+            self._media_duration_cache[key] = duration
+        return duration
+
+    def _get_video_stream_info(self, file_path: str, ffprobe_path: str = "ffprobe") -> Optional[tuple]:
+        """Get (codec_name, width, height, pix_fmt, avg_frame_rate, profile) of the first video stream, cached by (path, mtime_ns, size)"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        if key in self._video_stream_info_cache:
+            return self._video_stream_info_cache[key]
+
+        info = None
+        try:
+            cmd = [
+                ffprobe_path,
+                "-v", "error",
+                "-select_streams", "v:0",
+                "-show_entries", "stream=codec_name,width,height,pix_fmt,avg_frame_rate,profile",
+                "-of", "json",
+                file_path
+            ]
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            if result.returncode == 0:
+                streams = json.loads(result.stdout).get("streams") or []
+                if streams:
+                    s = streams[0]
+                    info = (s.get("codec_name"), s.get("width"), s.get("height"), s.get("pix_fmt"), s.get("avg_frame_rate"), s.get("profile"))
+        except Exception as e:
+            logger.warning(f"Failed to probe video stream of {file_path}: {e}")
+        self._video_stream_info_cache[key] = info
+        return info
+
+    def _get_media_durations_batch(self, paths, ffprobe_path: str = "ffprobe",
+                                   ffmpeg_path: Optional[str] = None) -> Dict[str, Optional[float]]:
+        """Get durations for many media files, amortizing process startup over the cache misses
+
+        Cache hits and WAV headers need no subprocess. With ffmpeg_path, the remaining files are
+        read by one ffmpeg process per MEDIA_PROBE_BATCH_SIZE files; whatever it cannot report
+        falls back to per-file ffprobe, run in parallel threads.
+        """
+        unique_paths = list(dict.fromkeys(p for p in paths if p))
+        durations: Dict[str, Optional[float]] = {}
+        pending: Dict[str, tuple] = {}  # path -> duration cache key
+        for path in unique_paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                durations[path] = None
+                continue
+            key = (path, st.st_mtime_ns, st.st_size)
+            duration = self._media_duration_cache.get(key)
+            if duration is None and path.lower().endswith(".wav"):
+                duration = self._get_media_duration(path, ffprobe_path)
+            if duration is not None:
+                durations[path] = duration
+            else:
+                pending[path] = key
+
+        if ffmpeg_path and len(pending) > 1:
+            batch = list(pending)
+            for start in range(0, len(batch), MEDIA_PROBE_BATCH_SIZE):
+                chunk = batch[start:start + MEDIA_PROBE_BATCH_SIZE]
+                for path, duration in self._probe_media_durations(chunk, ffmpeg_path).items():
+                    self._media_duration_cache[pending.pop(path)] = duration
+                    durations[path] = duration
+
+        if len(pending) == 1:
+            path = next(iter(pending))
+            durations[path] = self._get_media_duration(path, ffprobe_path)
+        elif pending:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending)), thread_name_prefix="ffprobe") as pool:
+                durations.update(zip(pending, pool.map(lambda p: self._get_media_duration(p, ffprobe_path), pending)))
+        return durations
+
+    def _probe_media_durations(self, paths: list, ffmpeg_path: str = "ffmpeg") -> Dict[str, float]:
+        """Read durations of several files with a single ffmpeg process (uncached)
+
+        ffmpeg is given every file as an input and no output, so it only opens the inputs,
+        prints their headers and exits. If an input fails to open, ffmpeg stops there and the
+        files after it are simply missing from the result.
+        """
+        cmd = [ffmpeg_path, "-hide_banner", "-nostdin"]
+        for path in paths:
+            cmd += ["-i", path]
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    encoding="utf-8", errors="replace")
+        except Exception as e:
+            logger.warning(f"Failed to read durations with ffmpeg: {e}")
+            return {}
+        parsed = _parse_ffmpeg_input_durations(result.stderr)
+        return {paths[i]: d for i, d in parsed.items() if i < len(paths)}
+
+    def _probe_media_duration(self, file_path: str, ffprobe_path: str = "ffprobe") -> Optional[float]:
+        """Get media duration via ffprobe (uncached, see _get_media_duration)"""
         try:
             cmd = [
                 ffprobe_path,
@@ -6094,7 +7151,7 @@ class Api:
                 "-of", "default=noprint_wrappers=1:nokey=1",
                 file_path
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             if result.returncode == 0:
                 return float(result.stdout.strip())
         except Exception as e:
@@ -6112,11 +7169,42 @@ class Api:
         audio_speed: float,
         audio_trim_start: float,
         audio_trim_duration: float,
-        ffmpeg_path: str = "ffmpeg"
+        ffmpeg_path: str = "ffmpeg",
+        threads: int = 0,
+        video_codec_args: Optional[list] = None,
+        allow_stream_copy: bool = False
     ) -> bool:
-        """Create a video segment with audio using ffmpeg"""
-        import subprocess
+        """Create a video segment with audio using ffmpeg
+
+        With allow_stream_copy, shots that need no speed change or trimming copy the
+        video stream instead of re-encoding it (only the audio is encoded). The caller only
+        sets it when every shot is copied, all sources share one format and each video
+        covers the whole segment.
+        """
         try:
+            if (allow_stream_copy and video_speed == 1.0 and video_start < 0.05
+                    and audio_speed == 1.0 and audio_trim_start < 0.05
+                    and abs(audio_trim_duration - segment_duration) < 0.1):
+                # 从 0 开始截取，起点必为关键帧，无需逐帧精确裁剪
+                cmd = [
+                    ffmpeg_path, "-y",
+                    "-i", video_path,
+                    "-i", audio_path,
+                    "-map", "0:v:0",
+                    "-map", "1:a:0",
+                    "-t", str(segment_duration),
+                    "-c:v", "copy",
+                    "-c:a", "aac",
+                    "-b:a", "192k",
+                    output_path
+                ]
+                # DEBUG 未启用时不拼接命令行字符串
+                logger.opt(lazy=True).debug("Creating segment (stream copy): {}", lambda: " ".join(cmd))
+                success, error = self._run_ffmpeg(cmd, f"{output_path}.log")
+                if success:
+                    return True
+                logger.warning(f"Stream copy failed, falling back to re-encode: {error[-300:]}")
+
             # Calculate PTS factor for video speed (inverse relationship)
             pts_factor = 1.0 / video_speed
             
@@ -6149,18 +7237,17 @@ class Api:
                 "-map", "[v]",
                 "-map", "[a]",
                 "-t", str(segment_duration),
-                "-c:v", "libx264",
-                "-preset", "fast",
-                "-crf", "18",
+                *(video_codec_args or ("-c:v", "libx264", "-preset", "fast", "-crf", "18")),
+                "-threads", str(threads),
                 "-c:a", "aac",
                 "-b:a", "192k",
                 output_path
             ]
             
-            logger.debug(f"Creating segment: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"FFmpeg error: {result.stderr}")
+            logger.opt(lazy=True).debug("Creating segment: {}", lambda: " ".join(cmd))
+            success, error = self._run_ffmpeg(cmd, f"{output_path}.log")
+            if not success:
+                logger.error(f"FFmpeg error: {error}")
                 return False
             return True
         except Exception as e:
@@ -6174,11 +7261,33 @@ class Api:
         video_speed: float,
         video_start: float,
         segment_duration: float,
-        ffmpeg_path: str = "ffmpeg"
+        ffmpeg_path: str = "ffmpeg",
+        threads: int = 0,
+        video_codec_args: Optional[list] = None,
+        allow_stream_copy: bool = False
     ) -> bool:
-        """Create a video segment without audio using ffmpeg"""
-        import subprocess
+        """Create a video segment without audio using ffmpeg
+
+        With allow_stream_copy, an untouched shot (speed 1.0, starting at 0) copies the video stream
+        (the caller only sets it when every shot is copied and all sources share one format).
+        """
         try:
+            if allow_stream_copy and video_speed == 1.0 and video_start < 0.05:
+                cmd = [
+                    ffmpeg_path, "-y",
+                    "-i", video_path,
+                    "-map", "0:v:0",
+                    "-t", str(segment_duration),
+                    "-c:v", "copy",
+                    "-an",
+                    output_path
+                ]
+                logger.opt(lazy=True).debug("Creating segment (stream copy): {}", lambda: " ".join(cmd))
+                success, error = self._run_ffmpeg(cmd, f"{output_path}.log")
+                if success:
+                    return True
+                logger.warning(f"Stream copy failed, falling back to re-encode: {error[-300:]}")
+
             pts_factor = 1.0 / video_speed
             
             video_filter = f"trim=start={video_start},setpts={pts_factor}*PTS,setpts=PTS-STARTPTS"
@@ -6188,17 +7297,16 @@ class Api:
                 "-i", video_path,
                 "-vf", video_filter,
                 "-t", str(segment_duration),
-                "-c:v", "libx264",
-                "-preset", "fast",
-                "-crf", "18",
+                *(video_codec_args or ("-c:v", "libx264", "-preset", "fast", "-crf", "18")),
+                "-threads", str(threads),
                 "-an",
                 output_path
             ]
             
-            logger.debug(f"Creating segment: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"FFmpeg error: {result.stderr}")
+            logger.opt(lazy=True).debug("Creating segment: {}", lambda: " ".join(cmd))
+            success, error = self._run_ffmpeg(cmd, f"{output_path}.log")
+            if not success:
+                logger.error(f"FFmpeg error: {error}")
                 return False
             return True
         except Exception as e:
@@ -6227,40 +7335,57 @@ Style: Default,Arial,56,&H00FFFFFF,&H000000FF,&H00000000,&H80000000,0,0,0,0,100,
 [Events]
 Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 """
-        
-        def format_ass_time(seconds: float) -> str:
-            """Format time as H:MM:SS.CC (centiseconds)"""
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            centisecs = int((seconds % 1) * 100)
-            return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
-        
+
+        lines = [
+            f"Dialogue: 0,{_format_ass_time(e['start'])},{_format_ass_time(e['end'])},Default,,0,0,0,,{_escape_ass_text(e['text'])}\n"
+            for e in srt_entries
+        ]
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(ass_header)
-            for entry in srt_entries:
-                start = format_ass_time(entry["start"])
-                end = format_ass_time(entry["end"])
-                # Escape special characters and replace newlines
-                text = entry["text"].replace("\\", "\\\\").replace("{", "\\{").replace("}", "\\}")
-                text = text.replace("\n", "\\N")
-                f.write(f"Dialogue: 0,{start},{end},Default,,0,0,0,,{text}\n")
+            f.writelines(lines)
 
     # ========== Project Settings APIs (作品信息与创作参数) ==========
 
-    def get_styles(self) -> dict:
-        """Get available style presets from assets/styles/styles.json"""
+    def _load_styles(self) -> list:
+        """Load style presets from styles.json, cached by file mtime
+
+        Also builds self._style_by_id for O(1) preset lookup. The returned list is shared; do not mutate.
+        """
         try:
-            styles_file = Path(__file__).parent / "assets" / "styles" / "styles.json"
-            if not styles_file.exists():
-                logger.warning(f"Styles file not found: {styles_file}")
-                return {"success": True, "styles": []}
+            mtime_ns = os.stat(_STYLES_FILE).st_mtime_ns
+        except OSError:
+            logger.warning(f"Styles file not found: {_STYLES_FILE}")
+            self._styles_cache = None
+            self._style_by_id = {}
+            self._style_cover_prompt_by_id = {}
+            return []
+
+        if self._styles_cache and self._styles_cache[0] == mtime_ns:
+            return self._styles_cache[1]
+
+        with open(_STYLES_FILE, "r", encoding="utf-8") as f:
+            styles = json.load(f)
+        self._style_by_id = {}
+        for s in styles:
+            self._style_by_id.setdefault(s.get("id"), s)  # 与原先顺序查找一致，重复 id 取第一个
+        # 封面提示词中的风格描述只取前 100 字，建索引时一并生成
+        self._style_cover_prompt_by_id = {
+            style_id: f"{s.get('name_cn', '')} style, {s.get('desc', '')[:100]}"
+            for style_id, s in self._style_by_id.items()
+        }
+        self._styles_cache = (mtime_ns, styles)
+        logger.info(f"Loaded {len(styles)} style presets")
+        return styles
 
-            with open(styles_file, "r", encoding="utf-8") as f:
-                styles = json.load(f)
+    def _get_style_preset(self, preset_id) -> Optional[dict]:
+        """Get a style preset by id"""
+        self._load_styles()
+        return self._style_by_id.get(preset_id)
 
-            logger.info(f"Loaded {len(styles)} style presets")
-            return {"success": True, "styles": styles}
+    def get_styles(self) -> dict:
+        """Get available style presets from assets/styles/styles.json"""
+        try:
+            return {"success": True, "styles": self._load_styles()}
         except Exception as e:
             logger.error(f"Failed to load styles: {e}")
             return {"success": False, "error": str(e)}
@@ -6312,18 +7437,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
         if style.get("type") == "preset" and style.get("presetId") is not None:
             # Load style from styles.json
-            styles_file = Path(__file__).parent / "assets" / "styles" / "styles.json"
-            if styles_file.exists():
-                with open(styles_file, "r", encoding="utf-8") as f:
-                    styles = json.load(f)
-                    for s in styles:
-                        if s.get("id") == style.get("presetId"):
-                            style_text = f"{s.get('name_cn', '')} style, {s.get('desc', '')}"
-                            # Get style image path
-                            style_image = s.get("image", "")
-                            if style_image:
-                                style_image_path = str(Path(__file__).parent / "assets" / "styles" / style_image)
-                            break
+            s = self._get_style_preset(style.get("presetId"))
+            if s:
+                style_text = f"{s.get('name_cn', '')} style, {s.get('desc', '')}"
+                # Get style image path
+                style_image = s.get("image", "")
+                if style_image:
+                    style_image_path = str(_STYLES_DIR / style_image)
         elif style.get("type") == "custom" and style.get("customPrompt"):
             style_text = style.get("customPrompt", "")
             # Get custom style preview image
@@ -6351,6 +7471,28 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             logger.error(f"Failed to save project settings: {e}")
             return {"success": False, "error": str(e)}
 
+    def _collect_llm_stream(self, data, channel: str, model: str, api_key: str, api_url: str,
+                            stop_at_json: bool = False) -> str:
+        """Run call_llm_stream, forwarding each line to window.onLLMToken(channel, line) as it arrives
+
+        Lines are queued to the notify flusher instead of calling evaluate_js here, so reading the
+        stream never waits on the UI thread. With stop_at_json, the stream is closed as soon as the
+        first top-level JSON object is complete (trailing text such as a closing code fence is skipped).
+
+        Returns the response text (lines joined with newlines).
+        """
+        from services.stream_llm import call_llm_stream
+
+        buf = io.StringIO()
+        scanner = _JsonObjectScanner() if stop_at_json else None
+        for i, line in enumerate(call_llm_stream(data, model=model, api_key=api_key, base_url=api_url, use_env=False)):
+            chunk = "\n" + line if i else line
+            buf.write(chunk)
+            self._notify_queue.put(("llm", json.dumps([channel, line], ensure_ascii=False)))
+            if scanner is not None and scanner.feed(chunk):
+                break
+        return buf.getvalue()
+
     def generate_work_info(self) -> dict:
         """Generate work info (title and description) based on project content using LLM"""
         try:
@@ -6395,17 +7537,11 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             context = "\n\n".join(context_parts)
 
             # Call LLM to generate work info
-            settings = self._load_settings()
-            shot_builder_config = settings.get("shotBuilder", {})
-            api_url = shot_builder_config.get("apiUrl", "")
-            api_key = shot_builder_config.get("apiKey", "")
-            model = shot_builder_config.get("model", "")
+            api_url, api_key, model = self._get_shot_builder_llm_config()
 
             if not api_url or not api_key:
                 return {"success": False, "error": "Shot builder API not configured"}
 
-            from services.stream_llm import call_llm_stream
-
             prompt = f"""根据以下视频项目内容，生成一个吸引人的作品名和作品介绍。
 
 项目内容:
@@ -6417,21 +7553,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
 只返回 JSON，不要其他内容。"""
 
-            # Collect streaming response
-            response_lines = []
-            for line in call_llm_stream(prompt, model=model, api_key=api_key, base_url=api_url, use_env=False):
-                response_lines.append(line)
-            response = "\n".join(response_lines)
+            # Stream the response to the UI while collecting it; JSON is parsed once at the end
+            response = self._collect_llm_stream(prompt, "workInfo", model, api_key, api_url, stop_at_json=True)
 
             # Parse JSON response
             try:
-                # Try to extract JSON from response
-                import re
-                json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
-                if json_match:
-                    work_info = json.loads(json_match.group())
-                else:
-                    work_info = json.loads(response)
+                # Pure JSON is parsed directly; otherwise extract the outermost object from surrounding text
+                work_info = _parse_json_object(response)
 
                 result = {
                     "title": work_info.get("title", ""),
@@ -6459,54 +7587,32 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             current_work_info = settings.get("workInfo", {})
 
             # Call LLM with conversation history
-            app_settings = self._load_settings()
-            shot_builder_config = app_settings.get("shotBuilder", {})
-            api_url = shot_builder_config.get("apiUrl", "")
-            api_key = shot_builder_config.get("apiKey", "")
-            model = shot_builder_config.get("model", "")
+            api_url, api_key, model = self._get_shot_builder_llm_config()
 
             if not api_url or not api_key:
                 return {"success": False, "error": "Shot builder API not configured"}
 
-            from services.stream_llm import call_llm_stream
-
-            system_prompt = f"""你是一个视频创作助手，帮助用户优化作品名和作品介绍。
-
-当前作品信息:
-- 作品名: {current_work_info.get('title', '未设置')}
-- 作品介绍: {current_work_info.get('description', '未设置')}
-
-用户可能会要求你:
-1. 优化作品名（更有吸引力、更诗意、更简洁等）
-2. 修改作品介绍（更详细、更简洁、换个角度等）
-3. 同时修改两者
-
-请根据用户的要求进行修改，并以 JSON 格式返回更新后的信息:
-{{"title": "新作品名", "description": "新作品介绍", "reply": "你的回复说明"}}
-
-如果用户只是在聊天没有要求修改，reply字段回复即可，title和description保持原值。
-只返回 JSON，不要其他内容。"""
-
-            # Build messages from history
-            messages = [{"role": "system", "content": system_prompt}]
-            for h in history:
+            # 系统提示词保持不变，当前作品信息放在最后一条用户消息开头，便于服务端复用前缀缓存；
+            # 不单独成消息，避免连续两条 user 消息被部分兼容接口拒绝或合并
+            messages = [{"role": "system", "content": _WORK_INFO_CHAT_SYSTEM_PROMPT}]
+            for h in history[-WORK_INFO_CHAT_HISTORY_LIMIT:]:
                 messages.append({"role": h.get("role", "user"), "content": h.get("content", "")})
-            messages.append({"role": "user", "content": message})
+            messages.append({
+                "role": "user",
+                "content": (
+                    "当前作品信息:\n"
+                    f"- 作品名: {current_work_info.get('title', '未设置')}\n"
+                    f"- 作品介绍: {current_work_info.get('description', '未设置')}\n\n"
+                    f"{message}"
+                ),
+            })
 
-            # Collect streaming response
-            response_lines = []
-            for line in call_llm_stream(messages, model=model, api_key=api_key, base_url=api_url, use_env=False):
-                response_lines.append(line)
-            response = "\n".join(response_lines)
+            # Stream the response to the UI while collecting it; JSON is parsed once at the end
+            response = self._collect_llm_stream(messages, "workInfoChat", model, api_key, api_url, stop_at_json=True)
 
             # Parse JSON response
             try:
-                import re
-                json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group())
-                else:
-                    result = json.loads(response)
+                result = _parse_json_object(response)
 
                 work_info = {
                     "title": result.get("title", current_work_info.get("title", "")),
@@ -6548,21 +7654,27 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             source_path = Path(result[0])
 
             # Get project output directory
-            work_dir = self._project_manager.work_dir
-            project_dir = work_dir / self.project_name / "output"
-            project_dir.mkdir(parents=True, exist_ok=True)
+            project_dir = self._get_project_output_dirs()[0]
+            self._ensure_dir(project_dir)
 
-            # Copy file to project directory
-            import shutil
+            # Copy file to project directory in the background; the URL is pushed once the copy finishes
             dest_filename = f"cover{source_path.suffix}"
             dest_path = project_dir / dest_filename
-            shutil.copy2(source_path, dest_path)
 
-            # Convert to URL
+            project_name = self.project_name
             image_url = self._path_to_url(str(dest_path))
 
-            logger.info(f"Uploaded cover image: {dest_path}")
-            return {"success": True, "imageUrl": image_url}
+            def _uploaded() -> dict:
+                # 在后端写入并保存封面，不依赖前端页面仍在监听完成事件
+                if self.project_data and self.project_name == project_name:
+                    settings = self.project_data.setdefault("settings", self._get_default_project_settings())
+                    settings.setdefault("workInfo", {})["coverImage"] = image_url
+                    self.save_project_to_workdir(project_name)
+                logger.info(f"Uploaded cover image: {dest_path}")
+                return {"imageUrl": image_url}
+
+            op_id = self._copy_file_in_background(source_path, dest_path, "cover_upload", _uploaded)
+            return {"success": True, "pending": True, "operationId": op_id}
 
         except Exception as e:
             logger.error(f"Failed to upload cover image: {e}")
@@ -6589,30 +7701,25 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             style = creation_params.get("style", {})
             style_prompt = ""
             if style.get("type") == "preset" and style.get("presetId") is not None:
-                # Load style from styles.json
-                styles_file = Path(__file__).parent / "assets" / "styles" / "styles.json"
-                if styles_file.exists():
-                    with open(styles_file, "r", encoding="utf-8") as f:
-                        styles = json.load(f)
-                        for s in styles:
-                            if s.get("id") == style.get("presetId"):
-                                style_prompt = s.get("name_cn", "") + " style, " + s.get("desc", "")[:100]
-                                break
+                # Load style from styles.json (prompt text precomputed when the index is built)
+                self._load_styles()
+                style_prompt = self._style_cover_prompt_by_id.get(style.get("presetId"), "")
             elif style.get("type") == "custom" and style.get("customPrompt"):
                 style_prompt = style.get("customPrompt", "")
 
             # Build cover prompt
-            prompt_parts = []
-            if title:
-                prompt_parts.append(f"Title: {title}")
-            if description:
-                prompt_parts.append(f"Story: {description[:200]}")
-            if style_prompt:
-                prompt_parts.append(f"Style: {style_prompt}")
-
-            prompt = "Generate a movie poster or cover image. " + " ".join(prompt_parts)
-            if not prompt_parts:
-                prompt = "Generate a cinematic movie poster with dramatic lighting"
+            if not (title or description or style_prompt):
+                prompt = DEFAULT_COVER_PROMPT
+            else:
+                story = description[:200]
+                prompt_parts = ["Generate a movie poster or cover image."]
+                if title:
+                    prompt_parts.append(f"Title: {title}")
+                if story:
+                    prompt_parts.append(f"Story: {story}")
+                if style_prompt:
+                    prompt_parts.append(f"Style: {style_prompt}")
+                prompt = " ".join(prompt_parts)
 
             # Get TTI settings
             app_settings = self._load_settings()
@@ -6623,9 +7730,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             aspect_ratio = creation_params.get("aspectRatio", "16:9")
 
             # Get output path
-            work_dir = self._project_manager.work_dir
-            project_dir = work_dir / self.project_name / "output"
-            project_dir.mkdir(parents=True, exist_ok=True)
+            project_dir = self._get_project_output_dirs()[0]
+            self._ensure_dir(project_dir)
 
             # Create image task
             task_id = self._task_manager.create_image_task(
@@ -6665,8 +7771,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 return {"success": False, "error": "No cover image to export"}
 
             # Try to find cover image in project output directory first
-            work_dir = self._project_manager.work_dir
-            project_dir = work_dir / self.project_name / "output"
+            project_dir = self._get_project_output_dirs()[0]
             cover_path = project_dir / "cover.png"
 
             # If not found, try to parse from URL
@@ -6696,12 +7801,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
             dest_path = Path(file_path)
 
-            # Copy file
-            import shutil
-            shutil.copy2(cover_path, dest_path)
+            # Copy file in the background; completion is pushed via projectUpdate
+            def _exported() -> dict:
+                logger.info(f"Exported cover image to: {dest_path}")
+                return {"path": str(dest_path)}
 
-            logger.info(f"Exported cover image to: {dest_path}")
-            return {"success": True, "path": str(dest_path)}
+            op_id = self._copy_file_in_background(cover_path, dest_path, "cover_export", _exported)
+            return {"success": True, "pending": True, "operationId": op_id, "path": str(dest_path)}
 
         except Exception as e:
             logger.error(f"Failed to export cover image: {e}")
@@ -6725,9 +7831,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             provider = tti_config.get("provider", "openai")
 
             # Get output path in project directory
-            work_dir = self._project_manager.work_dir
-            preview_dir = work_dir / self.project_name / "output" / "style_previews"
-            preview_dir.mkdir(parents=True, exist_ok=True)
+            preview_dir = self._get_project_output_dirs()[0] / "style_previews"
+            self._ensure_dir(preview_dir)
 
             # Build prompt for style preview
             full_prompt = f"Create a sample image demonstrating this visual style: {prompt.strip()}. Show a beautiful landscape or scene that captures the essence of this style."
@@ -6776,129 +7881,77 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             logger.error(f"Failed to get task summary: {e}")
             return {"success": False, "error": str(e)}
 
+    @_requires_task_manager("list tasks")
     def list_tasks(self, task_type: str = None, status: str = None,
                    offset: int = 0, limit: int = 50) -> dict:
         """List tasks with optional filtering"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            tasks = self._task_manager.list_tasks(task_type, status, offset, limit)
-            return {"success": True, "data": tasks}
-        except Exception as e:
-            logger.error(f"Failed to list tasks: {e}")
-            return {"success": False, "error": str(e)}
+        tasks = self._task_manager.list_tasks(task_type, status, offset, limit)
+        return {"success": True, "data": tasks}
 
+    @_requires_task_manager("get task")
     def get_task(self, task_type: str, task_id: str) -> dict:
         """Get a single task by type and ID"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            task = self._task_manager.get_task(task_type, task_id)
-            if task:
-                return {"success": True, "data": task}
-            else:
-                return {"success": False, "error": "Task not found"}
-        except Exception as e:
-            logger.error(f"Failed to get task: {e}")
-            return {"success": False, "error": str(e)}
+        task = self._task_manager.get_task(task_type, task_id)
+        if task:
+            return {"success": True, "data": task}
+        else:
+            return {"success": False, "error": "Task not found"}
 
+    @_requires_task_manager("poll tasks")
     def poll_tasks(self, task_refs: List[str]) -> dict:
         """Poll multiple tasks by reference (e.g., ['image:xxx', 'video:yyy'])"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            results = self._task_manager.poll_tasks(task_refs)
-            return {"success": True, "data": results}
-        except Exception as e:
-            logger.error(f"Failed to poll tasks: {e}")
-            return {"success": False, "error": str(e)}
+        results = self._task_manager.poll_tasks(task_refs)
+        return {"success": True, "data": results}
 
+    @_requires_task_manager("pause task")
     def pause_task(self, task_type: str, task_id: str) -> dict:
         """Pause a pending task"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            success = self._task_manager.pause_task(task_type, task_id)
-            return {"success": success}
-        except Exception as e:
-            logger.error(f"Failed to pause task: {e}")
-            return {"success": False, "error": str(e)}
+        success = self._task_manager.pause_task(task_type, task_id)
+        if success:
+            self._emit_task_event({"type": task_type, "id": task_id, "status": TaskStatus.PAUSED.value})
+        return {"success": success}
 
+    @_requires_task_manager("resume task")
     def resume_task(self, task_type: str, task_id: str) -> dict:
         """Resume a paused task"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            success = self._task_manager.resume_task(task_type, task_id)
-            return {"success": success}
-        except Exception as e:
-            logger.error(f"Failed to resume task: {e}")
-            return {"success": False, "error": str(e)}
+        success = self._task_manager.resume_task(task_type, task_id)
+        if success:
+            self._emit_task_event({"type": task_type, "id": task_id, "status": TaskStatus.PENDING.value})
+        return {"success": success}
 
+    @_requires_task_manager("cancel task")
     def cancel_task(self, task_type: str, task_id: str) -> dict:
         """Cancel a pending/paused task"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            success = self._task_manager.cancel_task(task_type, task_id)
-            return {"success": success}
-        except Exception as e:
-            logger.error(f"Failed to cancel task: {e}")
-            return {"success": False, "error": str(e)}
+        success = self._task_manager.cancel_task(task_type, task_id)
+        if success:
+            self._emit_task_event({"type": task_type, "id": task_id, "status": TaskStatus.CANCELLED.value})
+        return {"success": success}
 
+    @_requires_task_manager("retry task")
     def retry_task(self, task_type: str, task_id: str) -> dict:
         """Retry a failed/cancelled task"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            success = self._task_manager.retry_task(task_type, task_id)
-            return {"success": success}
-        except Exception as e:
-            logger.error(f"Failed to retry task: {e}")
-            return {"success": False, "error": str(e)}
+        success = self._task_manager.retry_task(task_type, task_id)
+        if success:
+            self._emit_task_event({"type": task_type, "id": task_id, "status": TaskStatus.PENDING.value})
+        return {"success": success}
 
+    @_requires_task_manager("pause all tasks")
     def pause_all_tasks(self, task_type: str = None) -> dict:
         """Pause all pending tasks"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            count = self._task_manager.pause_all(task_type)
-            return {"success": True, "count": count}
-        except Exception as e:
-            logger.error(f"Failed to pause all tasks: {e}")
-            return {"success": False, "error": str(e)}
+        count = self._task_manager.pause_all(task_type)
+        return {"success": True, "count": count}
 
+    @_requires_task_manager("resume all tasks")
     def resume_all_tasks(self, task_type: str = None) -> dict:
         """Resume all paused tasks"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            count = self._task_manager.resume_all(task_type)
-            return {"success": True, "count": count}
-        except Exception as e:
-            logger.error(f"Failed to resume all tasks: {e}")
-            return {"success": False, "error": str(e)}
+        count = self._task_manager.resume_all(task_type)
+        return {"success": True, "count": count}
 
+    @_requires_task_manager("cancel all tasks")
     def cancel_all_pending_tasks(self, task_type: str = None) -> dict:
         """Cancel all pending/paused tasks"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            count = self._task_manager.cancel_all_pending(task_type)
-            return {"success": True, "count": count}
-        except Exception as e:
-            logger.error(f"Failed to cancel all tasks: {e}")
-            return {"success": False, "error": str(e)}
+        count = self._task_manager.cancel_all_pending(task_type)
+        return {"success": True, "count": count}
 
     def get_executor_status(self) -> dict:
         """Get status of all task executors
@@ -6915,9 +7968,29 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             'audio': {'total': 0, 'busy': 0}
         }
         
+        # Snapshot current task ids once, then fetch all running tasks in one query per type
+        current_task_ids = [executor._current_task_id for executor in self._task_executors]
+        current_tasks = {}
+        if self._task_manager:
+            task_refs = [
+                f"{executor.task_type}:{task_id}"
+                for executor, task_id in zip(self._task_executors, current_task_ids)
+                if task_id is not None
+            ]
+            if task_refs:
+                try:
+                    current_tasks = self._task_manager.poll_tasks(task_refs)
+                except Exception:
+                    pass
+
+        # Parse settings once (cached) for all executors reading the app settings file
+        settings = self._load_settings()
+        settings_file = str(self._settings_file)
+
         for i, executor in enumerate(self._task_executors):
             task_type = executor.task_type
-            is_busy = executor._current_task_id is not None
+            current_task_id = current_task_ids[i]
+            is_busy = current_task_id is not None
             
             # Get thread status
             thread_alive = False
@@ -6925,20 +7998,16 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 thread_alive = self._task_executor_threads[i].is_alive()
             
             # Get current task info if busy
-            current_task = None
-            if is_busy and self._task_manager:
-                try:
-                    result = self._task_manager.get_task(task_type, executor._current_task_id)
-                    if result.get('success'):
-                        current_task = result.get('data')
-                except Exception:
-                    pass
+            current_task = current_tasks.get(current_task_id) if is_busy else None
             
             # Get current config (dynamically loaded)
             config_info = {}
             if hasattr(executor, '_load_config'):
                 try:
-                    api_url, api_key, model = executor._load_config()
+                    if hasattr(executor, '_load_config_from') and str(getattr(executor, '_settings_file', '')) == settings_file:
+                        api_url, api_key, model = executor._load_config_from(settings)
+                    else:
+                        api_url, api_key, model = executor._load_config()
                     config_info = {
                         'api_url': api_url or '',
                         'api_key': api_key or '',
@@ -6953,7 +8022,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 'worker_id': executor.worker_id,
                 'task_type': task_type,
                 'running': executor._running,
-                'current_task_id': executor._current_task_id,
+                'current_task_id': current_task_id,
                 'current_task': current_task,
                 'thread_alive': thread_alive,
                 'heartbeat_interval': getattr(executor, 'heartbeat_interval', 10),
@@ -6972,6 +8041,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             'summary': summary
         }
 
+    @_requires_task_manager("create image task")
     def create_image_task(
         self,
         subtype: str,
@@ -6985,31 +8055,25 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         depends_on: str = None
     ) -> dict:
         """Create an image generation task"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            # Use project shots directory if output_dir not specified
-            if not output_dir and self.project_name:
-                output_dir = str(self._project_manager.get_project_dir(self.project_name) / "images")
-
-            task_id = self._task_manager.create_image_task(
-                subtype=subtype,
-                prompt=prompt,
-                aspect_ratio=aspect_ratio,
-                provider=provider,
-                project_id=self._get_project_id(),
-                resolution=resolution,
-                reference_images=reference_images,
-                output_dir=output_dir,
-                priority=priority,
-                depends_on=depends_on
-            )
-            return {"success": True, "taskId": task_id}
-        except Exception as e:
-            logger.error(f"Failed to create image task: {e}")
-            return {"success": False, "error": str(e)}
+        # Use project shots directory if output_dir not specified
+        if not output_dir and self.project_name:
+            output_dir = str(self._project_manager.get_project_dir(self.project_name) / "images")
+
+        task_id = self._task_manager.create_image_task(
+            subtype=subtype,
+            prompt=prompt,
+            aspect_ratio=aspect_ratio,
+            provider=provider,
+            project_id=self._get_project_id(),
+            resolution=resolution,
+            reference_images=reference_images,
+            output_dir=output_dir,
+            priority=priority,
+            depends_on=depends_on
+        )
+        return {"success": True, "taskId": task_id}
 
+    @_requires_task_manager("create video task")
     def create_video_task(
         self,
         subtype: str,
@@ -7024,32 +8088,26 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         depends_on: str = None
     ) -> dict:
         """Create a video generation task"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            # Use project shots directory if output_dir not specified
-            if not output_dir and self.project_name:
-                output_dir = str(self._project_manager.get_project_dir(self.project_name) / "videos")
-
-            task_id = self._task_manager.create_video_task(
-                subtype=subtype,
-                prompt=prompt,
-                aspect_ratio=aspect_ratio,
-                provider=provider,
-                project_id=self._get_project_id(),
-                resolution=resolution,
-                reference_images=reference_images,
-                duration=duration,
-                output_dir=output_dir,
-                priority=priority,
-                depends_on=depends_on
-            )
-            return {"success": True, "taskId": task_id}
-        except Exception as e:
-            logger.error(f"Failed to create video task: {e}")
-            return {"success": False, "error": str(e)}
+        # Use project shots directory if output_dir not specified
+        if not output_dir and self.project_name:
+            output_dir = str(self._project_manager.get_project_dir(self.project_name) / "videos")
+
+        task_id = self._task_manager.create_video_task(
+            subtype=subtype,
+            prompt=prompt,
+            aspect_ratio=aspect_ratio,
+            provider=provider,
+            project_id=self._get_project_id(),
+            resolution=resolution,
+            reference_images=reference_images,
+            duration=duration,
+            output_dir=output_dir,
+            priority=priority,
+            depends_on=depends_on
+        )
+        return {"success": True, "taskId": task_id}
 
+    @_requires_task_manager("create audio task")
     def create_audio_task(
         self,
         text: str,
@@ -7063,27 +8121,20 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         depends_on: str = None
     ) -> dict:
         """Create an audio generation task"""
-        if not self._task_manager:
-            return {"success": False, "error": "No project loaded"}
-
-        try:
-            # Use project shots directory if output_dir not specified
-            if not output_dir and self.project_name:
-                output_dir = str(self._project_manager.get_project_dir(self.project_name) / "audio")
-
-            task_id = self._task_manager.create_audio_task(
-                text=text,
-                provider=provider,
-                project_id=self._get_project_id(),
-                voice_ref=voice_ref,
-                emotion=emotion,
-                emotion_intensity=emotion_intensity,
-                speed=speed,
-                output_dir=output_dir,
-                priority=priority,
-                depends_on=depends_on
-            )
-            return {"success": True, "taskId": task_id}
-        except Exception as e:
-            logger.error(f"Failed to create audio task: {e}")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+        # Use project shots directory if output_dir not specified
+        if not output_dir and self.project_name:
+            output_dir = str(self._project_manager.get_project_dir(self.project_name) / "audio")
+
+        task_id = self._task_manager.create_audio_task(
+            text=text,
+            provider=provider,
+            project_id=self._get_project_id(),
+            voice_ref=voice_ref,
+            emotion=emotion,
+            emotion_intensity=emotion_intensity,
+            speed=speed,
+            output_dir=output_dir,
+            priority=priority,
+            depends_on=depends_on
+        )
+        return {"success": True, "taskId": task_id}
\ No newline at end of file
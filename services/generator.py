@@ -5,6 +5,9 @@ Supports streaming responses from gen-readme.md API
 import json
 import base64
 import asyncio
+import functools
+import mmap
+import os
 import re
 import io
 from pathlib import Path
@@ -133,6 +136,19 @@ async def download_image_to_base64(url: str) -> str:
         raise
 
 
+@functools.lru_cache(maxsize=32)
+def _encode_reference_audio(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a reference audio file via mmap and return it base64 encoded
+    Cached per (path, mtime, size) so dialogues sharing a speaker hit disk once
+    """
+    with open(path, "rb") as f:
+        if size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return base64.b64encode(mm).decode("utf-8")
+
+
 class GenerationClient:
     """Client for AI generation APIs"""
 
@@ -423,18 +439,8 @@ class GenerationClient:
             intensity: Emotion intensity (e.g., "weak", "medium", "strong")
             reference_text: Optional text content of reference audio
         """
-        if not reference_audio:
-            raise ValueError("Reference audio is required for TTS generation")
-
         logger.info(f"Generating audio with speed: {speed}x, emotion: {emotion}, intensity: {intensity}")
-
-        # Read and encode reference audio
-        try:
-            with open(reference_audio, "rb") as f:
-                ref_audio_b64 = base64.b64encode(f.read()).decode("utf-8")
-        except Exception as e:
-            logger.error(f"Failed to read reference audio: {e}")
-            raise ValueError(f"Failed to read reference audio: {e}")
+        ref_audio_b64 = self._read_reference_audio_b64(reference_audio)
 
         # Check if using hosted mode (model starts with "hetang-")
         if self.model and self.model.startswith("hetang-"):
@@ -446,6 +452,93 @@ class GenerationClient:
                 text, ref_audio_b64, speed, emotion, intensity
             )
 
+    async def generate_audio_to_file(
+        self,
+        text: str,
+        output_path: Path,
+        reference_audio: Optional[str] = None,
+        speed: float = 1.0,
+        emotion: str = "",
+        intensity: str = "",
+        reference_text: str = "",
+    ) -> int:
+        """
+        Generate audio and write it straight to output_path
+        Legacy API responses are streamed to disk chunk by chunk, so the full
+        audio never has to be buffered in memory. Returns bytes written.
+
+        Args:
+            text: Text to convert to speech
+            output_path: Destination file path
+            reference_audio: Optional reference audio file path
+            speed: Speech speed multiplier (default 1.0)
+            emotion: Emotion type (e.g., "happy", "sad", "angry")
+            intensity: Emotion intensity (e.g., "weak", "medium", "strong")
+            reference_text: Optional text content of reference audio
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename on success, so a failed request
+        # never leaves a truncated audio file at output_path
+        part_path = output_path.with_name(output_path.name + ".part")
+
+        # Hosted mode returns base64 inside a JSON body, nothing to stream
+        if self.model and self.model.startswith("hetang-"):
+            audio_bytes = await self.generate_audio(
+                text=text,
+                reference_audio=reference_audio,
+                speed=speed,
+                emotion=emotion,
+                intensity=intensity,
+                reference_text=reference_text,
+            )
+            try:
+                await asyncio.to_thread(part_path.write_bytes, audio_bytes)
+                os.replace(part_path, output_path)
+            except Exception:
+                part_path.unlink(missing_ok=True)
+                raise
+            return len(audio_bytes)
+
+        logger.info(f"Generating audio with speed: {speed}x, emotion: {emotion}, intensity: {intensity}")
+        ref_audio_b64 = self._read_reference_audio_b64(reference_audio)
+        payload, headers = self._build_legacy_request(text, ref_audio_b64, emotion, intensity)
+
+        logger.info(f"Calling legacy TTS API (streaming): {self.api_url}")
+
+        try:
+            written = 0
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                async with client.stream("POST", self.api_url, headers=headers, json=payload) as response:
+                    response.raise_for_status()
+                    with open(part_path, "wb") as f:
+                        async for chunk in response.aiter_bytes(64 * 1024):
+                            # Keep disk writes off the event loop
+                            await asyncio.to_thread(f.write, chunk)
+                            written += len(chunk)
+            os.replace(part_path, output_path)
+
+            logger.info(f"Generated audio: {written} bytes -> {output_path}")
+            return written
+
+        except Exception as e:
+            part_path.unlink(missing_ok=True)
+            logger.error(f"Failed to generate audio (legacy): {e}")
+            raise
+
+    def _read_reference_audio_b64(self, reference_audio: Optional[str]) -> str:
+        """Read reference audio file and return it base64 encoded"""
+        if not reference_audio:
+            raise ValueError("Reference audio is required for TTS generation")
+
+        try:
+            path = os.path.abspath(reference_audio)
+            stat = os.stat(path)
+            return _encode_reference_audio(path, stat.st_mtime_ns, stat.st_size)
+        except Exception as e:
+            logger.error(f"Failed to read reference audio: {e}")
+            raise ValueError(f"Failed to read reference audio: {e}")
+
     async def _generate_audio_hosted(
         self,
         text: str,
@@ -509,25 +602,10 @@ class GenerationClient:
         intensity: str,
     ) -> bytes:
         """Generate audio using legacy custom API format"""
-        # Build emotion vector based on emotion and intensity
-        emo_vec = self._build_emotion_vector(emotion, intensity)
-
-        # Build request payload (legacy format)
-        payload = {
-            "text": text,
-            "spk_audio_base64": ref_audio_b64,
-            "emo_control_method": 2,  # Use emotion vector
-            "emo_weight": 1.0,
-            "emo_random": False,
-            "emo_vec": emo_vec,
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-        }
+        payload, headers = self._build_legacy_request(text, ref_audio_b64, emotion, intensity)
 
         logger.info(f"Calling legacy TTS API: {self.api_url}")
-        logger.info(f"Emotion vector: {emo_vec}")
+        logger.info(f"Emotion vector: {payload['emo_vec']}")
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
@@ -544,6 +622,32 @@ class GenerationClient:
             logger.error(f"Failed to generate audio (legacy): {e}")
             raise
 
+    def _build_legacy_request(
+        self,
+        text: str,
+        ref_audio_b64: str,
+        emotion: str,
+        intensity: str,
+    ) -> tuple:
+        """Build (payload, headers) for the legacy custom TTS API"""
+        # Build emotion vector based on emotion and intensity
+        emo_vec = self._build_emotion_vector(emotion, intensity)
+
+        # Build request payload (legacy format)
+        payload = {
+            "text": text,
+            "spk_audio_base64": ref_audio_b64,
+            "emo_control_method": 2,  # Use emotion vector
+            "emo_weight": 1.0,
+            "emo_random": False,
+            "emo_vec": emo_vec,
+        }
+
+        headers = {
+            "Content-Type": "application/json",
+        }
+        return payload, headers
+
     def _build_emotion_vector(self, emotion: str, intensity: str) -> list:
         """
         Build 8-dimensional emotion vector based on emotion type and intensity
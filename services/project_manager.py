@@ -3,6 +3,7 @@ Project directory manager
 Handles project directory structure and file organization
 """
 import json
+import os
 import shutil
 from pathlib import Path
 from typing import Optional
@@ -76,6 +77,36 @@ class ProjectManager:
         shot_dir = self.get_shot_dir(project_name)
         return shot_dir / f"shot_{shot_id}_{index}.mp4"
 
+    def list_shot_dir_names(self, project_name: str) -> set[str]:
+        """
+        Snapshot file names in the shot directory with a single readdir
+        Returns an empty set if the directory does not exist
+        """
+        try:
+            with os.scandir(self.get_shot_dir(project_name)) as it:
+                return {entry.name for entry in it}
+        except FileNotFoundError:
+            return set()
+
+    def list_shot_video_paths(
+        self, project_name: str, shot_id: str, present: Optional[set[str]] = None
+    ) -> list[Path]:
+        """
+        List existing shot video slot paths (1-4) in slot order
+        Args:
+            project_name: Project name
+            shot_id: Shot unique ID (6-char random string)
+            present: Optional snapshot from list_shot_dir_names, reused across shots
+                when scanning a whole project. Without it each slot is checked
+                with exists(), which is cheaper than a full readdir for one shot.
+        """
+        paths = []
+        for index in range(1, 5):
+            path = self.get_shot_video_path(project_name, shot_id, index)
+            if path.name in present if present is not None else path.exists():
+                paths.append(path)
+        return paths
+
     def get_shot_audio_path(self, project_name: str, shot_id: str) -> Path:
         """Get shot audio path"""
         shot_dir = self.get_shot_dir(project_name)
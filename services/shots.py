@@ -3,7 +3,7 @@ import argparse
 import shutil
 import os
 from pathlib import Path
-from typing import List, Type, TypeVar, Set, Dict, Any
+from typing import Callable, List, Type, TypeVar, Set, Dict, Any
 
 from pydantic import BaseModel, Field, ValidationError
 from loguru import logger
@@ -135,10 +135,12 @@ def run_step(
         messages: list,
         model_cls: Type[T],
         save_path: Path,
-        llm_config: Dict[str, Any] | None = None
+        llm_config: Dict[str, Any] | None = None,
+        on_record: Callable[[], None] | None = None
 ) -> List[T]:
     """
     通用生成步骤 (Role/Scene)
+    on_record: 每落盘一条记录后回调（用于推送进度计数）
     """
     logger.info(f"开始生成: {save_path.name}")
     save_path.parent.mkdir(parents=True, exist_ok=True)
@@ -167,6 +169,8 @@ def run_step(
                     f.write(obj.model_dump_json(ensure_ascii=False) + "\n")
                     f.flush()
                     collected_objects.append(obj)
+                    if on_record:
+                        on_record()
                     logger.info(f"已保存: {line[:40]}...")
                 except ValidationError:
                     pass
@@ -182,10 +186,12 @@ def run_shot_step_with_validation(
         valid_roles: Set[str],
         valid_scenes: Set[str],
         max_retries: int = 3,
-        llm_config: Dict[str, Any] | None = None
+        llm_config: Dict[str, Any] | None = None,
+        on_record: Callable[[], None] | None = None
 ) -> List[Shot]:
     """
     带校验的分镜生成步骤
+    on_record: 每落盘一条镜头后回调（用于推送进度计数）
     """
     save_path.parent.mkdir(parents=True, exist_ok=True)
     current_retries = 0
@@ -235,6 +241,8 @@ def run_shot_step_with_validation(
                             f.write(shot_obj.model_dump_json(ensure_ascii=False) + "\n")
                             f.flush()  # 强制落盘
                             collected_objects.append(shot_obj)
+                            if on_record:
+                                on_record()
                             logger.info(f"镜头 {shot_obj.shot} 通过")
 
                     except ValidationError:
@@ -296,7 +304,8 @@ def generate_roles(
         prompt_role: str,
         novel_text: str,
         output_dir: Path,
-        llm_config: Dict[str, Any] | None = None
+        llm_config: Dict[str, Any] | None = None,
+        on_record: Callable[[], None] | None = None
 ) -> List[Role]:
     """生成角色清单"""
     roles_path = output_dir / "roles.jsonl"
@@ -307,14 +316,15 @@ def generate_roles(
         {"role": "system", "content": prompt_role},
         {"role": "user", "content": novel_text}
     ]
-    return run_step(msgs_role, Role, roles_path, llm_config=llm_config)
+    return run_step(msgs_role, Role, roles_path, llm_config=llm_config, on_record=on_record)
 
 
 def generate_scenes(
         prompt_scene: str,
         novel_text: str,
         output_dir: Path,
-        llm_config: Dict[str, Any] | None = None
+        llm_config: Dict[str, Any] | None = None,
+        on_record: Callable[[], None] | None = None
 ) -> List[Scene]:
     """生成场景清单"""
     scenes_path = output_dir / "scenes.jsonl"
@@ -325,7 +335,7 @@ def generate_scenes(
         {"role": "system", "content": prompt_scene},
         {"role": "user", "content": novel_text}
     ]
-    return run_step(msgs_scene, Scene, scenes_path, llm_config=llm_config)
+    return run_step(msgs_scene, Scene, scenes_path, llm_config=llm_config, on_record=on_record)
 
 
 def generate_shots(
@@ -334,7 +344,8 @@ def generate_shots(
         roles: List[Role],
         scenes: List[Scene],
         output_dir: Path,
-        llm_config: Dict[str, Any] | None = None
+        llm_config: Dict[str, Any] | None = None,
+        on_record: Callable[[], None] | None = None
 ) -> None:
     """生成分镜清单"""
     if not roles or not scenes:
@@ -385,7 +396,8 @@ def generate_shots(
             valid_roles=valid_role_names,
             valid_scenes=valid_scene_names,
             max_retries=3,
-            llm_config=llm_config
+            llm_config=llm_config,
+            on_record=on_record
         )
 
         save_state(output_dir, i, msgs_shot)
@@ -1,8 +1,18 @@
+from functools import lru_cache
 from openai import OpenAI
 import os
 
 # 加载 .env 文件中的环境变量
 
+@lru_cache(maxsize=8)
+def _get_client(api_key: str | None, base_url: str | None) -> OpenAI:
+    """按 (api_key, base_url) 复用客户端，多次调用共享连接池，免去重复的 TCP/TLS 握手"""
+    client_kwargs = {"api_key": api_key}
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    return OpenAI(**client_kwargs)
+
+
 def call_llm_stream(
     data: str | list = None,
     model: str | None = None,
@@ -28,11 +38,7 @@ def call_llm_stream(
         base_url = base_url or os.getenv("OPENAI_BASE_URL")
         model = model or os.getenv("OPENAI_MODEL", "gemini-3-pro-preview")
 
-    client_kwargs = {"api_key": api_key}
-    if base_url:
-        client_kwargs["base_url"] = base_url
-
-    client = OpenAI(**client_kwargs)
+    client = _get_client(api_key, base_url)
 
     if data is None:
         raise ValueError("必须提供 data 参数")
@@ -68,10 +74,10 @@ def call_llm_stream(
             content = chunk.choices[0].delta.content
             buffer += content
 
-            # 按行分割并返回完整的行
-            while "\n" in buffer:
-                line, buffer = buffer.split("\n", 1)
-                yield line
+            # 按行分割并返回完整的行（一次切分，避免逐行 split 反复复制剩余内容）
+            if "\n" in buffer:
+                *lines, buffer = buffer.split("\n")
+                yield from lines
 
     # 返回缓冲区中剩余的内容（最后一行可能没有换行符）
     if buffer:
@@ -3,15 +3,19 @@
 """
 
 import asyncio
-import json
+import hashlib
+import os
+import shutil
 from pathlib import Path
-from typing import Optional, Tuple, Any, Callable
+from typing import Optional, Tuple, Any, Callable, Dict
 
 from loguru import logger
 
 from .base import BaseExecutor
 from services.generator import GenerationClient
 
+TTS_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 单个项目 _tts_cache 目录上限，超出后按最近使用时间淘汰
+
 
 class AudioExecutor(BaseExecutor):
     """音频生成执行器"""
@@ -29,7 +33,8 @@ class AudioExecutor(BaseExecutor):
         lock_timeout: int = 60,
         settings_file: str = None,
         config_key: str = 'tts',
-        current_project_id_getter: Callable[[], str] = None
+        current_project_id_getter: Callable[[], str] = None,
+        task_event_callback: Callable[[Dict[str, Any]], None] = None
     ):
         """
         初始化音频执行器
@@ -45,45 +50,13 @@ class AudioExecutor(BaseExecutor):
             settings_file: 设置文件路径，每次执行时动态读取配置
             config_key: 配置键名（如 'tts'）
             current_project_id_getter: 获取当前项目ID的回调函数
+            task_event_callback: 任务状态变化时的回调函数
         """
-        super().__init__(db_path, worker_id, heartbeat_interval, lock_timeout, current_project_id_getter)
-        self._settings_file = settings_file
-        self._config_key = config_key
-        # 保留旧参数作为后备
-        self._fallback_api_url = api_url
-        self._fallback_api_key = api_key
-        self._fallback_model = model
-    
-    def _load_config(self) -> tuple:
-        """动态加载最新配置，支持 hosted/custom 模式"""
-        if self._settings_file and Path(self._settings_file).exists():
-            try:
-                with open(self._settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                
-                # 检查是否是托管模式
-                if settings.get('apiMode') == 'hosted':
-                    hosted = settings.get('hostedService', {})
-                    api_url = hosted.get('baseUrl', '')
-                    api_key = hosted.get('token', '')
-                    model = f'hetang-{self._config_key}-v1'
-                    if api_key:
-                        logger.debug(f"Using hosted mode: api_url={api_url[:30]}...")
-                        return api_url, api_key, model
-                else:
-                    # 自定义模式
-                    config = settings.get('customApi', {}).get(self._config_key, {})
-                    api_url = config.get('apiUrl', '')
-                    api_key = config.get('apiKey', '')
-                    model = config.get('model', '')
-                    if api_url:
-                        logger.debug(f"Using custom mode: api_url={api_url[:30]}...")
-                        return api_url, api_key, model
-            except Exception as e:
-                logger.warning(f"Failed to load settings file: {e}")
-        
-        # 使用后备配置
-        return self._fallback_api_url, self._fallback_api_key, self._fallback_model
+        super().__init__(
+            db_path, worker_id, heartbeat_interval, lock_timeout,
+            current_project_id_getter, task_event_callback
+        )
+        self._init_api_config(settings_file, config_key, api_url, api_key, model)
     
     def _get_client(self) -> GenerationClient:
         """获取使用最新配置的客户端"""
@@ -92,6 +65,56 @@ class AudioExecutor(BaseExecutor):
             raise ValueError("Audio API URL not configured")
         return GenerationClient(api_url, api_key, model)
     
+    @staticmethod
+    def _get_cache_path(task: Any, model: str) -> Optional[Path]:
+        """
+        获取 TTS 结果缓存路径（项目 output/_tts_cache/<hash>.wav）
+        
+        相同的 (文本, 参考音频, 语速, 情感, 强度, 模型) 复用同一份生成结果；
+        参考音频的 mtime 参与 key，替换参考音频后不会命中旧结果
+        """
+        if not task.output_dir:
+            return None
+        voice_ref = task.voice_ref or ''
+        try:
+            voice_mtime = os.stat(voice_ref).st_mtime_ns if voice_ref else 0
+        except OSError:
+            voice_mtime = 0
+        key_src = "|".join([
+            task.text or '',
+            voice_ref,
+            str(voice_mtime),
+            str(task.speed or 1.0),
+            task.emotion or '',
+            task.emotion_intensity or '',
+            model or '',
+        ])
+        digest = hashlib.blake2b(key_src.encode('utf-8'), digest_size=16).hexdigest()
+        return Path(task.output_dir).parent / "_tts_cache" / f"{digest}.wav"
+    
+    @staticmethod
+    def _prune_cache(cache_dir: Path) -> None:
+        """缓存目录超过 TTS_CACHE_MAX_BYTES 时删除最久未使用（mtime 最早）的条目"""
+        entries = []
+        total = 0
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.wav') and entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                    total += st.st_size
+        if total <= TTS_CACHE_MAX_BYTES:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= TTS_CACHE_MAX_BYTES:
+                break
+    
     def execute(self, task: Any) -> Tuple[Optional[str], Optional[str]]:
         """
         执行音频生成任务
@@ -112,6 +135,19 @@ class AudioExecutor(BaseExecutor):
         # 每次执行时获取最新配置的客户端
         client = self._get_client()
         
+        # 命中 TTS 缓存则直接复用，跳过 API 调用（重新配音/手动重试的任务不读缓存）
+        cache_path = self._get_cache_path(task, client.model)
+        if cache_path is not None and not task.skip_cache and cache_path.exists():
+            output_dir = Path(task.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            local_path = output_dir / f"{task.id}.wav"
+            # 复制而不是硬链接：任务输出与缓存条目互相独立，之后原地修改其中一个不会影响另一个
+            shutil.copyfile(cache_path, local_path)
+            os.utime(cache_path)  # 刷新 mtime，作为淘汰时的最近使用时间
+            self._audio_duration_ms = self._estimate_duration(local_path.read_bytes())
+            logger.info(f"TTS cache hit for task {task.id}: {cache_path.name}")
+            return None, str(local_path)
+        
         # 调用生成 API
         audio_bytes = asyncio.run(
             client.generate_audio(
@@ -143,6 +179,16 @@ class AudioExecutor(BaseExecutor):
             result_local_path = str(local_path)
             logger.info(f"Saved audio to: {result_local_path}")
             
+            # 写入 TTS 缓存，供相同台词复用（重新生成的结果覆盖旧条目）
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix('.part')
+                tmp_path.write_bytes(audio_bytes)
+                os.replace(tmp_path, cache_path)
+                self._prune_cache(cache_path.parent)
+            except Exception as e:
+                logger.warning(f"Failed to write TTS cache: {e}")
+            
             # 计算音频时长（简单估算，或者用 pydub）
             self._audio_duration_ms = self._estimate_duration(audio_bytes)
         else:
@@ -4,6 +4,7 @@
 提供任务锁定、心跳、执行循环等基础功能
 """
 
+import json
 import os
 import socket
 import threading
@@ -11,7 +12,8 @@ import time
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Optional, Tuple, Any, Callable
+from pathlib import Path
+from typing import Optional, Tuple, Any, Callable, Dict
 
 from loguru import logger
 
@@ -26,13 +28,21 @@ class BaseExecutor(ABC):
     # 子类必须定义任务类型
     task_type: str = None
     
+    # API 配置（由子类通过 _init_api_config 设置）
+    _settings_file: str = None
+    _config_key: str = ''
+    _fallback_api_url: str = None
+    _fallback_api_key: str = None
+    _fallback_model: str = None
+    
     def __init__(
         self,
         db_path: str,
         worker_id: str = None,
         heartbeat_interval: int = 30,
         lock_timeout: int = 60,
-        current_project_id_getter: Callable[[], str] = None
+        current_project_id_getter: Callable[[], str] = None,
+        task_event_callback: Callable[[Dict[str, Any]], None] = None
     ):
         """
         初始化执行器
@@ -43,6 +53,7 @@ class BaseExecutor(ABC):
             heartbeat_interval: 心跳间隔（秒）
             lock_timeout: 锁超时时间（秒）
             current_project_id_getter: 获取当前项目ID的回调函数（用于优先执行当前项目任务）
+            task_event_callback: 任务状态变化时的回调函数（用于向前端推送任务事件）
         """
         if self.task_type is None:
             raise ValueError("Subclass must define task_type")
@@ -52,6 +63,7 @@ class BaseExecutor(ABC):
         self.heartbeat_interval = heartbeat_interval
         self.lock_timeout = lock_timeout
         self._current_project_id_getter = current_project_id_getter
+        self._task_event_callback = task_event_callback
         
         self._running = False
         self._current_task_id: Optional[str] = None
@@ -72,6 +84,68 @@ class BaseExecutor(ABC):
         """获取任务模型类"""
         return get_task_model(self.task_type)
     
+    # ========== 配置加载 ==========
+    
+    def _init_api_config(
+        self,
+        settings_file: str = None,
+        config_key: str = '',
+        api_url: str = None,
+        api_key: str = None,
+        model: str = None
+    ):
+        """
+        设置 API 配置来源
+        
+        Args:
+            settings_file: 设置文件路径，每次执行时动态读取配置
+            config_key: 本执行器在 customApi 中的配置键名（如 'tts'、'tti'、'ttv'）
+            api_url/api_key/model: 后备配置（设置文件不可用时使用）
+        """
+        self._settings_file = settings_file
+        self._config_key = config_key
+        # 保留旧参数作为后备
+        self._fallback_api_url = api_url
+        self._fallback_api_key = api_key
+        self._fallback_model = model
+    
+    def _load_config(self) -> tuple:
+        """动态加载最新配置，支持 hosted/custom 模式"""
+        if self._settings_file and Path(self._settings_file).exists():
+            try:
+                with open(self._settings_file, 'r', encoding='utf-8') as f:
+                    settings = json.load(f)
+                return self._load_config_from(settings)
+            except Exception as e:
+                logger.warning(f"Failed to load settings file: {e}")
+        
+        # 使用后备配置
+        return self._fallback_api_url, self._fallback_api_key, self._fallback_model
+    
+    def _load_config_from(self, settings: dict) -> tuple:
+        """从已解析的设置中取配置（调用方已读取设置文件时使用，避免重复读盘）"""
+        # 检查是否是托管模式
+        if settings.get('apiMode') == 'hosted':
+            hosted = settings.get('hostedService', {})
+            api_url = hosted.get('baseUrl', '')
+            api_key = hosted.get('token', '')
+            model = f'hetang-{self._config_key}-v1'
+            if api_key:
+                logger.debug(f"Using hosted mode: api_url={api_url[:30]}...")
+                return api_url, api_key, model
+        else:
+            # 自定义模式
+            config = settings.get('customApi', {}).get(self._config_key, {})
+            api_url = config.get('apiUrl', '')
+            api_key = config.get('apiKey', '')
+            model = config.get('model', '')
+            if api_url:
+                logger.debug(f"Using custom mode: api_url={api_url[:30]}...")
+                return api_url, api_key, model
+        
+        # 使用后备配置
+        return self._fallback_api_url, self._fallback_api_key, self._fallback_model
+    
     # ========== 任务锁定 ==========
     
     def claim_task(self, max_retries: int = 3) -> Optional[Any]:
@@ -187,6 +261,7 @@ class BaseExecutor(ABC):
                 # 锁定成功，重新获取最新数据
                 task = self._model.get_by_id(task.id)
                 logger.info(f"Claimed task: {self.task_type}:{task.id} (project: {task.project_id or 'none'})")
+                self._emit_task_event(task.id, TaskStatus.RUNNING.value, shot_id=task.shot_id)
                 return task
         
         return None
@@ -312,6 +387,7 @@ class BaseExecutor(ABC):
             ).execute()
             
             logger.info(f"Task succeeded: {self.task_type}:{task_id}")
+            self._emit_task_event(task_id, TaskStatus.SUCCESS.value, shot_id=task.shot_id)
         else:
             # 失败
             new_retry_count = task.retry_count + 1
@@ -331,6 +407,7 @@ class BaseExecutor(ABC):
                     f"Task failed, will retry ({new_retry_count}/{task.max_retries}): "
                     f"{self.task_type}:{task_id}, error={error}"
                 )
+                self._emit_task_event(task_id, TaskStatus.PENDING.value, shot_id=task.shot_id, error=error)
             else:
                 # 不可重试，标记为失败
                 self._model.update(
@@ -346,6 +423,21 @@ class BaseExecutor(ABC):
                 logger.error(
                     f"Task failed permanently: {self.task_type}:{task_id}, error={error}"
                 )
+                self._emit_task_event(task_id, TaskStatus.FAILED.value, shot_id=task.shot_id, error=error)
+
+    def _emit_task_event(self, task_id: str, status: str, **fields):
+        """通知任务状态变化（回调异常不影响任务执行）"""
+        if not self._task_event_callback:
+            return
+        try:
+            self._task_event_callback({
+                'type': self.task_type,
+                'id': task_id,
+                'status': status,
+                **fields,
+            })
+        except Exception as e:
+            logger.warning(f"Task event callback failed: {e}")
     
     # ========== 执行逻辑 ==========
     
@@ -3,10 +3,9 @@
 """
 
 import asyncio
-import json
 import uuid
 from pathlib import Path
-from typing import Optional, Tuple, Any, Callable
+from typing import Optional, Tuple, Any, Callable, Dict
 
 from loguru import logger
 
@@ -32,7 +31,8 @@ class ImageExecutor(BaseExecutor):
         lock_timeout: int = 60,
         settings_file: str = None,
         config_key: str = 'tti',
-        current_project_id_getter: Callable[[], str] = None
+        current_project_id_getter: Callable[[], str] = None,
+        task_event_callback: Callable[[Dict[str, Any]], None] = None
     ):
         """
         初始化图片执行器
@@ -48,45 +48,13 @@ class ImageExecutor(BaseExecutor):
             settings_file: 设置文件路径，每次执行时动态读取配置
             config_key: 配置键名（如 'tti'）
             current_project_id_getter: 获取当前项目ID的回调函数
+            task_event_callback: 任务状态变化时的回调函数
         """
-        super().__init__(db_path, worker_id, heartbeat_interval, lock_timeout, current_project_id_getter)
-        self._settings_file = settings_file
-        self._config_key = config_key
-        # 保留旧参数作为后备
-        self._fallback_api_url = api_url
-        self._fallback_api_key = api_key
-        self._fallback_model = model
-    
-    def _load_config(self) -> tuple:
-        """动态加载最新配置，支持 hosted/custom 模式"""
-        if self._settings_file and Path(self._settings_file).exists():
-            try:
-                with open(self._settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                
-                # 检查是否是托管模式
-                if settings.get('apiMode') == 'hosted':
-                    hosted = settings.get('hostedService', {})
-                    api_url = hosted.get('baseUrl', '')
-                    api_key = hosted.get('token', '')
-                    model = f'hetang-{self._config_key}-v1'
-                    if api_key:
-                        logger.debug(f"Using hosted mode: api_url={api_url[:30]}...")
-                        return api_url, api_key, model
-                else:
-                    # 自定义模式
-                    config = settings.get('customApi', {}).get(self._config_key, {})
-                    api_url = config.get('apiUrl', '')
-                    api_key = config.get('apiKey', '')
-                    model = config.get('model', '')
-                    if api_url:
-                        logger.debug(f"Using custom mode: api_url={api_url[:30]}...")
-                        return api_url, api_key, model
-            except Exception as e:
-                logger.warning(f"Failed to load settings file: {e}")
-        
-        # 使用后备配置
-        return self._fallback_api_url, self._fallback_api_key, self._fallback_model
+        super().__init__(
+            db_path, worker_id, heartbeat_interval, lock_timeout,
+            current_project_id_getter, task_event_callback
+        )
+        self._init_api_config(settings_file, config_key, api_url, api_key, model)
     
     def _get_client(self) -> GenerationClient:
         """获取使用最新配置的客户端"""
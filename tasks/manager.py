@@ -55,12 +55,25 @@ class TaskManager:
         
         # 创建表
         self._db.create_tables([ImageTask, VideoTask, AudioTask], safe=True)
+        self._add_missing_columns()
         
         # 恢复僵死的任务
         self._recover_stale_tasks()
         
         logger.info(f"TaskManager initialized with database: {self.db_path}")
     
+    def _add_missing_columns(self):
+        """为旧版本数据库补充后来新增的列（create_tables 不会修改已存在的表）"""
+        added_columns = [
+            (AudioTask, 'skip_cache', 'INTEGER NOT NULL DEFAULT 0'),
+        ]
+        for model, column, ddl in added_columns:
+            table = model._meta.table_name
+            existing = {c.name for c in self._db.get_columns(table)}
+            if column not in existing:
+                self._db.execute_sql(f'ALTER TABLE "{table}" ADD COLUMN "{column}" {ddl}')
+                logger.info(f"Added column {table}.{column}")
+    
     def _recover_stale_tasks(self):
         """
         恢复所有 running 状态的任务（程序启动时遗留的）
@@ -179,6 +192,22 @@ class TaskManager:
         logger.debug(f"Created image task: {task_id}, project_id={project_id}, subtype={subtype}, shot_id={shot_id}")
         return task_id
     
+    def create_image_tasks_batch(self, specs: List[Dict[str, Any]], project_id: str = '') -> List[str]:
+        """
+        批量创建图片生成任务（单个事务，任一失败则全部回滚）
+        
+        Args:
+            specs: 参数字典列表，字段同 create_image_task
+            project_id: 关联的项目ID (可选)
+        
+        Returns:
+            任务ID列表（与 specs 顺序一致）
+        """
+        with self._db.atomic():
+            task_ids = [self.create_image_task(project_id=project_id, **spec) for spec in specs]
+        logger.debug(f"Created {len(task_ids)} image tasks in batch, project_id={project_id}")
+        return task_ids
+    
     def create_video_task(
         self,
         subtype: str,
@@ -265,7 +294,8 @@ class TaskManager:
         depends_on: str = None,
         shot_id: str = None,
         shot_sequence: int = None,
-        dialogue_index: int = None
+        dialogue_index: int = None,
+        skip_cache: bool = False
     ) -> str:
         """
         创建音频生成任务
@@ -287,6 +317,7 @@ class TaskManager:
             shot_id: 关联的镜头ID (可选，用于回写)
             shot_sequence: 镜头序号 (可选，用于显示)
             dialogue_index: 对话索引 (可选，用于多段对话回写)
+            skip_cache: 不复用 TTS 缓存，强制重新生成（重新配音时使用）
         
         Returns:
             任务ID
@@ -313,6 +344,7 @@ class TaskManager:
             shot_id=shot_id,
             shot_sequence=shot_sequence,
             dialogue_index=dialogue_index,
+            skip_cache=int(skip_cache),
         )
         
         logger.debug(f"Created audio task: {task_id}, project_id={project_id}, shot_id={shot_id}, dialogue_index={dialogue_index}")
@@ -526,16 +558,20 @@ class TaskManager:
             是否成功
         """
         model = get_task_model(task_type)
+        update_data = {
+            'status': TaskStatus.PENDING.value,
+            'retry_count': 0,
+            'error': None,
+            'locked_by': None,  # 清除锁定信息，让执行器能认领
+            'locked_at': None,
+            'started_at': None,
+            'updated_at': datetime.now(),
+        }
+        if model is AudioTask:
+            # 手动重试说明上次结果不可用，不再复用 TTS 缓存
+            update_data['skip_cache'] = 1
         updated = (
-            model.update(
-                status=TaskStatus.PENDING.value,
-                retry_count=0,
-                error=None,
-                locked_by=None,  # 清除锁定信息，让执行器能认领
-                locked_at=None,
-                started_at=None,
-                updated_at=datetime.now()
-            )
+            model.update(**update_data)
             .where(
                 (model.id == task_id) &
                 (model.status.in_([TaskStatus.FAILED.value, TaskStatus.CANCELLED.value]))
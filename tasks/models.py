@@ -202,6 +202,7 @@ class AudioTask(BaseTask):
     shot_sequence = IntegerField(null=True)  # 镜头序号（用于显示）
     dialogue_index = IntegerField(null=True)  # 对话索引（镜头内多段对话）
     processed = IntegerField(default=0)  # 是否已处理回写 0/1
+    skip_cache = IntegerField(default=0)  # 1 = 不复用 TTS 缓存（重新配音/手动重试）
     
     class Meta:
         table_name = 'audio_task'
@@ -227,6 +228,7 @@ class AudioTask(BaseTask):
             'shot_sequence': self.shot_sequence,
             'dialogue_index': self.dialogue_index,
             'processed': self.processed,
+            'skip_cache': self.skip_cache,
         })
         return data
 
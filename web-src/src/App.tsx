@@ -39,7 +39,7 @@ import { UpdateModal } from './components/ui/UpdateModal';
 import { ExportProgressModal, type ExportProgress } from './components/ui/ExportProgressModal';
 import { TaskStatusBar, TaskPanel } from './components/tasks';
 import { useTaskPolling } from './hooks/useTaskPolling';
-import type { ProjectData, Shot, PageType, ImportedCharacter, Character, Scene } from './types';
+import type { ProjectData, Shot, PageType, ImportedCharacter, Character, Scene, ShotStatusBatchEntry } from './types';
 
 function App() {
   const { api, ready } = useApi();
@@ -114,14 +114,13 @@ function App() {
   // Task panel state
   const [taskPanelOpen, setTaskPanelOpen] = useState(false);
 
-  // Task polling - only enabled when a project is loaded
+  // Task status - pushed via window.onTaskEvent, only enabled when a project is loaded
   const {
     summary: taskSummary,
     refreshSummary: refreshTaskSummary,
   } = useTaskPolling({
     enabled: !!project,
     summaryInterval: 5000,
-    runningInterval: 2000,
   });
 
   // Toast notifications
@@ -255,32 +254,32 @@ function App() {
 
   // Register callbacks for backend to notify shot status changes and progress
   useEffect(() => {
+    // Backend coalesces status changes and progress ticks into one call per ~50ms
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    (window as any).onShotStatusChange = (shotId: string, status: string, shotData: Shot | null) => {
-      setProject((prev) => {
-        if (!prev) return prev;
-        return {
-          ...prev,
-          shots: prev.shots.map((s) => {
-            if (s.id === shotId) {
-              // If full shot data is provided, use it; otherwise just update status
-              if (shotData) {
-                return shotData;
-              }
-              return { ...s, status: status as Shot['status'] };
-            }
-            return s;
-          }),
-        };
-      });
-    };
+    (window as any).onShotsStatusBatch = (entries: ShotStatusBatchEntry[], progress: number) => {
+      if (entries.length > 0) {
+        setProject((prev) => {
+          if (!prev) return prev;
+          const byId = new Map<string, Shot>(prev.shots.map((s) => [s.id, s]));
+          for (const { shotId, status, shot } of entries) {
+            const current = byId.get(shotId);
+            if (!current) continue;
+            // If full shot data is provided, use it; otherwise just update status
+            byId.set(shotId, shot ?? { ...current, status: status as Shot['status'] });
+          }
+          return {
+            ...prev,
+            shots: prev.shots.map((s) => byId.get(s.id) ?? s),
+          };
+        });
+      }
 
-    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    (window as any).onProgressIncrement = () => {
-      setGenerationProgress((prev) => {
-        if (!prev) return prev;
-        return { ...prev, current: prev.current + 1 };
-      });
+      if (progress > 0) {
+        setGenerationProgress((prev) => {
+          if (!prev) return prev;
+          return { ...prev, current: prev.current + progress };
+        });
+      }
     };
 
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -326,9 +325,7 @@ function App() {
 
     return () => {
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
-      delete (window as any).onShotStatusChange;
-      // eslint-disable-next-line @typescript-eslint/no-explicit-any
-      delete (window as any).onProgressIncrement;
+      delete (window as any).onShotsStatusBatch;
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
       delete (window as any).onExportProgress;
       window.removeEventListener('characterUpdate', handleCharacterUpdate as EventListener);
@@ -1074,6 +1071,10 @@ function App() {
   const handleGenerateAudio = async (shotId: string) => {
     if (!api || !project) return;
 
+    // A shot that already has audio is being re-dubbed: ask for a fresh take instead of the TTS cache
+    const shot = project.shots.find((s) => s.id === shotId);
+    const regenerate = Boolean(shot?.audioUrl || shot?.dialogues?.some((d) => d.audioUrl));
+
     // Use task system - submit as batch with single shot
     setProject((prev) => {
       if (!prev) return prev;
@@ -1086,7 +1087,7 @@ function App() {
     });
 
     try {
-      const result = await api.generate_audios_batch([shotId]);
+      const result = await api.generate_audios_batch([shotId], regenerate);
       if (result.success) {
         refreshTaskSummary();
         showToast('success', '已提交配音生成任务');
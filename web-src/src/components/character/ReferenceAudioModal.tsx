@@ -199,6 +199,13 @@ export function ReferenceAudioModal({
     if (!window.pywebview?.api || !dir) return;
 
     setIsLoadingCustom(true);
+    // Render partial results pushed by the backend while large trees are scanned
+    setCustomAudios([]);
+    window.onReferenceAudiosPartial = (scannedDir: string, audios: ReferenceAudio[]) => {
+      if (scannedDir === dir) {
+        setCustomAudios((prev) => [...prev, ...audios]);
+      }
+    };
     try {
       const result = await window.pywebview.api.scan_reference_audios(dir);
       if (result.success && result.audios) {
@@ -207,6 +214,7 @@ export function ReferenceAudioModal({
     } catch (error) {
       console.error('Failed to load custom audios:', error);
     } finally {
+      delete window.onReferenceAudiosPartial;
       setIsLoadingCustom(false);
     }
   }, []);
@@ -57,7 +57,11 @@ export function ExportProgressModal({
     if (!progress) return 0;
     if (progress.stage === 'done') return 100;
     if (progress.stage === 'merging') return 90;
-    if (progress.stage === 'subtitles') return 95;
+    // Subtitle burn reports encoded time / total time (ms): 85-99%
+    if (progress.stage === 'subtitles') {
+      if (progress.total === 0) return 95;
+      return Math.min(99, 85 + Math.round((progress.current / progress.total) * 14));
+    }
     if (progress.total === 0) return 0;
     // Processing stage: 0-85%
     return Math.min(85, Math.round((progress.current / progress.total) * 85));
@@ -1,14 +1,20 @@
 /**
- * Task polling hook for efficient batch task status updates
+ * Task status hook: refreshes on backend task events (window.onTaskEvent),
+ * with a slow summary poll as fallback for executors running out of process.
+ * Events only fire on state changes, so while tasks are running their list is
+ * still refreshed on a slow interval to keep progress/elapsed time current.
  */
 
 import { useState, useEffect, useCallback, useRef } from 'react';
-import type { TaskSummary, Task } from '../types';
+import type { TaskSummary, Task, TaskEvent } from '../types';
+
+/** Coalesce bursts of task events into one refresh (ms) */
+const EVENT_REFRESH_DELAY = 300;
 
 interface UseTaskPollingOptions {
-  /** Polling interval for summary (ms), default 5000 */
+  /** Fallback polling interval for summary (ms), default 5000 */
   summaryInterval?: number;
-  /** Polling interval for running tasks (ms), default 1000 */
+  /** Refresh interval for running tasks while any are running (ms), default 3000 */
   runningInterval?: number;
   /** Whether polling is enabled */
   enabled?: boolean;
@@ -41,7 +47,7 @@ const DEFAULT_SUMMARY: TaskSummary = {
 export function useTaskPolling(options: UseTaskPollingOptions = {}): UseTaskPollingResult {
   const {
     summaryInterval = 5000,
-    runningInterval = 1000,
+    runningInterval = 3000,
     enabled = true,
   } = options;
 
@@ -51,7 +57,8 @@ export function useTaskPolling(options: UseTaskPollingOptions = {}): UseTaskPoll
   const [error, setError] = useState<string | null>(null);
 
   const summaryTimerRef = useRef<ReturnType<typeof setInterval> | null>(null);
-  const runningTimerRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const eventTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  const runningDirtyRef = useRef(false);
 
   // Fetch summary
   const fetchSummary = useCallback(async () => {
@@ -111,17 +118,13 @@ export function useTaskPolling(options: UseTaskPollingOptions = {}): UseTaskPoll
     await fetchRunningTasks();
   }, [fetchRunningTasks]);
 
-  // Start/stop polling
+  // Subscribe to task events and start fallback polling
   useEffect(() => {
     if (!enabled) {
       if (summaryTimerRef.current) {
         clearInterval(summaryTimerRef.current);
         summaryTimerRef.current = null;
       }
-      if (runningTimerRef.current) {
-        clearInterval(runningTimerRef.current);
-        runningTimerRef.current = null;
-      }
       return;
     }
 
@@ -129,19 +132,46 @@ export function useTaskPolling(options: UseTaskPollingOptions = {}): UseTaskPoll
     fetchSummary();
     fetchRunningTasks();
 
-    // Start polling
+    window.onTaskEvent = (event: TaskEvent) => {
+      // Finished/paused tasks leave the running list immediately
+      if (event.status !== 'running') {
+        setRunningTasks((prev) => prev.filter((t) => t.id !== event.id));
+      }
+      if (event.status === 'running') {
+        runningDirtyRef.current = true;
+      }
+      if (eventTimerRef.current) return;
+      eventTimerRef.current = setTimeout(() => {
+        eventTimerRef.current = null;
+        fetchSummary();
+        if (runningDirtyRef.current) {
+          runningDirtyRef.current = false;
+          fetchRunningTasks();
+        }
+      }, EVENT_REFRESH_DELAY);
+    };
+
     summaryTimerRef.current = setInterval(fetchSummary, summaryInterval);
-    runningTimerRef.current = setInterval(fetchRunningTasks, runningInterval);
 
     return () => {
+      delete window.onTaskEvent;
       if (summaryTimerRef.current) {
         clearInterval(summaryTimerRef.current);
       }
-      if (runningTimerRef.current) {
-        clearInterval(runningTimerRef.current);
+      if (eventTimerRef.current) {
+        clearTimeout(eventTimerRef.current);
+        eventTimerRef.current = null;
       }
     };
-  }, [enabled, summaryInterval, runningInterval, fetchSummary, fetchRunningTasks]);
+  }, [enabled, summaryInterval, fetchSummary, fetchRunningTasks]);
+
+  // Keep progress of running tasks fresh, only while there are any
+  const hasRunningTasks = runningTasks.length > 0 || (summary?.total.running ?? 0) > 0;
+  useEffect(() => {
+    if (!enabled || !hasRunningTasks) return;
+    const timer = setInterval(fetchRunningTasks, runningInterval);
+    return () => clearInterval(timer);
+  }, [enabled, hasRunningTasks, runningInterval, fetchRunningTasks]);
 
   return {
     summary: summary || DEFAULT_SUMMARY,
@@ -42,6 +42,14 @@ export function DubbingPage({ shots, characters: _characters }: DubbingPageProps
     }
 
     setIsLoadingAudios(true);
+    // Render partial results pushed by the backend while large trees are scanned
+    const scanDir = referenceDir;
+    setReferenceAudios([]);
+    window.onReferenceAudiosPartial = (scannedDir: string, audios: ReferenceAudio[]) => {
+      if (scannedDir === scanDir) {
+        setReferenceAudios((prev) => [...prev, ...audios]);
+      }
+    };
     try {
       console.log('Loading reference audios from:', referenceDir);
       // Call Python API to scan audio files
@@ -56,6 +64,7 @@ export function DubbingPage({ shots, characters: _characters }: DubbingPageProps
     } catch (error) {
       console.error('Failed to load reference audios:', error);
     } finally {
+      delete window.onReferenceAudiosPartial;
       setIsLoadingAudios(false);
     }
   };
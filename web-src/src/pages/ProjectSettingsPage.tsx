@@ -77,6 +77,7 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
   const [chatMessages, setChatMessages] = useState<ChatMessage[]>([]);
   const [chatInput, setChatInput] = useState('');
   const [isChatting, setIsChatting] = useState(false);
+  const [llmStreamText, setLlmStreamText] = useState('');
 
   // Refs
   const settingsRef = useRef(projectSettings);
@@ -160,6 +161,20 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
       } else if (type === 'cover_error') {
         setIsGeneratingCover(false);
         showToast('error', (data.error as string) || '生成封面失败');
+      } else if (type === 'cover_upload' && data.imageUrl) {
+        // Background copy of the uploaded cover finished; the backend already saved it
+        const coverImage = data.imageUrl as string;
+        setProjectSettings((prev) => ({
+          ...prev,
+          workInfo: { ...prev.workInfo, coverImage },
+        }));
+        showToast('success', '封面已上传');
+      } else if (type === 'cover_upload_error') {
+        showToast('error', (data.error as string) || '上传封面失败');
+      } else if (type === 'cover_export') {
+        showToast('success', '封面已导出');
+      } else if (type === 'cover_export_error') {
+        showToast('error', (data.error as string) || '导出封面失败');
       } else if (type === 'style' && data.styleConfig) {
         // Style preview completed - handled in StyleSelectorModal
       } else if (type === 'style_error') {
@@ -233,6 +248,13 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
     }
 
     setIsGeneratingWorkInfo(true);
+    // Show the model output as it streams in
+    setLlmStreamText('');
+    window.onLLMToken = (channel: string, text: string) => {
+      if (channel === 'workInfo') {
+        setLlmStreamText((prev) => (prev ? `${prev}\n${text}` : text));
+      }
+    };
     try {
       const result = await api.generate_work_info();
       if (result.success && result.workInfo) {
@@ -245,6 +267,8 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
       console.error('Failed to generate work info:', error);
       showToast('error', '生成作品信息失败');
     } finally {
+      delete window.onLLMToken;
+      setLlmStreamText('');
       setIsGeneratingWorkInfo(false);
     }
   };
@@ -257,9 +281,12 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
 
     try {
       const result = await api.upload_cover_image();
-      if (result.success && result.imageUrl) {
-        updateWorkInfo({ coverImage: result.imageUrl });
-        showToast('success', '封面已上传');
+      if (result.success) {
+        // Copy runs in the background; the backend saves the cover and pushes cover_upload to refresh the UI
+        if (result.imageUrl) {
+          updateWorkInfo({ coverImage: result.imageUrl });
+          showToast('success', '封面已上传');
+        }
       } else if (result.error && result.error !== 'No file selected') {
         showToast('error', result.error);
       }
@@ -302,7 +329,10 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
     try {
       const result = await api.export_cover_image();
       if (result.success) {
-        showToast('success', '封面已导出');
+        // Completion toast comes from the cover_export projectUpdate
+        if (!result.pending) {
+          showToast('success', '封面已导出');
+        }
       } else if (result.error && result.error !== 'No file selected') {
         showToast('error', result.error);
       }
@@ -319,6 +349,12 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
     setChatMessages((prev) => [...prev, userMessage]);
     setChatInput('');
     setIsChatting(true);
+    setLlmStreamText('');
+    window.onLLMToken = (channel: string, text: string) => {
+      if (channel === 'workInfoChat') {
+        setLlmStreamText((prev) => (prev ? `${prev}\n${text}` : text));
+      }
+    };
 
     try {
       const result = await api.chat_update_work_info(userMessage.content, chatMessages);
@@ -339,6 +375,8 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
       console.error('Failed to chat:', error);
       showToast('error', '对话失败');
     } finally {
+      delete window.onLLMToken;
+      setLlmStreamText('');
       setIsChatting(false);
     }
   };
@@ -407,6 +445,12 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
             </div>
           </div>
 
+          {isGeneratingWorkInfo && llmStreamText && (
+            <pre className="mb-4 p-3 max-h-32 overflow-y-auto bg-slate-900/60 rounded-lg text-xs text-slate-400 whitespace-pre-wrap break-all">
+              {llmStreamText}
+            </pre>
+          )}
+
           <div className="grid grid-cols-[180px_1fr] gap-6">
             {/* Cover Image */}
             <div>
@@ -640,6 +684,11 @@ export function ProjectSettingsPage({ projectName, showToast, onSettingsChange }
                   </div>
                 ))
               )}
+              {isChatting && llmStreamText && (
+                <div className="p-3 rounded-lg bg-slate-700/60 text-slate-400 mr-12">
+                  <p className="text-xs whitespace-pre-wrap break-all">{llmStreamText}</p>
+                </div>
+              )}
               <div ref={chatEndRef} />
             </div>
 
@@ -5,7 +5,7 @@ import { useEffect, useState, useRef } from 'react';
 import { Play, Loader2, X } from 'lucide-react';
 import { useApi } from '../hooks/useApi';
 import { JsonlTable } from '../components/shot/JsonlTable';
-import type { ShotBuilderPrompts, ShotBuilderOutputs } from '../types';
+import type { ShotBuilderPrompts, ShotBuilderOutputs, ShotBuilderStatus } from '../types';
 import type { ToastType } from '../components/ui/Toast';
 
 interface ShotBuilderPageProps {
@@ -42,8 +42,6 @@ export function ShotBuilderPage({ projectName, showToast }: ShotBuilderPageProps
   // 用于跟踪是否已初始化加载
   const hasLoadedRef = useRef(false);
   const loadingProjectRef = useRef<string | null>(null);
-  // 用于跟踪轮询是否应该停止
-  const pollingRef = useRef(false);
 
   const outputsRef = useRef(outputs);
   const novelRef = useRef(novelText);
@@ -115,73 +113,76 @@ export function ShotBuilderPage({ projectName, showToast }: ShotBuilderPageProps
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [ready, api, projectName]);
 
-  // 轮询任务状态和输出内容
+  // 任务状态由后端推送（window.onShotBuilderStatus）：写入记录时刷新输出内容，结束时提示结果
   useEffect(() => {
     if (!api || !projectName || !isRunning) {
-      pollingRef.current = false;
       return;
     }
 
-    pollingRef.current = true;
-    let timeoutId: ReturnType<typeof setTimeout>;
-
-    const poll = async () => {
-      if (!pollingRef.current) return;
+    let active = true;
+    let refreshTimer: ReturnType<typeof setTimeout> | null = null;
 
+    const refreshOutputs = async () => {
       try {
-        // 获取任务状态
-        const statusResult = await api.get_shot_builder_status();
-        if (!pollingRef.current) return;
-
-        // 获取输出内容
         const outputsResult = await api.get_shot_builder_outputs();
-        if (!pollingRef.current) return;
-
-        if (outputsResult.success && outputsResult.outputs) {
-          const nextOutputs = outputsResult.outputs;
-          setOutputs((prev) => ({
-            roles: dirtyOutputsRef.current.roles ? prev.roles : nextOutputs.roles || '',
-            scenes: dirtyOutputsRef.current.scenes ? prev.scenes : nextOutputs.scenes || '',
-            shots: dirtyOutputsRef.current.shots ? prev.shots : nextOutputs.shots || '',
-          }));
-          if (nextOutputs.outputDir) {
-            setOutputDir(nextOutputs.outputDir);
-          }
+        if (!outputsResult.success || !outputsResult.outputs) return;
+        const nextOutputs = outputsResult.outputs;
+        setOutputs((prev) => ({
+          roles: dirtyOutputsRef.current.roles ? prev.roles : nextOutputs.roles || '',
+          scenes: dirtyOutputsRef.current.scenes ? prev.scenes : nextOutputs.scenes || '',
+          shots: dirtyOutputsRef.current.shots ? prev.shots : nextOutputs.shots || '',
+        }));
+        if (nextOutputs.outputDir) {
+          setOutputDir(nextOutputs.outputDir);
         }
+      } catch (error) {
+        console.error('Failed to refresh shot builder outputs:', error);
+      }
+    };
 
-        if (statusResult.success) {
-          // 检查任务是否完成
-          if (!statusResult.running) {
-            pollingRef.current = false;
-            setIsRunning(null);
-            if (statusResult.error) {
-              showToast('error', statusResult.error);
-            } else {
-              const stepName = isRunning === 'role' ? '角色' : isRunning === 'scene' ? '场景' : '分镜';
-              showToast('success', `已完成${stepName}生成`);
-            }
-            return;
-          }
-        }
+    const handleStatus = (status: ShotBuilderStatus) => {
+      if (!active || !status.success || status.step !== isRunning) return;
 
-        // 继续轮询
-        if (pollingRef.current) {
-          timeoutId = setTimeout(poll, 1500);
-        }
-      } catch (error) {
-        console.error('Polling error:', error);
-        if (pollingRef.current) {
-          timeoutId = setTimeout(poll, 2000);
+      if (status.running) {
+        // 连续写入的记录合并为一次刷新
+        if (!refreshTimer) {
+          refreshTimer = setTimeout(() => {
+            refreshTimer = null;
+            if (active) refreshOutputs();
+          }, 500);
         }
+        return;
+      }
+
+      active = false;
+      if (refreshTimer) {
+        clearTimeout(refreshTimer);
+        refreshTimer = null;
+      }
+      refreshOutputs();
+      setIsRunning(null);
+      if (status.error) {
+        showToast('error', status.error);
+      } else {
+        const stepName = isRunning === 'role' ? '角色' : isRunning === 'scene' ? '场景' : '分镜';
+        showToast('success', `已完成${stepName}生成`);
       }
     };
 
-    // 立即开始轮询
-    poll();
+    window.onShotBuilderStatus = handleStatus;
+    // 任务可能在注册监听前就已结束，先取一次当前状态
+    api.get_shot_builder_status()
+      .then(handleStatus)
+      .catch((error) => console.error('Failed to get shot builder status:', error));
 
     return () => {
-      pollingRef.current = false;
-      clearTimeout(timeoutId);
+      active = false;
+      if (refreshTimer) {
+        clearTimeout(refreshTimer);
+      }
+      if (window.onShotBuilderStatus === handleStatus) {
+        delete window.onShotBuilderStatus;
+      }
     };
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [api, projectName, isRunning]);
@@ -80,6 +80,15 @@ export interface AudioTask extends TaskBase {
 
 export type Task = ImageTask | VideoTask | AudioTask;
 
+/** Task state change pushed by the backend via window.onTaskEvent */
+export interface TaskEvent {
+  type: TaskType;
+  id: string;
+  status: TaskStatus;
+  shot_id?: string | null;
+  error?: string | null;
+}
+
 export interface TaskSummary {
   image: Record<TaskStatus, number>;
   video: Record<TaskStatus, number>;
@@ -173,6 +182,12 @@ export interface Shot {
   errorMessage?: string;
 }
 
+export interface ShotStatusBatchEntry {
+  shotId: string;
+  status: string;
+  shot: Shot | null;  // 完整镜头数据（可选）
+}
+
 // ========== Character Types ==========
 
 export type CharacterStatus = 'pending' | 'generating' | 'ready' | 'error';
@@ -397,7 +412,7 @@ export interface PyWebViewApi {
   generate_video_for_shot: (shotId: string) => Promise<GenerateResult>;
   generate_videos_batch: (shotIds: string[]) => Promise<BatchGenerateResult>;
   generate_audio_for_shot: (shotId: string) => Promise<GenerateResult>;
-  generate_audios_batch: (shotIds: string[]) => Promise<BatchGenerateResult>;
+  generate_audios_batch: (shotIds: string[], regenerate?: boolean) => Promise<BatchGenerateResult>;
 
   // Utilities
   open_output_dir: () => Promise<ApiResponse>;
@@ -449,9 +464,9 @@ export interface PyWebViewApi {
   save_project_settings: (settings: ProjectSettings) => Promise<ApiResponse>;
   generate_work_info: () => Promise<ApiResponse & { workInfo?: WorkInfo }>;
   chat_update_work_info: (message: string, history: ChatMessage[]) => Promise<ApiResponse & { reply?: string; workInfo?: WorkInfo }>;
-  upload_cover_image: () => Promise<ApiResponse & { imageUrl?: string }>;
+  upload_cover_image: () => Promise<ApiResponse & { imageUrl?: string; pending?: boolean; operationId?: string }>;
   generate_cover_image: () => Promise<ApiResponse & { task_id?: string }>;
-  export_cover_image: () => Promise<ApiResponse & { path?: string }>;
+  export_cover_image: () => Promise<ApiResponse & { path?: string; pending?: boolean; operationId?: string }>;
   generate_style_preview: (prompt: string) => Promise<ApiResponse & { task_id?: string }>;
 
   // Update
@@ -694,6 +709,14 @@ declare global {
     pywebview?: {
       api: PyWebViewApi;
     };
+    // 后端扫描参考音频目录时分批推送的部分结果
+    onReferenceAudiosPartial?: (directory: string, audios: ReferenceAudio[]) => void;
+    // 后端调用大模型时逐行推送的流式输出（channel 区分调用来源）
+    onLLMToken?: (channel: string, text: string) => void;
+    // 后端任务状态变化时推送的事件（领取、成功、失败、重试、暂停/恢复/取消）
+    onTaskEvent?: (event: TaskEvent) => void;
+    // 分镜生成写入记录及结束时推送的任务状态
+    onShotBuilderStatus?: (status: ShotBuilderStatus) => void;
   }
 }
 